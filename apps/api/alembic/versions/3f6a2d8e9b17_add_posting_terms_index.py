@@ -0,0 +1,39 @@
+"""add posting terms inverted index
+
+Revision ID: 3f6a2d8e9b17
+Revises: e7b3f9a1c604
+Create Date: 2026-10-18 13:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3f6a2d8e9b17"
+down_revision = "e7b3f9a1c604"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "posting_terms",
+        sa.Column("job_posting_id", sa.UUID(), nullable=False),
+        sa.Column("field", sa.String(length=8), nullable=False),
+        sa.Column("term", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["job_posting_id"], ["job_postings.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_posting_id", "field", "term"),
+    )
+    op.create_index(
+        "ix_posting_terms_field_term",
+        "posting_terms",
+        ["field", "term", "job_posting_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posting_terms_field_term", table_name="posting_terms")
+    op.drop_table("posting_terms")
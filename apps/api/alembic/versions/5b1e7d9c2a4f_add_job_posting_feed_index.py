@@ -0,0 +1,29 @@
+"""add job posting feed index
+
+Revision ID: 5b1e7d9c2a4f
+Revises: 28c3770a1299
+Create Date: 2026-10-18 09:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5b1e7d9c2a4f"
+down_revision = "28c3770a1299"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_job_postings_created_at_id",
+        "job_postings",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_postings_created_at_id", table_name="job_postings")
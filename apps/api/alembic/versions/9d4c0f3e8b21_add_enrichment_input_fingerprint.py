@@ -0,0 +1,24 @@
+"""add enrichment input fingerprint
+
+Revision ID: 9d4c0f3e8b21
+Revises: 5b1e7d9c2a4f
+Create Date: 2026-10-18 10:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "9d4c0f3e8b21"
+down_revision = "5b1e7d9c2a4f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("posting_enrichments", sa.Column("input_fingerprint", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("posting_enrichments", "input_fingerprint")
@@ -0,0 +1,24 @@
+"""add job posting content fingerprint
+
+Revision ID: a41c7e5d2f93
+Revises: 3f6a2d8e9b17
+Create Date: 2026-10-18 14:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a41c7e5d2f93"
+down_revision = "3f6a2d8e9b17"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("job_postings", sa.Column("content_fingerprint", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("job_postings", "content_fingerprint")
@@ -0,0 +1,27 @@
+"""add search pref next run at
+
+Revision ID: b8e2d47c1a56
+Revises: a41c7e5d2f93
+Create Date: 2026-10-18 15:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b8e2d47c1a56"
+down_revision = "a41c7e5d2f93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows start empty; the scheduler fills them in on its next tick.
+    op.add_column("search_prefs", sa.Column("next_run_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_search_prefs_next_run_at", "search_prefs", ["next_run_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_search_prefs_next_run_at", table_name="search_prefs")
+    op.drop_column("search_prefs", "next_run_at")
@@ -0,0 +1,29 @@
+"""add enrichment fit index
+
+Revision ID: c2a8e61f7d05
+Revises: 9d4c0f3e8b21
+Create Date: 2026-10-18 11:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c2a8e61f7d05"
+down_revision = "9d4c0f3e8b21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_posting_enrichments_user_fit",
+        "posting_enrichments",
+        ["user_id", sa.text("fit_score DESC"), sa.text("job_posting_id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posting_enrichments_user_fit", table_name="posting_enrichments")
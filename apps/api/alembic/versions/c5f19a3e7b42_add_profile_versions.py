@@ -0,0 +1,31 @@
+"""add profile versions
+
+Revision ID: c5f19a3e7b42
+Revises: b8e2d47c1a56
+Create Date: 2026-10-18 17:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c5f19a3e7b42"
+down_revision = "b8e2d47c1a56"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "profiles", sa.Column("version", sa.Integer(), nullable=False, server_default="1")
+    )
+    # Existing enrichments have no recorded version; the feed falls back to
+    # their input fingerprint until they are next rescored.
+    op.add_column("posting_enrichments", sa.Column("profile_version", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("posting_enrichments", "profile_version")
+    op.drop_column("profiles", "version")
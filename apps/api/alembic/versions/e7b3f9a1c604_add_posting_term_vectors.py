@@ -0,0 +1,35 @@
+"""add posting term vectors
+
+Revision ID: e7b3f9a1c604
+Revises: c2a8e61f7d05
+Create Date: 2026-10-18 12:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e7b3f9a1c604"
+down_revision = "c2a8e61f7d05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "posting_term_vectors",
+        sa.Column("job_posting_id", sa.UUID(), nullable=False),
+        sa.Column("terms", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("counts", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("norm", sa.Float(), nullable=False),
+        sa.Column("source_hash", sa.String(length=64), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["job_posting_id"], ["job_postings.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_posting_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("posting_term_vectors")
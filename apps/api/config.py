@@ -11,6 +11,32 @@ class Settings(BaseSettings):
     s3_bucket: str = "vanta"
     s3_access_key: str | None = None
     s3_secret_key: str | None = None
+    profile_vector_cache_size: int = 1024
+    profile_vector_cache_redis: bool = False
+    profile_vector_cache_ttl_seconds: int = 86400
+    provider_response_cache_size: int = 4096
+    provider_response_cache_redis: bool = False
+    provider_response_cache_ttl_seconds: int = 604800
+    provider_rate_limit_per_second: float = 10.0
+    provider_rate_limit_burst: float = 20.0
+    provider_rate_limit_redis: bool = False
+    provider_max_retry_after_seconds: float = 60.0
+    provider_circuit_failure_threshold: int = 5
+    provider_circuit_reset_seconds: float = 300.0
+    task_guard_redis: bool = True
+    task_lock_ttl_seconds: int = 900
+    task_idempotency_ttl_seconds: int = 86400
+    score_chunk_size: int = 200
+    candidate_limit: int = 200
+    rescore_grace_seconds: int = 600
+    active_posting_days: int = 30
+    celery_ingest_queue: str = "ingest"
+    celery_scoring_queue: str = "scoring"
+    celery_digest_queue: str = "digest"
+    query_counter_enabled: bool = False
+    query_budget: int | None = None
+    query_budget_strict: bool = False
+    query_repeat_threshold: int = 5
 
 
 settings = Settings()
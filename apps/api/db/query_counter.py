@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_STARTED_KEY = "query_counter_started"
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while a ``track()`` block was active, and their total time."""
+
+    statements: int = 0
+    seconds: float = 0.0
+    by_statement: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        self.by_statement[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run at least ``threshold`` times, most frequent first.
+
+        The same SQL text with different parameters is what a lazy load inside
+        a loop looks like, so these are the likely N+1 queries.
+        """
+
+        return [
+            (sql, count) for sql, count in self.by_statement.most_common() if count >= threshold
+        ]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    started = conn.info.get(_STARTED_KEY)
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+def install(engine: Engine) -> None:
+    """Register the counting listeners on ``engine``; safe to call more than once."""
+
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track() -> Iterator[QueryStats]:
+    """Count statements executed in this context until the block exits.
+
+    The stats object is shared with contexts copied from this one, so work
+    handed to the threadpool (sync FastAPI endpoints and dependencies) is
+    counted as well. Statements only reach it on engines passed to ``install``.
+    """
+
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
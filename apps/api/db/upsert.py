@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(session: Session, model: type | Table):
+    """An ``INSERT`` construct for the session's dialect, exposing ``on_conflict_*``."""
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"Bulk upsert is not supported on {dialect}")  # pragma: no cover
@@ -5,6 +5,10 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from apps.api.config import settings
+from apps.api.db import query_counter
+from apps.api.db.session import engine
+from apps.api.middleware import QueryCounterMiddleware
 from apps.api.routers import (
     applications,
     auth,
@@ -34,6 +38,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.query_counter_enabled:
+    query_counter.install(engine)
+    app.add_middleware(
+        QueryCounterMiddleware,
+        budget=settings.query_budget,
+        strict=settings.query_budget_strict,
+        repeat_threshold=settings.query_repeat_threshold,
+    )
+
 app.include_router(system.router)
 app.include_router(auth.router)
 app.include_router(feed.router)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from apps.api.db import query_counter
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+QUERY_TIME_HEADER = "X-Query-Time-Ms"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more SQL statements than the configured budget allows."""
+
+
+class QueryCounterMiddleware:
+    """Count the SQL statements each request runs and report them.
+
+    The count and total database time are sent as ``X-Query-Count`` and
+    ``X-Query-Time-Ms`` headers and logged with the method and path. The same
+    statement repeated ``repeat_threshold`` times or more is logged as a
+    likely N+1 lazy load. A request over ``budget`` is logged as a warning,
+    or, when ``strict`` (as in the test suite), fails with
+    ``QueryBudgetExceeded`` before the response is sent.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        budget: int | None = None,
+        strict: bool = False,
+        repeat_threshold: int = 5,
+    ) -> None:
+        self.app = app
+        self.budget = budget
+        self.strict = strict
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with query_counter.track() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    self._check_budget(scope, stats)
+                    headers = MutableHeaders(scope=message)
+                    headers.append(QUERY_COUNT_HEADER, str(stats.statements))
+                    headers.append(QUERY_TIME_HEADER, f"{stats.seconds * 1000:.1f}")
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+        self._report(scope, stats)
+
+    def _check_budget(self, scope: Scope, stats: query_counter.QueryStats) -> None:
+        if self.budget is None or stats.statements <= self.budget:
+            return
+        if self.strict:
+            raise QueryBudgetExceeded(
+                f"{scope['method']} {scope['path']} ran {stats.statements} queries; "
+                f"the budget is {self.budget}"
+            )
+        logger.warning(
+            "Query budget exceeded",
+            method=scope["method"],
+            path=scope["path"],
+            queries=stats.statements,
+            budget=self.budget,
+        )
+
+    def _report(self, scope: Scope, stats: query_counter.QueryStats) -> None:
+        logger.debug(
+            "Request queries",
+            method=scope["method"],
+            path=scope["path"],
+            queries=stats.statements,
+            db_ms=round(stats.seconds * 1000, 1),
+        )
+        for statement, count in stats.repeated(self.repeat_threshold):
+            logger.warning(
+                "Possible N+1 query",
+                method=scope["method"],
+                path=scope["path"],
+                count=count,
+                statement=statement[:200],
+            )
@@ -12,6 +12,8 @@ from apps.api.models.model_run import ModelRun
 from apps.api.models.notification import Notification
 from apps.api.models.outreach import Outreach
 from apps.api.models.posting_enrichment import PostingEnrichment
+from apps.api.models.posting_term import PostingTerm
+from apps.api.models.posting_term_vector import PostingTermVector
 from apps.api.models.profile import Profile
 from apps.api.models.resume_version import ResumeVersion
 from apps.api.models.search_pref import SearchPref
@@ -33,6 +35,8 @@ __all__ = [
     "Notification",
     "Outreach",
     "PostingEnrichment",
+    "PostingTerm",
+    "PostingTermVector",
     "Profile",
     "ResumeVersion",
     "SearchPref",
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from apps.api.models.application import Application
     from apps.api.models.company import Company
     from apps.api.models.posting_enrichment import PostingEnrichment
+    from apps.api.models.posting_term_vector import PostingTermVector
     from apps.api.models.resume_version import ResumeVersion
 
 
@@ -42,6 +43,7 @@ class JobPosting(Base):
     salary_max_cents: Mapped[int | None] = mapped_column(Integer, nullable=True)
     currency: Mapped[str] = mapped_column(String(3), nullable=False, default="USD")
     normalized_tags: Mapped[list[str] | None] = mapped_column(ArrayType(String), nullable=True)
+    content_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     posted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     scraped_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -55,3 +57,10 @@ class JobPosting(Base):
     applications: Mapped[list["Application"]] = relationship(back_populates="job_posting")
     posting_enrichments: Mapped[list["PostingEnrichment"]] = relationship(back_populates="job_posting")
     resume_versions: Mapped[list["ResumeVersion"]] = relationship(back_populates="job_posting")
+    term_vector: Mapped["PostingTermVector | None"] = relationship(
+        back_populates="job_posting", passive_deletes=True
+    )
+
+
+# Backs keyset pagination of the job feed, which orders by (created_at DESC, id DESC).
+Index("ix_job_postings_created_at_id", JobPosting.created_at.desc(), JobPosting.id.desc())
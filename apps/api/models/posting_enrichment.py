@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -33,9 +33,20 @@ class PostingEnrichment(Base):
     fit_factors: Mapped[dict] = mapped_column(JSONType, nullable=False, default=dict)
     salary_estimate_cents: Mapped[int | None] = mapped_column(Integer, nullable=True)
     rationale: Mapped[str | None] = mapped_column(String, nullable=True)
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    profile_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
     user: Mapped["User"] = relationship(back_populates="posting_enrichments")
     job_posting: Mapped["JobPosting"] = relationship(back_populates="posting_enrichments")
+
+
+# Serves the feed's sort=fit mode: per-user ranking by (fit_score DESC, job_posting_id DESC).
+Index(
+    "ix_posting_enrichments_user_fit",
+    PostingEnrichment.user_id,
+    PostingEnrichment.fit_score.desc(),
+    PostingEnrichment.job_posting_id.desc(),
+)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from apps.api.db.base import Base
+from apps.api.db.types import GuidType
+
+
+class PostingTerm(Base):
+    """Inverted index entry: one (field, term) occurring in a posting.
+
+    ``field`` is ``"text"`` for terms from the posting's matching text and
+    ``"skill"`` for its normalized tags, so skill overlap can be ranked
+    separately from free-text overlap.
+    """
+
+    __tablename__ = "posting_terms"
+    __table_args__ = (Index("ix_posting_terms_field_term", "field", "term", "job_posting_id"),)
+
+    job_posting_id: Mapped[uuid.UUID] = mapped_column(
+        GuidType(as_uuid=True), ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True
+    )
+    field: Mapped[str] = mapped_column(String(8), primary_key=True)
+    term: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from apps.api.db.base import Base
+from apps.api.db.types import ArrayType, GuidType
+
+if TYPE_CHECKING:
+    from apps.api.models.job_posting import JobPosting
+
+
+class PostingTermVector(Base):
+    """Bag-of-words vector of a posting's matching text, computed once at ingestion.
+
+    ``terms`` and ``counts`` are parallel arrays; ``source_hash`` identifies the
+    posting fields the vector was built from so a stale vector can be detected.
+    """
+
+    __tablename__ = "posting_term_vectors"
+
+    job_posting_id: Mapped[uuid.UUID] = mapped_column(
+        GuidType(as_uuid=True), ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True
+    )
+    terms: Mapped[list[str]] = mapped_column(ArrayType(String), nullable=False)
+    counts: Mapped[list[int]] = mapped_column(ArrayType(Integer), nullable=False)
+    norm: Mapped[float] = mapped_column(Float, nullable=False)
+    source_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+    job_posting: Mapped["JobPosting"] = relationship(back_populates="term_vector")
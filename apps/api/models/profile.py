@@ -32,6 +32,9 @@ class Profile(Base):
     salary_max_cents: Mapped[int | None] = mapped_column(Integer, nullable=True)
     remote_only: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     job_preferences: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+    # Bumped whenever a field that feeds matching changes; enrichments record the
+    # version they were scored against.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
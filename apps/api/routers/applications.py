@@ -6,7 +6,7 @@ from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from apps.api.deps.auth import get_current_user
 from apps.api.db.session import get_session
@@ -54,7 +54,16 @@ def list_applications(
     session: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ) -> list[ApplicationResponse]:
-    stmt = select(Application).where(Application.user_id == user.id).order_by(Application.created_at.desc())
+    stmt = (
+        select(Application)
+        .where(Application.user_id == user.id)
+        .order_by(Application.created_at.desc())
+        .options(
+            selectinload(Application.tasks),
+            selectinload(Application.notes),
+            selectinload(Application.job_posting).selectinload(JobPosting.company),
+        )
+    )
     applications = session.scalars(stmt).all()
     return [_serialize_application(app) for app in applications]
 
@@ -10,42 +10,37 @@ from sqlalchemy.orm import Session
 from apps.api.deps.auth import get_current_user
 from apps.api.db.session import get_session
 from apps.api.models import HiddenPosting, JobPosting, User
-from apps.api.services import matching
+from apps.api.services import feed_query, matching
 
 router = APIRouter(prefix="/feed", tags=["feed"])
 
 
-def _hidden_ids(session: Session, user_id: uuid.UUID) -> set[uuid.UUID]:
-    stmt = select(HiddenPosting.job_posting_id).where(HiddenPosting.user_id == user_id)
-    return {row[0] for row in session.execute(stmt)}
-
-
 @router.get("/jobs")
 def job_feed(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     location: str | None = Query(None),
     remote_only: bool | None = Query(None),
+    sort: feed_query.FeedSort = Query(feed_query.FeedSort.RECENT),
+    min_fit: int | None = Query(None, ge=0, le=100),
+    cursor: str | None = Query(None),
     session: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ) -> dict[str, object]:
-    stmt = select(JobPosting).order_by(JobPosting.created_at.desc())
-    if location:
-        stmt = stmt.where(JobPosting.location.ilike(f"%{location}%"))
-    if remote_only:
-        stmt = stmt.where(JobPosting.remote_flag.is_(True))
-
-    postings = session.scalars(stmt).all()
-    hidden = _hidden_ids(session, user.id)
-    visible = [posting for posting in postings if posting.id not in hidden]
+    filters = feed_query.FeedFilters(location=location, remote_only=remote_only, min_fit=min_fit)
+    try:
+        result = feed_query.fetch_page(
+            session, user.id, filters, page=page, limit=limit, sort=sort, cursor=cursor
+        )
+    except feed_query.InvalidCursorError as exc:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(exc)) from exc
 
-    start = (page - 1) * limit
-    end = start + limit
-    items = visible[start:end]
+    enrichments, written = matching.ensure_enrichments(session, user.id, result.postings)
+    profile = user.profile
 
     serialized = []
-    for posting in items:
-        enrichment = matching.update_posting_enrichment(session, str(user.id), posting)
+    for posting in result.postings:
+        enrichment = enrichments.get(posting.id)
         serialized.append(
             {
                 "id": str(posting.id),
@@ -57,15 +52,20 @@ def job_feed(
                 "tags": posting.normalized_tags or [],
                 "fit_score": enrichment.fit_score if enrichment else None,
                 "fit_factors": enrichment.fit_factors if enrichment else {},
-                "why_fit": enrichment.rationale,
+                "why_fit": enrichment.rationale if enrichment else None,
+                # The score predates the latest profile edit; a background rescore is pending.
+                "fit_stale": matching.awaiting_rescore(enrichment, profile) if enrichment else False,
             }
         )
+    if written:
+        session.commit()
 
     return {
         "items": serialized,
         "page": page,
         "limit": limit,
-        "total": len(visible),
+        "total": result.total,
+        "next_cursor": result.next_cursor,
     }
 
 
@@ -49,7 +49,7 @@ async def submit_profile(
             resume=metadata,
         )
     except ValidationError as exc:  # pragma: no cover - handled in tests
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=exc.errors()) from exc
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=exc.errors(include_context=False)) from exc
 
     response, _, _ = process_onboarding(session, payload, resume)
     return response
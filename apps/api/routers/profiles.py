@@ -7,6 +7,8 @@ from apps.api.deps.auth import get_current_user
 from apps.api.db.session import get_session
 from apps.api.models import Profile, User
 from apps.api.schemas.profile import ProfileResponse, ProfileUpdateRequest
+from apps.api.services import matching, profile_cache
+from apps.workers.tasks import rescore
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
@@ -48,6 +50,7 @@ def update_my_profile(
     user: User = Depends(get_current_user),
 ) -> ProfileResponse:
     profile = _ensure_profile(session, user)
+    previous_hash = profile_cache.profile_content_hash(profile)
 
     if payload.headline is not None:
         profile.headline = payload.headline
@@ -68,8 +71,11 @@ def update_my_profile(
     if payload.remote_only is not None:
         profile.remote_only = payload.remote_only
 
-    session.flush()
+    changed = matching.record_profile_change(profile, previous_hash)
+    session.commit()
     session.refresh(profile)
+    if changed:
+        rescore.enqueue_profile_rescore(profile)
 
     return ProfileResponse(
         id=str(profile.id),
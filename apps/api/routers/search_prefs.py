@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from apps.api.deps.auth import get_current_user
 from apps.api.db.session import get_session
 from apps.api.models import SearchPref, User
+from apps.api.services import schedule
 from apps.api.schemas.search_pref import (
     SearchPrefCreateRequest,
     SearchPrefResponse,
@@ -19,6 +20,7 @@ router = APIRouter(prefix="/search-preferences", tags=["search-preferences"])
 
 
 def _serialize(pref: SearchPref) -> SearchPrefResponse:
+    next_run_at = schedule.upcoming_run(pref)
     return SearchPrefResponse(
         id=str(pref.id),
         name=pref.name,
@@ -26,6 +28,7 @@ def _serialize(pref: SearchPref) -> SearchPrefResponse:
         schedule_cron=pref.schedule_cron,
         timezone=pref.timezone,
         last_run_at=pref.last_run_at.isoformat() if pref.last_run_at else None,
+        next_run_at=next_run_at.isoformat() if next_run_at else None,
     )
 
 
@@ -63,6 +66,7 @@ def create_search_pref(
         schedule_cron=payload.schedule_cron,
         timezone=payload.timezone,
     )
+    schedule.reschedule(pref)
     session.add(pref)
     session.flush()
     session.refresh(pref)
@@ -89,6 +93,8 @@ def update_search_pref(
         pref.schedule_cron = payload.schedule_cron
     if payload.timezone is not None:
         pref.timezone = payload.timezone
+    if payload.schedule_cron is not None or payload.timezone is not None:
+        schedule.reschedule(pref)
 
     session.flush()
     session.refresh(pref)
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from apps.api.deps.auth import get_current_user
 from apps.api.db.session import get_session
@@ -38,6 +38,7 @@ def list_tasks(
         select(Task)
         .where(Task.user_id == user.id)
         .order_by(Task.completed_at.is_(None).desc(), Task.due_at.asc().nullslast(), Task.created_at.desc())
+        .options(selectinload(Task.application).selectinload(Application.job_posting))
     )
     tasks = session.scalars(stmt).all()
     return [_serialize_task(task) for task in tasks]
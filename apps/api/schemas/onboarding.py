@@ -6,6 +6,8 @@ from pydantic import BaseModel, EmailStr, Field
 
 from uuid import UUID
 
+from apps.api.schemas.schedule import ScheduleFields
+
 
 class ResumeMetadata(BaseModel):
     filename: str
@@ -13,7 +15,7 @@ class ResumeMetadata(BaseModel):
     size_bytes: int
 
 
-class OnboardingPayload(BaseModel):
+class OnboardingPayload(ScheduleFields):
     full_name: str
     email: EmailStr
     primary_role: str
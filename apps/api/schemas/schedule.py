@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, field_validator
+
+from apps.api.services.schedule import CronSchedule, load_timezone
+
+
+class ScheduleFields(BaseModel):
+    """Validates the optional ``schedule_cron`` and ``timezone`` fields of a request."""
+
+    @field_validator("schedule_cron", check_fields=False)
+    @classmethod
+    def _valid_cron(cls, value: str | None) -> str | None:
+        if value is not None:
+            CronSchedule.parse(value)
+        return value
+
+    @field_validator("timezone", check_fields=False)
+    @classmethod
+    def _valid_timezone(cls, value: str | None) -> str | None:
+        if value is not None:
+            load_timezone(value)
+        return value
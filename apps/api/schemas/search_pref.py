@@ -4,6 +4,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from apps.api.schemas.schedule import ScheduleFields
+
 
 class SearchPrefResponse(BaseModel):
     id: str
@@ -12,16 +14,17 @@ class SearchPrefResponse(BaseModel):
     schedule_cron: str
     timezone: str
     last_run_at: str | None
+    next_run_at: str | None = None
 
 
-class SearchPrefCreateRequest(BaseModel):
+class SearchPrefCreateRequest(ScheduleFields):
     name: str = Field(..., max_length=120)
     filters: dict[str, Any] = Field(default_factory=dict)
     schedule_cron: str
     timezone: str
 
 
-class SearchPrefUpdateRequest(BaseModel):
+class SearchPrefUpdateRequest(ScheduleFields):
     name: str | None = Field(None, max_length=120)
     filters: dict[str, Any] | None = None
     schedule_cron: str | None = None
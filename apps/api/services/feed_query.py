@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import Select, and_, exists, func, literal, select, tuple_
+from sqlalchemy.orm import QueryableAttribute, Session, selectinload
+
+from apps.api.models import HiddenPosting, JobPosting, PostingEnrichment
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a feed cursor cannot be decoded."""
+
+
+class FeedSort(StrEnum):
+    RECENT = "recent"
+    FIT = "fit"
+
+
+@dataclass
+class FeedFilters:
+    location: str | None = None
+    remote_only: bool | None = None
+    min_fit: int | None = None
+
+
+@dataclass
+class FeedPage:
+    postings: list[JobPosting]
+    total: int
+    next_cursor: str | None = None
+
+
+@dataclass
+class FeedCursor:
+    """Position after the last row of a page: the sort key and the posting id tie-breaker."""
+
+    sort: FeedSort
+    key: datetime | int
+    posting_id: uuid.UUID
+
+    def encode(self) -> str:
+        key = self.key.isoformat() if isinstance(self.key, datetime) else self.key
+        raw = json.dumps({"s": self.sort.value, "k": key, "i": str(self.posting_id)})
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, sort: FeedSort) -> FeedCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if data["s"] != sort.value:
+                raise ValueError("cursor was issued for a different sort")
+            key: datetime | int
+            key = datetime.fromisoformat(data["k"]) if sort is FeedSort.RECENT else int(data["k"])
+            return cls(sort=sort, key=key, posting_id=uuid.UUID(data["i"]))
+        except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            raise InvalidCursorError("Malformed feed cursor") from exc
+
+
+def _visible_postings(user_id: uuid.UUID, filters: FeedFilters, sort: FeedSort) -> Select:
+    """Postings matching the filters that the user has not hidden.
+
+    Hidden postings are excluded with a correlated NOT EXISTS so the database
+    performs the anti-join instead of shipping the hidden ids back to Python.
+    Ranking by fit, or filtering on it, inner-joins the user's enrichments, so
+    postings that have not been scored yet are left out of that view.
+    """
+
+    hidden = exists().where(
+        HiddenPosting.user_id == user_id,
+        HiddenPosting.job_posting_id == JobPosting.id,
+    )
+    stmt = select(JobPosting).where(~hidden)
+    if sort is FeedSort.FIT or filters.min_fit is not None:
+        stmt = stmt.join(
+            PostingEnrichment,
+            and_(
+                PostingEnrichment.job_posting_id == JobPosting.id,
+                PostingEnrichment.user_id == user_id,
+            ),
+        )
+        if filters.min_fit is not None:
+            stmt = stmt.where(PostingEnrichment.fit_score >= filters.min_fit)
+    if filters.location:
+        stmt = stmt.where(JobPosting.location.ilike(f"%{filters.location}%"))
+    if filters.remote_only:
+        stmt = stmt.where(JobPosting.remote_flag.is_(True))
+    return stmt
+
+
+def _sort_columns(sort: FeedSort) -> tuple[QueryableAttribute[Any], QueryableAttribute[Any]]:
+    if sort is FeedSort.FIT:
+        return PostingEnrichment.fit_score, PostingEnrichment.job_posting_id
+    return JobPosting.created_at, JobPosting.id
+
+
+def count_visible(
+    session: Session, user_id: uuid.UUID, filters: FeedFilters, sort: FeedSort = FeedSort.RECENT
+) -> int:
+    stmt = _visible_postings(user_id, filters, sort).with_only_columns(func.count(JobPosting.id))
+    return int(session.scalar(stmt) or 0)
+
+
+def fetch_page(
+    session: Session,
+    user_id: uuid.UUID,
+    filters: FeedFilters,
+    *,
+    page: int,
+    limit: int,
+    sort: FeedSort = FeedSort.RECENT,
+    cursor: str | None = None,
+) -> FeedPage:
+    """Return one page of the feed, newest first or best fit first.
+
+    With a cursor the page starts strictly after the encoded position using a
+    row-value comparison that ``ix_job_postings_created_at_id`` (or
+    ``ix_posting_enrichments_user_fit`` for ``sort=fit``) can seek on, and
+    ``page`` is ignored. One extra row is fetched to decide whether a next
+    cursor should be issued.
+    """
+
+    key_column, id_column = _sort_columns(sort)
+    stmt = (
+        _visible_postings(user_id, filters, sort)
+        .add_columns(key_column)
+        .options(selectinload(JobPosting.company))
+        .order_by(key_column.desc(), id_column.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        position = FeedCursor.decode(cursor, sort)
+        # Bind the cursor values with the columns' types so they compare like stored values.
+        after = tuple_(
+            literal(position.key, type_=key_column.type),
+            literal(position.posting_id, type_=id_column.type),
+        )
+        stmt = stmt.where(tuple_(key_column, id_column) < after)
+    else:
+        stmt = stmt.offset((page - 1) * limit)
+
+    rows = session.execute(stmt).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_posting, last_key = rows[-1]
+        next_cursor = FeedCursor(sort=sort, key=last_key, posting_id=last_posting.id).encode()
+    return FeedPage(
+        postings=[posting for posting, _ in rows],
+        total=count_visible(session, user_id, filters, sort),
+        next_cursor=next_cursor,
+    )
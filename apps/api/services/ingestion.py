@@ -1,101 +1,325 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Iterable, List
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List
 
 from loguru import logger
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, selectinload
 
+from apps.api.db.upsert import dialect_insert
 from apps.api.models import Company, JobPosting
 from apps.api.models.enums import ProviderEnum
+from apps.api.services import matching
+
+UPSERT_CHUNK_SIZE = 500
+COMPANY_CACHE_SIZE = 10_000
+
+# Process-wide domain -> company id cache shared across ingestion runs.
+_company_cache: OrderedDict[str, uuid.UUID] = OrderedDict()
+_company_cache_lock = threading.Lock()
 
 
 @dataclass
 class UpsertResult:
     inserted: int
     postings: List[JobPosting]
+    inserted_ids: List[uuid.UUID] = field(default_factory=list)
+    updated_ids: List[uuid.UUID] = field(default_factory=list)
+    unchanged: int = 0
 
 
-def _get_or_create_company(session: Session, payload: dict[str, str | None]) -> Company | None:
-    name = payload.get("name")
+@dataclass
+class _PostingRow:
+    """A validated payload split into insert values and the fields an update may overwrite."""
+
+    key: tuple[ProviderEnum, str]
+    values: dict[str, object]
+    updates: tuple[str, ...]
+    company: dict[str, str | None] | None
+
+
+def _company_key(payload: dict[str, str | None]) -> tuple[str, str] | None:
+    """Lookup key for a company payload: by domain when present, otherwise by name."""
+
     domain = payload.get("domain")
-    if not name and not domain:
+    if domain:
+        return ("domain", domain)
+    name = payload.get("name")
+    if name:
+        return ("name", name)
+    return None
+
+
+def _remember_company(domain: str, company_id: uuid.UUID) -> None:
+    with _company_cache_lock:
+        _company_cache[domain] = company_id
+        _company_cache.move_to_end(domain)
+        while len(_company_cache) > COMPANY_CACHE_SIZE:
+            _company_cache.popitem(last=False)
+
+
+def clear_company_cache() -> None:
+    with _company_cache_lock:
+        _company_cache.clear()
+
+
+def _resolve_companies(
+    session: Session, payloads: Iterable[dict[str, str | None]]
+) -> dict[tuple[str, str], uuid.UUID]:
+    """Map every distinct company payload in a batch to a company id.
+
+    Domains already seen by this process are served from a bounded cache; the
+    rest are resolved with one query, and companies that do not exist yet are
+    bulk inserted. Returns ids keyed by ``_company_key``.
+    """
+
+    wanted: dict[tuple[str, str], dict[str, str | None]] = {}
+    for payload in payloads:
+        key = _company_key(payload)
+        if key is not None:
+            wanted.setdefault(key, payload)
+
+    resolved: dict[tuple[str, str], uuid.UUID] = {}
+    with _company_cache_lock:
+        for kind, value in wanted:
+            if kind == "domain" and value in _company_cache:
+                resolved[(kind, value)] = _company_cache[value]
+                _company_cache.move_to_end(value)
+
+    def lookup(keys: Iterable[tuple[str, str]]) -> None:
+        domains = [value for kind, value in keys if kind == "domain"]
+        names = [value for kind, value in keys if kind == "name"]
+        if not domains and not names:
+            return
+        stmt = select(Company.id, Company.domain, Company.name).where(
+            or_(Company.domain.in_(domains), Company.name.in_(names))
+        )
+        for company_id, domain, name in session.execute(stmt):
+            if domain in domains:
+                resolved[("domain", domain)] = company_id
+            if name in names:
+                resolved.setdefault(("name", name), company_id)
+
+    lookup([key for key in wanted if key not in resolved])
+
+    missing = [key for key in wanted if key not in resolved]
+    if missing:
+        rows = []
+        for key in missing:
+            payload = wanted[key]
+            domain = payload.get("domain") or None
+            rows.append({"id": uuid.uuid4(), "name": payload.get("name") or domain or "Unknown", "domain": domain})
+        stmt = dialect_insert(session, Company).values(rows)
+        # A concurrent run may have created the same domain; re-read instead of failing.
+        session.execute(stmt.on_conflict_do_nothing(index_elements=["domain"]))
+        lookup(missing)
+
+    for (kind, value), company_id in resolved.items():
+        if kind == "domain":
+            _remember_company(value, company_id)
+    return resolved
+
+
+def content_fingerprint(payload: dict[str, object]) -> str:
+    """Stable hash of a normalized provider payload."""
+
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _to_row(payload: dict[str, object]) -> _PostingRow | None:
+    source_value = payload.get("source", "greenhouse")
+    try:
+        source = ProviderEnum(source_value)
+    except ValueError:
+        logger.warning("Unsupported provider", provider=source_value)
         return None
 
-    stmt = select(Company)
-    if domain:
-        stmt = stmt.where(Company.domain == domain)
-    elif name:
-        stmt = stmt.where(Company.name == name)
+    source_id = payload.get("source_id")
+    if not source_id:
+        logger.warning("Skipping posting with no source_id", payload=payload)
+        return None
+
+    metadata = payload.get("metadata_json")
+    values: dict[str, object] = {
+        "source": source,
+        "source_id": str(source_id),
+        "url": str(payload.get("url") or ""),
+        "title": str(payload.get("title") or "Untitled"),
+        "location": payload.get("location_raw"),
+        "remote_flag": bool(payload.get("is_remote")),
+        "salary_min_cents": payload.get("salary_min"),
+        "salary_max_cents": payload.get("salary_max"),
+        "currency": str(payload.get("salary_currency") or "USD"),
+        "normalized_tags": metadata.get("departments") if isinstance(metadata, dict) else None,
+        "scraped_at": datetime.now(UTC),
+        "content_fingerprint": content_fingerprint(payload),
+    }
+
+    # Re-ingesting only overwrites fields the payload actually carries, matching
+    # the historical per-row update semantics.
+    updates = ["remote_flag", "content_fingerprint"]
+    if payload.get("title"):
+        updates.append("title")
+    if payload.get("url"):
+        updates.append("url")
+    if payload.get("location_raw"):
+        updates.append("location")
+    if isinstance(metadata, dict):
+        updates.append("normalized_tags")
+
+    company = payload.get("company")
+    return _PostingRow(
+        key=(source, str(source_id)),
+        values=values,
+        updates=tuple(updates),
+        company=company if isinstance(company, dict) else None,
+    )
 
-    company = session.scalars(stmt).first()
-    if company:
-        return company
 
-    company = Company(name=name or domain or "Unknown", domain=domain)
-    session.add(company)
-    session.flush()
-    return company
+def _existing_postings(
+    session: Session, keys: Iterable[tuple[ProviderEnum, str]]
+) -> dict[tuple[ProviderEnum, str], tuple[uuid.UUID, str | None]]:
+    """Resolve ``(source, source_id)`` pairs to ``(posting id, content fingerprint)``.
+
+    Issues one query per source and chunk.
+    """
+
+    by_source: dict[ProviderEnum, list[str]] = {}
+    for source, source_id in keys:
+        by_source.setdefault(source, []).append(source_id)
+
+    found: dict[tuple[ProviderEnum, str], tuple[uuid.UUID, str | None]] = {}
+    for source, source_ids in by_source.items():
+        for start in range(0, len(source_ids), UPSERT_CHUNK_SIZE):
+            stmt = select(JobPosting.id, JobPosting.source_id, JobPosting.content_fingerprint).where(
+                JobPosting.source == source,
+                JobPosting.source_id.in_(source_ids[start : start + UPSERT_CHUNK_SIZE]),
+            )
+            for posting_id, source_id, fingerprint in session.execute(stmt):
+                found[(source, source_id)] = (posting_id, fingerprint)
+    return found
+
+
+def _upsert_statement(session: Session, rows: list[dict[str, object]], updates: tuple[str, ...]):
+    stmt = dialect_insert(session, JobPosting).values(rows)
+    if session.get_bind().dialect.name == "postgresql":
+        conflict: dict[str, object] = {"constraint": "uq_job_posting_source_id"}
+    else:
+        conflict = {"index_elements": ["source", "source_id"]}
+
+    set_ = {column: stmt.excluded[column] for column in updates}
+    set_["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(set_=set_, **conflict).returning(JobPosting.id)
 
 
 def upsert_job_postings(session: Session, normalized_postings: Iterable[dict[str, object]]) -> UpsertResult:
-    inserted = 0
-    affected: list[JobPosting] = []
+    """Insert or update postings with set-based statements.
+
+    Existing ``(source, source_id)`` pairs are resolved up front, then rows are
+    written with ``INSERT ... ON CONFLICT (source, source_id) DO UPDATE`` in
+    chunks of ``UPSERT_CHUNK_SIZE``. Rows are grouped by which fields they may
+    overwrite so each group shares one statement. Duplicate keys within a batch
+    collapse to the last payload.
+
+    Postings whose stored content fingerprint matches the incoming payload are
+    skipped entirely: they are not updated and are not returned in ``postings``,
+    so nothing downstream rescores them.
+    """
+
+    rows: dict[tuple[ProviderEnum, str], _PostingRow] = {}
     for payload in normalized_postings:
-        source_value = payload.get("source", "greenhouse")
-        try:
-            source = ProviderEnum(source_value)
-        except ValueError:
-            logger.warning("Unsupported provider", provider=source_value)
-            continue
-
-        source_id = payload.get("source_id")
-        if not source_id:
-            logger.warning("Skipping posting with no source_id", payload=payload)
-            continue
-
-        stmt = select(JobPosting).where(JobPosting.source == source, JobPosting.source_id == str(source_id))
-        posting = session.scalars(stmt).first()
-        if posting:
-            posting.title = str(payload.get("title") or posting.title)
-            posting.url = str(payload.get("url") or posting.url)
-            posting.location = payload.get("location_raw") or posting.location
-            posting.remote_flag = bool(payload.get("is_remote"))
-            metadata = payload.get("metadata_json")
-            if isinstance(metadata, dict):
-                posting.normalized_tags = metadata.get("departments")
-            affected.append(posting)
-            continue
-
-        company = None
-        company_payload = payload.get("company")
-        if isinstance(company_payload, dict):
-            company = _get_or_create_company(session, company_payload)
-
-        metadata = payload.get("metadata_json") if isinstance(payload.get("metadata_json"), dict) else {}
-
-        posting = JobPosting(
-            source=source,
-            source_id=str(source_id),
-            url=str(payload.get("url") or ""),
-            title=str(payload.get("title") or "Untitled"),
-            location=payload.get("location_raw"),
-            remote_flag=bool(payload.get("is_remote")),
-            salary_min_cents=payload.get("salary_min"),
-            salary_max_cents=payload.get("salary_max"),
-            currency=str(payload.get("salary_currency") or "USD"),
-            normalized_tags=metadata.get("departments") if isinstance(metadata, dict) else None,
-            scraped_at=datetime.now(UTC),
-        )
+        row = _to_row(payload)
+        if row is not None:
+            rows[row.key] = row
+
+    known = _existing_postings(session, rows)
+    unchanged = [
+        key for key, row in rows.items() if key in known and known[key][1] == row.values["content_fingerprint"]
+    ]
+    for key in unchanged:
+        del rows[key]
+    existing = {key: posting_id for key, (posting_id, _) in known.items() if key in rows}
+    companies = _resolve_companies(
+        session, [row.company for key, row in rows.items() if key not in existing and row.company]
+    )
 
-        if company:
-            posting.company_id = company.id
+    groups: dict[tuple[str, ...], list[dict[str, object]]] = {}
+    for key, row in rows.items():
+        values = dict(row.values, id=existing.get(key) or uuid.uuid4(), company_id=None)
+        company_key = _company_key(row.company) if key not in existing and row.company else None
+        if company_key is not None:
+            values["company_id"] = companies.get(company_key)
+        groups.setdefault(row.updates, []).append(values)
 
-        session.add(posting)
-        inserted += 1
-        affected.append(posting)
+    written: list[uuid.UUID] = []
+    for updates, group in groups.items():
+        for start in range(0, len(group), UPSERT_CHUNK_SIZE):
+            stmt = _upsert_statement(session, group[start : start + UPSERT_CHUNK_SIZE], updates)
+            written.extend(session.scalars(stmt).all())
+
+    existing_ids = set(existing.values())
+    inserted_ids = [posting_id for posting_id in written if posting_id not in existing_ids]
+    updated_ids = [posting_id for posting_id in written if posting_id in existing_ids]
+
+    loaded: dict[uuid.UUID, JobPosting] = {}
+    for start in range(0, len(written), UPSERT_CHUNK_SIZE):
+        stmt = (
+            select(JobPosting)
+            .where(JobPosting.id.in_(written[start : start + UPSERT_CHUNK_SIZE]))
+            .options(selectinload(JobPosting.company))
+            .execution_options(populate_existing=True)
+        )
+        loaded.update((posting.id, posting) for posting in session.scalars(stmt))
+    postings = [loaded[posting_id] for posting_id in written if posting_id in loaded]
 
+    matching.refresh_term_vectors(session, postings)
     session.commit()
-    return UpsertResult(inserted=inserted, postings=affected)
+    return UpsertResult(
+        inserted=len(inserted_ids),
+        postings=postings,
+        inserted_ids=inserted_ids,
+        updated_ids=updated_ids,
+        unchanged=len(unchanged),
+    )
+
+
+def upsert_job_postings_in_chunks(
+    session: Session,
+    normalized_postings: Iterable[dict[str, object]],
+    chunk_size: int = UPSERT_CHUNK_SIZE,
+    on_chunk: Callable[[UpsertResult], None] | None = None,
+) -> UpsertResult:
+    """Stream postings through ``upsert_job_postings`` ``chunk_size`` at a time.
+
+    Each chunk is written and committed before the next payload is pulled from
+    ``normalized_postings``, and ``on_chunk`` sees that chunk's result (for
+    example to score it). Postings are not retained across chunks, so memory is
+    bounded by the chunk size rather than the board size; the returned result
+    carries totals and ids only, with an empty ``postings`` list.
+    """
+
+    total = UpsertResult(inserted=0, postings=[])
+    for chunk in _chunked(normalized_postings, chunk_size):
+        result = upsert_job_postings(session, chunk)
+        if on_chunk is not None:
+            on_chunk(result)
+        total.inserted += result.inserted
+        total.unchanged += result.unchanged
+        total.inserted_ids.extend(result.inserted_ids)
+        total.updated_ids.extend(result.updated_ids)
+    return total
+
+
+def _chunked(items: Iterable[dict[str, object]], size: int) -> Iterator[list[dict[str, object]]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
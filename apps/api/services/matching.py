@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import math
 import re
 import uuid
 from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable
-
-from sqlalchemy import select
-from sqlalchemy.orm import Session
-
-from apps.api.models import JobPosting, PostingEnrichment, Profile
+from datetime import UTC, datetime, timedelta
+from typing import Iterable, Mapping, Sequence, cast
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import ColumnElement, Insert, Table, and_, case, delete, exists, func, insert, literal, or_, select
+from sqlalchemy.orm import Session, selectinload
+
+from apps.api.config import settings
+from apps.api.db.upsert import dialect_insert
+from apps.api.models import (
+    HiddenPosting,
+    JobPosting,
+    PostingEnrichment,
+    PostingTerm,
+    PostingTermVector,
+    Profile,
+)
+from apps.api.services import profile_cache
 
 STOPWORDS = {
     "a",
@@ -25,6 +40,11 @@ STOPWORDS = {
     "with",
 }
 
+_TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9]+")
+
+TEXT_FIELD = "text"
+SKILL_FIELD = "skill"
+
 
 @dataclass
 class FitComputation:
@@ -36,22 +56,18 @@ class FitComputation:
 def _normalize_tokens(values: Iterable[str] | None) -> set[str]:
     if not values:
         return set()
-    return {value.strip().lower() for value in values if value and value.strip()}
+    return {token for token in map(str.lower, map(str.strip, filter(None, values))) if token}
 
 
 def _tokenize(text: str | None) -> list[str]:
     if not text:
         return []
-    tokens = re.findall(r"[a-zA-Z0-9]+", text.lower())
+    tokens = _TOKEN_PATTERN.findall(text.lower())
     return [token for token in tokens if token and token not in STOPWORDS]
 
 
 def _vectorize(tokens: Iterable[str]) -> Counter[str]:
-    counter: Counter[str] = Counter()
-    for token in tokens:
-        if token:
-            counter[token] += 1
-    return counter
+    return Counter(filter(None, tokens))
 
 
 def _cosine_similarity(vec_a: Counter[str], vec_b: Counter[str]) -> float:
@@ -67,9 +83,9 @@ def _cosine_similarity(vec_a: Counter[str], vec_b: Counter[str]) -> float:
     return dot / (norm_a * norm_b)
 
 
-def _build_profile_vector(profile: Profile | None) -> Counter[str]:
+def _profile_tokens(profile: Profile | None) -> list[str]:
     if profile is None:
-        return Counter()
+        return []
     tokens: list[str] = []
     if profile.headline:
         tokens.extend(_tokenize(profile.headline))
@@ -79,10 +95,26 @@ def _build_profile_vector(profile: Profile | None) -> Counter[str]:
         tokens.extend(_tokenize(" ".join(profile.skills)))
     if profile.locations:
         tokens.extend(_tokenize(" ".join(profile.locations)))
-    return _vectorize(tokens)
+    return tokens
 
 
-def _build_posting_vector(posting: JobPosting) -> Counter[str]:
+def _build_profile_vector(profile: Profile | None) -> Counter[str]:
+    """Token vector for the profile, built once per distinct profile content.
+
+    The returned Counter is shared through ``profile_cache`` and must not be mutated.
+    """
+
+    if profile is None:
+        return Counter()
+    key = profile_cache.profile_content_hash(profile)
+    vector = profile_cache.profile_vectors.get(key)
+    if vector is None:
+        vector = _vectorize(_profile_tokens(profile))
+        profile_cache.profile_vectors.put(key, vector)
+    return vector
+
+
+def _posting_tokens(posting: JobPosting) -> list[str]:
     tokens: list[str] = []
     tokens.extend(_tokenize(posting.title))
     if posting.company and posting.company.name:
@@ -95,7 +127,148 @@ def _build_posting_vector(posting: JobPosting) -> Counter[str]:
         tokens.extend(_tokenize(posting.jd_raw))
     if posting.location:
         tokens.extend(_tokenize(posting.location))
-    return _vectorize(tokens)
+    return tokens
+
+
+def _build_posting_vector(posting: JobPosting) -> Counter[str]:
+    return _vectorize(_posting_tokens(posting))
+
+
+def posting_source_hash(posting: JobPosting) -> str:
+    """Hash of the posting fields that ``_posting_tokens`` reads."""
+
+    payload = [
+        posting.title,
+        posting.company.name if posting.company else None,
+        posting.normalized_tags,
+        posting.jd_clean or posting.jd_raw,
+        posting.location,
+    ]
+    encoded = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_term_vectors(
+    session: Session, posting_ids: Iterable[uuid.UUID]
+) -> dict[uuid.UUID, PostingTermVector]:
+    ids = list(posting_ids)
+    if not ids:
+        return {}
+    stmt = select(PostingTermVector).where(PostingTermVector.job_posting_id.in_(ids))
+    return {vector.job_posting_id: vector for vector in session.scalars(stmt)}
+
+
+def refresh_term_vectors(session: Session, postings: Iterable[JobPosting]) -> int:
+    """Persist term vectors and inverted index entries for postings whose matching text changed.
+
+    Postings must already have ids (i.e. be flushed). Returns the number of
+    vectors written; the caller owns the commit.
+    """
+
+    postings = [posting for posting in postings if posting.id is not None]
+    existing = load_term_vectors(session, [posting.id for posting in postings])
+    index_rows: list[dict[str, object]] = []
+    changed: list[uuid.UUID] = []
+    for posting in postings:
+        source_hash = posting_source_hash(posting)
+        vector = existing.get(posting.id)
+        if vector is not None and vector.source_hash == source_hash:
+            continue
+        counts = _build_posting_vector(posting)
+        if vector is None:
+            vector = PostingTermVector(job_posting_id=posting.id)
+            session.add(vector)
+            existing[posting.id] = vector
+        vector.terms = list(counts)
+        vector.counts = list(counts.values())
+        vector.norm = math.sqrt(sum(value * value for value in counts.values()))
+        vector.source_hash = source_hash
+        changed.append(posting.id)
+        index_rows.extend(
+            {"job_posting_id": posting.id, "field": TEXT_FIELD, "term": term, "count": count}
+            for term, count in counts.items()
+        )
+        index_rows.extend(
+            {"job_posting_id": posting.id, "field": SKILL_FIELD, "term": tag, "count": 1}
+            for tag in _normalize_tokens(posting.normalized_tags)
+        )
+    if changed:
+        session.flush()
+        session.execute(delete(PostingTerm).where(PostingTerm.job_posting_id.in_(changed)))
+        if index_rows:
+            session.execute(insert(PostingTerm), index_rows)
+    return len(changed)
+
+
+def candidate_posting_ids(session: Session, profile: Profile, limit: int = 200) -> list[uuid.UUID]:
+    """Top ``limit`` postings by term overlap with the profile, read from the inverted index.
+
+    Postings sharing more skill tags rank first; ties are broken by the dot
+    product of profile and posting text term counts. Postings sharing no term
+    with the profile, and postings the user has hidden, are never returned.
+    """
+
+    profile_vec = _build_profile_vector(profile)
+    skills = _normalize_tokens(profile.skills)
+    if not profile_vec and not skills:
+        return []
+
+    conditions = []
+    text_weight: ColumnElement[int] = literal(0)
+    if profile_vec:
+        text_weight = case(*[(PostingTerm.term == term, count) for term, count in profile_vec.items()], else_=0)
+        conditions.append(and_(PostingTerm.field == TEXT_FIELD, PostingTerm.term.in_(list(profile_vec))))
+    if skills:
+        conditions.append(and_(PostingTerm.field == SKILL_FIELD, PostingTerm.term.in_(sorted(skills))))
+
+    skill_hits = func.sum(case((PostingTerm.field == SKILL_FIELD, 1), else_=0))
+    text_dot = func.sum(case((PostingTerm.field == TEXT_FIELD, PostingTerm.count * text_weight), else_=0))
+    hidden = exists().where(
+        HiddenPosting.user_id == profile.user_id,
+        HiddenPosting.job_posting_id == PostingTerm.job_posting_id,
+    )
+    stmt = (
+        select(PostingTerm.job_posting_id)
+        .where(or_(*conditions), ~hidden)
+        .group_by(PostingTerm.job_posting_id)
+        .order_by(skill_hits.desc(), text_dot.desc(), PostingTerm.job_posting_id)
+        .limit(limit)
+    )
+    return list(session.scalars(stmt))
+
+
+def is_candidate(result: FitComputation) -> bool:
+    """Whether a scored posting shares a skill tag or text term with the profile.
+
+    This is the rule ``candidate_posting_ids`` applies to the inverted index.
+    A block that has already been scored can check it from the skill and
+    similarity factors, with no extra query.
+    """
+
+    return result.factors["skill_overlap"] > 0 or result.factors["semantic_similarity"] > 0
+
+
+def ensure_candidate_enrichments(
+    session: Session, user_id: uuid.UUID, limit: int = 200
+) -> dict[uuid.UUID, PostingEnrichment]:
+    """Score only the user's top inverted-index candidates instead of every posting.
+
+    Returns the candidates' enrichments keyed by posting id; the caller owns the commit.
+    """
+
+    profile = _load_profile(session, user_id)
+    if profile is None:
+        return {}
+    posting_ids = candidate_posting_ids(session, profile, limit)
+    if not posting_ids:
+        return {}
+    stmt = (
+        select(JobPosting)
+        .where(JobPosting.id.in_(posting_ids))
+        .options(selectinload(JobPosting.company))
+    )
+    enrichments, _ = ensure_enrichments(session, user_id, session.scalars(stmt).all())
+    return enrichments
 
 
 def _skill_score(profile: Profile | None, posting: JobPosting) -> tuple[int, dict[str, float], list[str]]:
@@ -192,9 +365,402 @@ def compute_fit_score(profile: Profile | None, posting: JobPosting) -> FitComput
     return FitComputation(score=_clamp(total), factors=factors, reasons=reasons)
 
 
+def _indicator_matrix(rows: Sequence[Iterable[str]], vocabulary: dict[str, int]) -> sparse.csr_matrix:
+    """Binary CSR matrix marking which vocabulary entries appear in each row; unknown terms are dropped."""
+
+    indptr = [0]
+    indices: list[int] = []
+    for row in rows:
+        indices.extend({vocabulary[term] for term in row if term in vocabulary})
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float64)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), max(len(vocabulary), 1)))
+
+
+def _posting_terms(
+    posting: JobPosting, vectors: Mapping[uuid.UUID, PostingTermVector]
+) -> tuple[list[str], list[int], float]:
+    # A stored vector is trusted as is: ingestion refreshes it whenever the
+    # posting's text changes (see ``refresh_term_vectors``), and re-hashing the
+    # description here would cost about as much as tokenizing it.
+    posting_id = posting.id
+    vector = vectors.get(posting_id) if posting_id is not None else None
+    if vector is not None:
+        return vector.terms, vector.counts, vector.norm
+    counts = _build_posting_vector(posting)
+    norm = math.sqrt(sum(value * value for value in counts.values()))
+    return list(counts), list(counts.values()), norm
+
+
+def _term_matrix(
+    postings: Sequence[JobPosting],
+    vectors: Mapping[uuid.UUID, PostingTermVector],
+    vocabulary: Mapping[str, int],
+) -> tuple[sparse.csr_matrix, np.ndarray]:
+    """Sparse postings x vocabulary count matrix for the batch, plus each posting's full norm.
+
+    Only terms in ``vocabulary`` (the profile's terms) can contribute to a dot
+    product, so all other columns are dropped; norms still cover every term.
+    Postings with a stored vector are not re-tokenized. The vocabulary is far
+    smaller than a posting's term list, so each posting is intersected with it
+    at C level and only the few shared terms are looked up in Python.
+    """
+
+    vocabulary_terms = vocabulary.keys()
+    rows: list[int] = []
+    columns: list[int] = []
+    data: list[float] = []
+    norms = np.empty(len(postings), dtype=np.float64)
+    for row, posting in enumerate(postings):
+        terms, counts, norm = _posting_terms(posting, vectors)
+        norms[row] = norm
+        for term in vocabulary_terms & terms:
+            rows.append(row)
+            columns.append(vocabulary[term])
+            # Stored and freshly built term lists are distinct, so ``index`` finds the one entry.
+            data.append(counts[terms.index(term)])
+    matrix = sparse.csr_matrix(
+        (np.array(data, dtype=np.float64), (rows, columns)),
+        shape=(len(postings), max(len(vocabulary), 1)),
+    )
+    return matrix, norms
+
+
+def _batch_similarity(
+    profile: Profile | None,
+    postings: Sequence[JobPosting],
+    vectors: Mapping[uuid.UUID, PostingTermVector],
+) -> np.ndarray:
+    profile_vec = _build_profile_vector(profile)
+    if not profile_vec:
+        return np.zeros(len(postings))
+
+    vocabulary = {token: index for index, token in enumerate(profile_vec)}
+    matrix, posting_norms = _term_matrix(postings, vectors, vocabulary)
+    dots = matrix @ np.fromiter(profile_vec.values(), dtype=np.float64, count=len(profile_vec))
+    profile_norm = math.sqrt(sum(value * value for value in profile_vec.values()))
+    denominators = profile_norm * posting_norms
+    similarity = np.zeros(len(postings))
+    np.divide(dots, denominators, out=similarity, where=(dots != 0) & (denominators != 0))
+    return similarity
+
+
+@dataclass
+class _PostingBatch:
+    """Profile-independent features of a batch of postings, computed once per batch."""
+
+    tags: list[set[str]]
+    has_tags: np.ndarray
+    remote_flags: np.ndarray
+    locations: list[str]
+    title_tokens: list[list[str]]
+    title_lengths: np.ndarray
+
+    @classmethod
+    def build(cls, postings: Sequence[JobPosting]) -> _PostingBatch:
+        # One pass that reads each ORM attribute once: instrumented attribute
+        # access costs more than the feature extraction itself.
+        tags: list[set[str]] = []
+        remote_flags: list[bool] = []
+        locations: list[str] = []
+        title_tokens: list[list[str]] = []
+        for posting in postings:
+            posting_tags = posting.normalized_tags
+            tags.append(_normalize_tokens(posting_tags) if posting_tags else set())
+            remote_flags.append(bool(posting.remote_flag))
+            location = posting.location
+            locations.append(location.strip().lower() if location else "")
+            title_tokens.append(posting.title.lower().split())
+        return cls(
+            tags=tags,
+            has_tags=np.fromiter(map(bool, tags), dtype=bool, count=len(tags)),
+            remote_flags=np.array(remote_flags, dtype=bool),
+            locations=locations,
+            title_tokens=title_tokens,
+            title_lengths=np.fromiter(
+                (len(tokens) or 1 for tokens in title_tokens), dtype=np.int64, count=len(title_tokens)
+            ),
+        )
+
+
+def _block_similarity(
+    profiles: Sequence[Profile | None],
+    postings: Sequence[JobPosting],
+    vectors: Mapping[uuid.UUID, PostingTermVector],
+) -> np.ndarray:
+    """Cosine similarity of every profile against every posting, as a profiles x postings array.
+
+    The vocabulary is the union of the profiles' terms, so the postings are
+    turned into one sparse term matrix and the whole block is a single sparse
+    product.
+    """
+
+    profile_vecs = [_build_profile_vector(profile) for profile in profiles]
+    vocabulary: dict[str, int] = {}
+    for vector in profile_vecs:
+        for token in vector:
+            vocabulary.setdefault(token, len(vocabulary))
+    similarity = np.zeros((len(profiles), len(postings)))
+    if not vocabulary:
+        return similarity
+
+    indptr = [0]
+    indices: list[int] = []
+    data: list[float] = []
+    for vector in profile_vecs:
+        indices.extend(vocabulary[token] for token in vector)
+        data.extend(vector.values())
+        indptr.append(len(indices))
+    profile_matrix = sparse.csr_matrix(
+        (np.array(data, dtype=np.float64), indices, indptr), shape=(len(profiles), len(vocabulary))
+    )
+    matrix, posting_norms = _term_matrix(postings, vectors, vocabulary)
+    dots = (profile_matrix @ matrix.T).toarray()
+    profile_norms = np.sqrt(np.asarray(profile_matrix.multiply(profile_matrix).sum(axis=1)).ravel())
+    denominators = np.outer(profile_norms, posting_norms)
+    np.divide(dots, denominators, out=similarity, where=(dots != 0) & (denominators != 0))
+    return similarity
+
+
+def score_postings(
+    profile: Profile | None,
+    postings: Sequence[JobPosting],
+    vectors: Mapping[uuid.UUID, PostingTermVector] | None = None,
+) -> list[FitComputation]:
+    """Score many postings against one profile; produces the same results as ``compute_fit_score``.
+
+    The profile is tokenized once and every component is evaluated as array
+    operations over the batch: cosine similarity via a sparse postings x terms
+    matrix, skill and title overlap via sparse indicator products, and location
+    and remote matches as vector comparisons. Only the human-readable reasons
+    are assembled per posting. ``vectors`` (see ``load_term_vectors``) lets
+    postings with a stored term vector skip tokenization.
+
+    On 3,000 synthetic postings this runs about 10-12x faster than calling
+    ``compute_fit_score`` per posting when stored vectors are supplied. Without
+    them both paths are dominated by tokenizing the descriptions and run at
+    roughly the same speed (about 1.0-1.3x).
+    """
+
+    if not postings:
+        return []
+    similarity = _batch_similarity(profile, postings, vectors or {})
+    return _score_batch(profile, _PostingBatch.build(postings), similarity)
+
+
+def score_block(
+    profiles: Sequence[Profile | None],
+    postings: Sequence[JobPosting],
+    vectors: Mapping[uuid.UUID, PostingTermVector] | None = None,
+) -> list[list[FitComputation]]:
+    """Score ``postings`` for every profile; row ``i`` equals ``score_postings(profiles[i], postings)``.
+
+    Posting features are extracted once for the block and semantic similarity
+    for all profiles comes from one sparse product (see ``_block_similarity``),
+    so scoring many users against a fresh chunk of postings does not
+    re-tokenize the postings per user.
+    """
+
+    if not postings or not profiles:
+        return [[] for _ in profiles]
+    batch = _PostingBatch.build(postings)
+    similarity = _block_similarity(profiles, postings, vectors or {})
+    return [_score_batch(profile, batch, similarity[index]) for index, profile in enumerate(profiles)]
+
+
+def _score_batch(
+    profile: Profile | None, batch: _PostingBatch, similarity: np.ndarray
+) -> list[FitComputation]:
+    count = len(batch.tags)
+
+    profile_skills = _normalize_tokens(profile.skills if profile else None)
+    has_tags = batch.has_tags
+    if profile_skills:
+        skill_vocab = {skill: index for index, skill in enumerate(sorted(profile_skills))}
+        skill_hits = np.asarray(_indicator_matrix(batch.tags, skill_vocab).sum(axis=1)).ravel()
+        skill_ratio = np.where(has_tags, skill_hits / len(profile_skills), 0.0)
+        skill_scores = np.where(has_tags, (20 + skill_ratio * 60).astype(np.int64), 20)
+    else:
+        skill_hits = np.zeros(count)
+        skill_ratio = np.zeros(count)
+        skill_scores = np.full(count, 20)
+
+    embedding_scores = (similarity * 30).astype(np.int64)
+
+    if profile is None:
+        remote_scores, remote_match = np.full(count, 10), np.zeros(count)
+    elif any(location.lower() == "remote" for location in profile.locations or []):
+        remote_scores = np.where(batch.remote_flags, 15, 5)
+        remote_match = batch.remote_flags.astype(np.float64)
+    else:
+        remote_scores, remote_match = np.full(count, 15), np.full(count, 0.5)
+
+    # Branch on the raw list, as _location_score does: blank entries still count
+    # as having locations, they just never match.
+    if profile is not None and profile.locations:
+        profile_locations = _normalize_tokens(profile.locations)
+        location_hits = np.isin(np.array(batch.locations, dtype=object), list(profile_locations))
+        location_scores = np.where(location_hits, 15, 8)
+    else:
+        location_hits = np.zeros(count, dtype=bool)
+        location_scores = np.full(count, 10)
+
+    if profile is not None and profile.headline:
+        headline_vocab = {token: index for index, token in enumerate(set(profile.headline.lower().split()))}
+        title_hits = np.asarray(_indicator_matrix(batch.title_tokens, headline_vocab).sum(axis=1)).ravel()
+        title_ratio = title_hits / batch.title_lengths
+        title_scores = (10 + title_ratio * 20).astype(np.int64)
+    else:
+        title_ratio = np.zeros(count)
+        title_scores = np.full(count, 10)
+
+    totals = np.clip(skill_scores + embedding_scores + remote_scores + location_scores + title_scores, 0, 100)
+
+    # Plain Python values for the per-posting loop; indexing numpy arrays
+    # element by element is several times slower than walking lists.
+    rows = zip(
+        totals.tolist(),
+        np.asarray(skill_ratio, dtype=np.float64).tolist(),
+        (np.asarray(skill_hits) != 0).tolist(),
+        has_tags.tolist(),
+        similarity.tolist(),
+        np.asarray(remote_match, dtype=np.float64).tolist(),
+        location_hits.tolist(),
+        np.asarray(title_ratio, dtype=np.float64).tolist(),
+        batch.tags,
+        batch.locations,
+    )
+    results: list[FitComputation] = []
+    for total, skill, skill_hit, tagged, semantic, remote, location_hit, title, tags, location in rows:
+        reasons: list[str] = []
+        if skill_hit and tagged:
+            top_overlap = ", ".join(sorted(profile_skills & tags)[:5])
+            reasons.append(f"Shares skills: {top_overlap}")
+        if semantic >= 0.2:
+            reasons.append("Title and summary resemble the job description")
+        if remote == 1.0:
+            reasons.append("Remote role matches preference")
+        if location_hit:
+            reasons.append(f"Location match: {location}")
+        if title >= 0.3:
+            reasons.append("Similar title to your profile headline")
+        results.append(
+            FitComputation(
+                score=total,
+                factors={
+                    "skill_overlap": skill,
+                    "semantic_similarity": semantic,
+                    "remote_match": remote,
+                    "location_match": 1.0 if location_hit else 0.0,
+                    "title_similarity": title,
+                },
+                reasons=reasons,
+            )
+        )
+    return results
+
+
+def _profile_fingerprint_prefix(profile: Profile | None) -> bytes:
+    payload = [
+        profile.headline if profile else None,
+        profile.summary if profile else None,
+        profile.skills if profile else None,
+        profile.locations if profile else None,
+    ]
+    # Drop the closing bracket so a posting suffix completes the JSON array.
+    return json.dumps(payload, separators=(",", ":"), default=str).encode()[:-1] + b","
+
+
+def _posting_fingerprint_suffix(posting: JobPosting) -> bytes:
+    payload = [
+        posting.title,
+        posting.company.name if posting.company else None,
+        posting.normalized_tags,
+        posting.jd_clean or posting.jd_raw,
+        posting.location,
+        posting.remote_flag,
+    ]
+    return json.dumps(payload, separators=(",", ":"), default=str).encode()[1:]
+
+
+def input_fingerprint(profile: Profile | None, posting: JobPosting) -> str:
+    """Hash of every profile and posting field that feeds ``compute_fit_score``.
+
+    An enrichment whose stored fingerprint differs from the current one was
+    computed against inputs that have since changed and must be rescored.
+    """
+
+    encoded = _profile_fingerprint_prefix(profile) + _posting_fingerprint_suffix(posting)
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _rationale(result: FitComputation) -> str | None:
+    return " • ".join(result.reasons[:3]) if result.reasons else None
+
+
+def _profile_version(profile: Profile | None) -> int | None:
+    return profile.version if profile is not None else None
+
+
+def _apply_result(
+    enrichment: PostingEnrichment, result: FitComputation, fingerprint: str, profile: Profile | None
+) -> PostingEnrichment:
+    enrichment.fit_score = result.score
+    enrichment.fit_factors = result.factors
+    enrichment.rationale = _rationale(result)
+    enrichment.input_fingerprint = fingerprint
+    enrichment.profile_version = _profile_version(profile)
+    return enrichment
+
+
+def awaiting_rescore(
+    enrichment: PostingEnrichment, profile: Profile | None, now: datetime | None = None
+) -> bool:
+    """Whether ``enrichment`` was scored against an older version of ``profile``
+    and the rescore queued by that change may still be on its way.
+
+    Such rows are refreshed by the background job queued when the profile
+    changed (see ``record_profile_change``), so readers serve them as they are
+    instead of rescoring inline. That only holds for ``rescore_grace_seconds``
+    after the edit: past it the job is assumed lost (its enqueue failed, or the
+    posting is older than the postings it covers) and readers rescore the row.
+    """
+
+    if (
+        profile is None
+        or enrichment.profile_version is None
+        or enrichment.profile_version >= profile.version
+    ):
+        return False
+    changed_at = profile.updated_at
+    if changed_at is None:
+        return True
+    if changed_at.tzinfo is None:
+        changed_at = changed_at.replace(tzinfo=UTC)
+    return (now or datetime.now(UTC)) - changed_at < timedelta(seconds=settings.rescore_grace_seconds)
+
+
+def record_profile_change(profile: Profile, previous_hash: str) -> bool:
+    """Bump ``profile.version`` if its matching fields changed since ``previous_hash``.
+
+    Also drops the cached token vector for the old content. Returns whether the
+    profile changed, i.e. whether its enrichments need rescoring.
+    """
+
+    if profile_cache.profile_content_hash(profile) == previous_hash:
+        return False
+    profile_cache.profile_vectors.invalidate(previous_hash)
+    profile.version = (profile.version or 1) + 1
+    return True
+
+
+def _load_profile(session: Session, user_uuid: uuid.UUID) -> Profile | None:
+    return session.execute(select(Profile).where(Profile.user_id == user_uuid)).scalar_one_or_none()
+
+
 def update_posting_enrichment(session: Session, user_id: str, posting: JobPosting) -> PostingEnrichment:
     user_uuid = uuid.UUID(str(user_id))
-    profile = session.execute(select(Profile).where(Profile.user_id == user_uuid)).scalar_one_or_none()
+    profile = _load_profile(session, user_uuid)
 
     result = compute_fit_score(profile, posting)
 
@@ -203,19 +769,212 @@ def update_posting_enrichment(session: Session, user_id: str, posting: JobPostin
         PostingEnrichment.job_posting_id == posting.id,
     )
     enrichment = session.scalars(stmt).first()
-    rationale = " • ".join(result.reasons[:3]) if result.reasons else None
     if enrichment is None:
-        enrichment = PostingEnrichment(
-            user_id=user_uuid,
-            job_posting_id=posting.id,
-            fit_score=result.score,
-            fit_factors=result.factors,
-            rationale=rationale,
-        )
+        enrichment = PostingEnrichment(user_id=user_uuid, job_posting_id=posting.id)
         session.add(enrichment)
-    else:
-        enrichment.fit_score = result.score
-        enrichment.fit_factors = result.factors
-        enrichment.rationale = rationale
+    _apply_result(enrichment, result, input_fingerprint(profile, posting), profile)
     session.commit()
     return enrichment
+
+
+def ensure_enrichments(
+    session: Session, user_id: uuid.UUID, postings: Iterable[JobPosting]
+) -> tuple[dict[uuid.UUID, PostingEnrichment], int]:
+    """Return the user's enrichments for ``postings``, scoring only what is missing or stale.
+
+    Existing rows are read with a single SELECT. Postings with no enrichment, or
+    whose stored input fingerprint no longer matches, are scored in one batch
+    and written with the same ``INSERT ... ON CONFLICT DO UPDATE`` as
+    ``rescore_users``, so two concurrent reads for one user cannot collide on
+    the unique key. Rows scored against an older profile version are returned
+    as they are while the rescoring job queued by the profile edit may still
+    refresh them (see ``awaiting_rescore``), and rescored here after that.
+    Returns the enrichments keyed by posting id and the number of rows written;
+    the caller owns the commit so a fully fresh page stays read-only.
+    """
+
+    postings = list(postings)
+    if not postings:
+        return {}, 0
+
+    stmt = select(PostingEnrichment).where(
+        PostingEnrichment.user_id == user_id,
+        PostingEnrichment.job_posting_id.in_([posting.id for posting in postings]),
+    )
+    existing = {enrichment.job_posting_id: enrichment for enrichment in session.scalars(stmt)}
+
+    profile = _load_profile(session, user_id)
+    stale: list[tuple[JobPosting, str]] = []
+    for posting in postings:
+        fingerprint = input_fingerprint(profile, posting)
+        enrichment = existing.get(posting.id)
+        if enrichment is None:
+            stale.append((posting, fingerprint))
+        elif enrichment.input_fingerprint != fingerprint and not awaiting_rescore(enrichment, profile):
+            stale.append((posting, fingerprint))
+    if not stale:
+        return existing, 0
+
+    vectors = load_term_vectors(session, [posting.id for posting, _ in stale])
+    results = score_postings(profile, [posting for posting, _ in stale], vectors)
+    rows = [
+        _enrichment_row(user_id, posting.id, result, fingerprint, profile)
+        for (posting, fingerprint), result in zip(stale, results)
+    ]
+    session.execute(_enrichment_upsert(session), rows)
+
+    stmt = (
+        select(PostingEnrichment)
+        .where(
+            PostingEnrichment.user_id == user_id,
+            PostingEnrichment.job_posting_id.in_([posting.id for posting, _ in stale]),
+        )
+        .execution_options(populate_existing=True)
+    )
+    existing.update((enrichment.job_posting_id, enrichment) for enrichment in session.scalars(stmt))
+    return existing, len(stale)
+
+
+def rescore_users(
+    session: Session,
+    user_ids: Iterable[uuid.UUID],
+    postings: Sequence[JobPosting],
+    candidates_only: bool = False,
+) -> int:
+    """Recompute every listed user's enrichment for ``postings`` in one pass.
+
+    All profiles are read with one query, the users x postings block is scored
+    by ``score_block``, and the results are written by executing one
+    ``INSERT ... ON CONFLICT (user_id, job_posting_id) DO UPDATE`` for all rows.
+    Rows whose stored fingerprint and profile version already match are left
+    untouched. With ``candidates_only``, a pair is written only if the posting
+    is one of the user's candidates (see ``is_candidate``); the feed scores any
+    other posting when it is actually shown. Returns the number of user/posting
+    pairs written; the caller owns the commit.
+    """
+
+    user_ids = list(dict.fromkeys(user_ids))
+    postings = list(postings)
+    if not user_ids or not postings:
+        return 0
+
+    stmt = select(Profile).where(Profile.user_id.in_(user_ids))
+    profiles = {profile.user_id: profile for profile in session.scalars(stmt)}
+    block_profiles = [profiles.get(user_id) for user_id in user_ids]
+    vectors = load_term_vectors(session, [posting.id for posting in postings])
+    results = score_block(block_profiles, postings, vectors)
+
+    suffixes = [_posting_fingerprint_suffix(posting) for posting in postings]
+    rows: list[dict[str, object]] = []
+    for user_id, profile, user_results in zip(user_ids, block_profiles, results):
+        prefix = hashlib.sha256(_profile_fingerprint_prefix(profile))
+        for posting, suffix, result in zip(postings, suffixes, user_results):
+            if candidates_only and not is_candidate(result):
+                continue
+            fingerprint = prefix.copy()
+            fingerprint.update(suffix)
+            rows.append(
+                _enrichment_row(user_id, posting.id, result, fingerprint.hexdigest(), profile)
+            )
+
+    if not rows:
+        return 0
+    # One statement executed for every row: compiled once and cached, instead of
+    # rebuilding a multi-row VALUES clause for each batch.
+    session.execute(_enrichment_upsert(session), rows)
+    return len(rows)
+
+
+def _enrichment_row(
+    user_id: uuid.UUID,
+    posting_id: uuid.UUID,
+    result: FitComputation,
+    fingerprint: str,
+    profile: Profile | None,
+) -> dict[str, object]:
+    return {
+        "id": uuid.uuid4(),
+        "user_id": user_id,
+        "job_posting_id": posting_id,
+        "fit_score": result.score,
+        "fit_factors": result.factors,
+        "rationale": _rationale(result),
+        "input_fingerprint": fingerprint,
+        "profile_version": _profile_version(profile),
+    }
+
+
+def _enrichment_upsert(session: Session) -> Insert:
+    # Built on the Table, not the mapped class, so the rows go through a Core
+    # executemany rather than ORM bulk insert, which compiles per parameter set.
+    stmt = dialect_insert(session, cast(Table, PostingEnrichment.__table__))
+    if session.get_bind().dialect.name == "postgresql":
+        conflict: dict[str, object] = {"constraint": "uq_enrichment_user_posting"}
+    else:
+        conflict = {"index_elements": ["user_id", "job_posting_id"]}
+    updates = ("fit_score", "fit_factors", "rationale", "input_fingerprint", "profile_version")
+    return stmt.on_conflict_do_update(
+        set_={column: stmt.excluded[column] for column in updates},
+        where=and_(
+            or_(
+                PostingEnrichment.input_fingerprint.is_distinct_from(stmt.excluded.input_fingerprint),
+                PostingEnrichment.profile_version.is_distinct_from(stmt.excluded.profile_version),
+            ),
+            # A slower rescore for an older profile version must not overwrite a newer one.
+            or_(
+                PostingEnrichment.profile_version.is_(None),
+                stmt.excluded.profile_version.is_(None),
+                PostingEnrichment.profile_version <= stmt.excluded.profile_version,
+            ),
+        ),
+        **conflict,
+    )
+
+
+def rescore_profile_enrichments(
+    session: Session, profile: Profile, chunk_size: int = 200, active_days: int = 30
+) -> int:
+    """Rescore the user's enrichments that were computed against an older profile version.
+
+    Only active postings are covered: ones created or changed within the last
+    ``active_days`` and not hidden by the user. Postings carry no closed flag,
+    so a posting no board has touched in that window is treated as gone; if
+    the feed still shows one, it is rescored there once the rescore grace
+    period has passed. Stale rows are walked in ``job_posting_id`` order,
+    ``chunk_size`` postings at a time, and each chunk is rescored with
+    ``rescore_users`` and committed so the feed sees progress and a failure
+    keeps what was done. Returns the number of enrichments rescored.
+    """
+
+    hidden = exists().where(
+        HiddenPosting.user_id == profile.user_id,
+        HiddenPosting.job_posting_id == PostingEnrichment.job_posting_id,
+    )
+    active_since = datetime.now(UTC) - timedelta(days=active_days)
+    total = 0
+    after: uuid.UUID | None = None
+    while True:
+        stmt = (
+            select(JobPosting)
+            .join(PostingEnrichment, PostingEnrichment.job_posting_id == JobPosting.id)
+            .where(
+                PostingEnrichment.user_id == profile.user_id,
+                or_(
+                    PostingEnrichment.profile_version.is_(None),
+                    PostingEnrichment.profile_version < profile.version,
+                ),
+                JobPosting.updated_at >= active_since,
+                ~hidden,
+            )
+            .order_by(PostingEnrichment.job_posting_id)
+            .limit(chunk_size)
+            .options(selectinload(JobPosting.company))
+        )
+        if after is not None:
+            stmt = stmt.where(PostingEnrichment.job_posting_id > after)
+        postings = list(session.scalars(stmt))
+        if not postings:
+            return total
+        total += rescore_users(session, [profile.user_id], postings)
+        session.commit()
+        after = postings[-1].id
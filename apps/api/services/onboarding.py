@@ -12,7 +12,9 @@ from sqlalchemy.orm import Session
 from apps.api.models import Profile, ResumeVersion, SearchPref, User
 from apps.api.models.enums import PlanTierEnum, StatusEnum
 from apps.api.schemas.onboarding import OnboardingPayload, OnboardingResponse
-from apps.api.services import storage
+from apps.api.services import matching, profile_cache, storage
+from apps.api.services.schedule import reschedule
+from apps.workers.tasks import rescore
 from apps.workers.tasks import resume as resume_tasks
 
 DEFAULT_SEARCH_PREF_NAME = "Daily Digest"
@@ -49,9 +51,12 @@ def upsert_profile(session: Session, user: User, payload: OnboardingPayload) ->
     profile = user.profile
     remote_only = any(location.lower() == "remote" for location in payload.target_locations)
 
+    previous_hash: str | None = None
     if profile is None:
         profile = Profile(user_id=user.id)
         session.add(profile)
+    else:
+        previous_hash = profile_cache.profile_content_hash(profile)
 
     profile.headline = payload.primary_role
     profile.summary = f"{payload.full_name} — {payload.primary_role}"
@@ -62,6 +67,8 @@ def upsert_profile(session: Session, user: User, payload: OnboardingPayload) ->
         "primary_role": payload.primary_role,
         "target_locations": payload.target_locations,
     }
+    if previous_hash is not None:
+        matching.record_profile_change(profile, previous_hash)
 
     session.flush()
     logger.debug("Upserted profile", user_id=str(user.id), profile_id=str(profile.id))
@@ -86,6 +93,7 @@ def ensure_search_pref(session: Session, user: User, payload: OnboardingPayload)
         }
         search_pref.schedule_cron = schedule
         search_pref.timezone = timezone
+        reschedule(search_pref)
         session.flush()
         return search_pref
 
@@ -103,6 +111,7 @@ def ensure_search_pref(session: Session, user: User, payload: OnboardingPayload)
         timezone=timezone,
         last_run_at=None,
     )
+    reschedule(search_pref)
     session.add(search_pref)
     session.flush()
     logger.debug("Created search pref", user_id=str(user.id), search_pref_id=str(search_pref.id))
@@ -132,7 +141,8 @@ def process_onboarding(
     session: Session, payload: OnboardingPayload, resume_file: UploadFile | None = None
 ) -> Tuple[OnboardingResponse, uuid.UUID | None, str | None]:
     user = ensure_user(session, payload)
-    upsert_profile(session, user, payload)
+    previous_version = user.profile.version if user.profile else None
+    profile = upsert_profile(session, user, payload)
     ensure_search_pref(session, user, payload)
 
     resume_id: uuid.UUID | None = None
@@ -149,6 +159,8 @@ def process_onboarding(
             logger.warning("Inline resume parse failed", resume_id=str(resume_id), error=str(exc))
 
     session.commit()
+    if previous_version is not None and profile.version != previous_version:
+        rescore.enqueue_profile_rescore(profile)
 
     response = OnboardingResponse(
         next_step="search_preferences",
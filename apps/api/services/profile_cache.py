@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import Counter, OrderedDict
+from typing import cast
+
+import redis
+from loguru import logger
+
+from apps.api.config import settings
+from apps.api.models import Profile
+
+REDIS_KEY_PREFIX = "vanta:profile-vector:"
+
+
+def profile_content_hash(profile: Profile) -> str:
+    """Hash of the profile fields that make up its matching vector."""
+
+    payload = [profile.headline, profile.summary, profile.skills, profile.locations]
+    encoded = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ProfileVectorCache:
+    """Profile token vectors keyed by content hash.
+
+    Lookups hit a bounded in-process LRU first and, when a Redis client is
+    configured, a shared Redis tier second. Redis failures are logged and
+    treated as misses so scoring never depends on Redis being up.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        redis_client: redis.Redis | None = None,
+        ttl_seconds: int = 86400,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis_client
+        self._entries: OrderedDict[str, Counter[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Counter[str] | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                return vector
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(REDIS_KEY_PREFIX + key)
+        except redis.RedisError as exc:
+            logger.warning("Profile vector cache read failed", error=str(exc))
+            return None
+        if raw is None:
+            return None
+        vector = Counter(json.loads(cast(bytes, raw)))
+        self._remember(key, vector)
+        return vector
+
+    def put(self, key: str, vector: Counter[str]) -> None:
+        self._remember(key, vector)
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(REDIS_KEY_PREFIX + key, json.dumps(vector), ex=self.ttl_seconds)
+        except redis.RedisError as exc:
+            logger.warning("Profile vector cache write failed", error=str(exc))
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._redis is None:
+            return
+        try:
+            self._redis.delete(REDIS_KEY_PREFIX + key)
+        except redis.RedisError as exc:
+            logger.warning("Profile vector cache eviction failed", error=str(exc))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, vector: Counter[str]) -> None:
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+profile_vectors = ProfileVectorCache(
+    maxsize=settings.profile_vector_cache_size,
+    redis_client=redis.Redis.from_url(settings.redis_url) if settings.profile_vector_cache_redis else None,
+    ttl_seconds=settings.profile_vector_cache_ttl_seconds,
+)
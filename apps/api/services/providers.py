@@ -1,63 +1,596 @@
 from __future__ import annotations
 
+import asyncio
+import queue
+import threading
 import time
-from typing import Any
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Generator, Iterable, Iterator
 
 import httpx
 from loguru import logger
 
+from apps.api.config import settings
+from apps.api.models.enums import ProviderEnum
+from apps.api.services import rate_limit
+from apps.api.services.response_cache import CachedResponse, ResponseCache, body_hash
+
+
+GREENHOUSE_BOARD_URL = "https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
+LEVER_POSTINGS_URL = "https://api.lever.co/v0/postings/{board_token}?mode=json&skip=0&limit={limit}"
+LEVER_PAGE_SIZE = 100
+ASHBY_JOB_BOARD_URL = "https://api.ashbyhq.com/posting-api/job-board/{board_token}?includeCompensation=true"
+USER_AGENT = "VantaJobScout/0.1"
+DEFAULT_CONCURRENCY = 20
+# Pages of one board that may wait in memory for the consumer of ``stream_boards``.
+DEFAULT_BUFFERED_PAGES = 2
+
+BoardKey = tuple[ProviderEnum, str]
+
 
 class ProviderError(RuntimeError):
     """Raised when a provider request fails after retries."""
 
 
+def _backoff_seconds(attempt: int) -> float:
+    return 0.5 * (2**attempt)
+
+
+class ProviderAdapter:
+    """One job board source: where a board lives, how it pages, and how jobs normalize.
+
+    Adapters only describe a provider. Requests, retries, pooling, conditional
+    caching and metrics are shared by the fetch functions in this module, so a
+    new source is a subclass plus ``register_provider``.
+    """
+
+    source: ProviderEnum
+    # Search preference filter key holding this provider's board token.
+    filter_key: str
+
+    def board_url(self, board_token: str) -> str:
+        raise NotImplementedError
+
+    def parse_page(self, payload: Any, url: str) -> tuple[list[dict[str, Any]], str | None]:
+        """Split a decoded response into its jobs and the next page URL, if any."""
+
+        raise NotImplementedError
+
+    def normalize(self, raw: dict[str, Any]) -> dict[str, Any]:
+        raise NotImplementedError
+
+
+class GreenhouseAdapter(ProviderAdapter):
+    source = ProviderEnum.GREENHOUSE
+    filter_key = "greenhouse_board_token"
+
+    def board_url(self, board_token: str) -> str:
+        return GREENHOUSE_BOARD_URL.format(board_token=board_token)
+
+    def parse_page(self, payload: Any, url: str) -> tuple[list[dict[str, Any]], str | None]:
+        return payload.get("jobs", []), payload.get("meta", {}).get("next")
+
+    def normalize(self, raw: dict[str, Any]) -> dict[str, Any]:
+        return normalize_greenhouse_posting(raw)
+
+
+class LeverAdapter(ProviderAdapter):
+    """Lever's public postings API returns a bare list paged with ``skip``/``limit``."""
+
+    source = ProviderEnum.LEVER
+    filter_key = "lever_board_token"
+
+    def board_url(self, board_token: str) -> str:
+        return LEVER_POSTINGS_URL.format(board_token=board_token, limit=LEVER_PAGE_SIZE)
+
+    def parse_page(self, payload: Any, url: str) -> tuple[list[dict[str, Any]], str | None]:
+        jobs = payload if isinstance(payload, list) else []
+        current = httpx.URL(url)
+        limit = int(current.params.get("limit", LEVER_PAGE_SIZE))
+        if len(jobs) < limit:
+            return jobs, None
+        skip = int(current.params.get("skip", 0)) + limit
+        return jobs, str(current.copy_set_param("skip", str(skip)))
+
+    def normalize(self, raw: dict[str, Any]) -> dict[str, Any]:
+        return normalize_lever_posting(raw)
+
+
+class AshbyAdapter(ProviderAdapter):
+    """Ashby's posting API returns the whole board in one response."""
+
+    source = ProviderEnum.ASHBY
+    filter_key = "ashby_board_token"
+
+    def board_url(self, board_token: str) -> str:
+        return ASHBY_JOB_BOARD_URL.format(board_token=board_token)
+
+    def parse_page(self, payload: Any, url: str) -> tuple[list[dict[str, Any]], str | None]:
+        jobs = [job for job in payload.get("jobs", []) if job.get("isListed", True)]
+        return jobs, None
+
+    def normalize(self, raw: dict[str, Any]) -> dict[str, Any]:
+        return normalize_ashby_posting(raw)
+
+
+_registry: dict[ProviderEnum, ProviderAdapter] = {}
+
+
+def register_provider(adapter: ProviderAdapter) -> ProviderAdapter:
+    _registry[adapter.source] = adapter
+    return adapter
+
+
+def get_provider(source: ProviderEnum | str) -> ProviderAdapter:
+    try:
+        return _registry[ProviderEnum(source)]
+    except (KeyError, ValueError) as exc:
+        raise ProviderError(f"No job board adapter registered for {source}") from exc
+
+
+def registered_providers() -> list[ProviderAdapter]:
+    return list(_registry.values())
+
+
+register_provider(GreenhouseAdapter())
+register_provider(LeverAdapter())
+register_provider(AshbyAdapter())
+
+
+@dataclass
+class ProviderMetrics:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    not_modified: int = 0
+    jobs: int = 0
+    seconds: float = 0.0
+
+
+_metrics: dict[ProviderEnum, ProviderMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def _record(source: ProviderEnum, **deltas: float) -> None:
+    with _metrics_lock:
+        metrics = _metrics.setdefault(source, ProviderMetrics())
+        for name, delta in deltas.items():
+            setattr(metrics, name, getattr(metrics, name) + delta)
+
+
+def metrics_snapshot() -> dict[str, dict[str, float]]:
+    """Process-wide request counters per provider since start (or ``reset_metrics``)."""
+
+    with _metrics_lock:
+        return {str(source): asdict(metrics) for source, metrics in _metrics.items()}
+
+
+def reset_metrics() -> None:
+    with _metrics_lock:
+        _metrics.clear()
+
+
 def fetch_greenhouse_postings(board_token: str) -> list[dict[str, Any]]:
     """Fetch all jobs for a public Greenhouse board.
 
     Uses basic exponential backoff for transient failures and follows the meta.next
-    cursor implemented by the Greenhouse Board API.
+    cursor implemented by the Greenhouse Board API. Prefer ``iter_greenhouse_pages``
+    when the jobs do not all need to be in memory at once.
+    """
+
+    return [job for page in iter_greenhouse_pages(board_token) for job in page]
+
+
+def iter_greenhouse_pages(board_token: str) -> Iterator[list[dict[str, Any]]]:
+    """Yield a public Greenhouse board one page of jobs at a time."""
+
+    return iter_board_pages(ProviderEnum.GREENHOUSE, board_token)
+
+
+def iter_board_pages(
+    source: ProviderEnum | str, board_token: str, cache: ResponseCache | None = None
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield any registered provider's board one page of raw jobs at a time.
+
+    A single-board ``stream_boards``: with a ``cache`` a board whose every page
+    answers 304 or repeats its last body yields nothing, and a changed board is
+    always yielded in full.
     """
 
-    base_url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
-    jobs: list[dict[str, Any]] = []
+    board = (ProviderEnum(source), board_token)
+    with closing(stream_boards([board], concurrency=1, cache=cache)) as streamed:
+        for _, pages in streamed:
+            yield from pages
+
+
+def _circuit_key(source: ProviderEnum, board_token: str) -> str:
+    return f"{source}:{board_token}"
+
+
+def _retry_wait(response: httpx.Response, attempt: int) -> float | None:
+    """Seconds to back off before retrying a failed response, or ``None`` to give up.
+
+    A 429 holds the whole host in the shared rate limiter until its
+    ``Retry-After`` passes, so every worker slows down rather than only this
+    request; waits longer than ``provider_max_retry_after_seconds`` are not
+    retried in-line.
+    """
+
+    if response.status_code == 429:
+        delay = rate_limit.parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = _backoff_seconds(attempt)
+        rate_limit.provider_limiter.defer(response.request.url.host, delay)
+        return 0.0 if delay <= settings.provider_max_retry_after_seconds else None
+    if response.status_code >= 500:
+        return _backoff_seconds(attempt)
+    return None
+
+
+async def fetch_boards(
+    boards: Iterable[BoardKey],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: httpx.AsyncBaseTransport | None = None,
+    cache: ResponseCache | None = None,
+) -> dict[BoardKey, list[dict[str, Any]]]:
+    """Fetch boards from any mix of providers concurrently over one pooled ``httpx.AsyncClient``.
+
+    At most ``concurrency`` boards are in flight at once and keep-alive
+    connections are shared across boards. Every request also waits on the
+    per-host token bucket in ``rate_limit``. Boards that fail after retries,
+    or whose circuit is open after repeated failures, are logged and left out
+    of the result rather than failing the whole batch.
+
+    With a ``cache``, requests are conditional (``If-None-Match`` /
+    ``If-Modified-Since``) and boards whose every page answers 304 or returns a
+    body identical to the last fetch are also left out, so callers skip
+    normalization and upsert for them.
+    """
+
+    keys = list(dict.fromkeys((ProviderEnum(source), token) for source, token in boards))
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT}, limits=limits, timeout=10, transport=transport
+    ) as client:
+
+        async def fetch_board(key: BoardKey) -> list[dict[str, Any]] | None:
+            circuit = _circuit_key(*key)
+            if not rate_limit.board_breaker.allow(circuit):
+                raise ProviderError(f"Circuit open for {circuit}")
+            async with semaphore:
+                try:
+                    jobs = await _fetch_board_async(client, get_provider(key[0]), key[1], cache)
+                except ProviderError:
+                    rate_limit.board_breaker.record_failure(circuit)
+                    raise
+            rate_limit.board_breaker.record_success(circuit)
+            return jobs
 
-    with httpx.Client(headers={"User-Agent": "VantaJobScout/0.1"}) as client:
-        next_url: str | None = base_url
-        while next_url:
-            logger.debug("Fetching Greenhouse payload", url=next_url)
-            payload = _request_with_backoff(client, next_url)
-            jobs.extend(payload.get("jobs", []))
-            next_url = payload.get("meta", {}).get("next")
+        results = await asyncio.gather(*(fetch_board(key) for key in keys), return_exceptions=True)
 
-    return jobs
+    fetched: dict[BoardKey, list[dict[str, Any]]] = {}
+    for (source, token), result in zip(keys, results):
+        if isinstance(result, BaseException):
+            logger.warning("Board fetch failed", provider=source, board_token=token, error=str(result))
+            continue
+        if result is None:
+            logger.debug("Board unchanged", provider=source, board_token=token)
+            continue
+        fetched[(source, token)] = result
+    logger.info("Provider fetch completed", boards=len(keys), changed=len(fetched), metrics=metrics_snapshot())
+    return fetched
 
 
-def _request_with_backoff(client: httpx.Client, url: str, retries: int = 3) -> dict[str, Any]:
+def fetch_boards_sync(
+    boards: Iterable[BoardKey],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: httpx.AsyncBaseTransport | None = None,
+    cache: ResponseCache | None = None,
+) -> dict[BoardKey, list[dict[str, Any]]]:
+    """Blocking entrypoint to ``fetch_boards`` for Celery tasks."""
+
+    return asyncio.run(fetch_boards(boards, concurrency=concurrency, transport=transport, cache=cache))
+
+
+def stream_boards(
+    boards: Iterable[BoardKey],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: httpx.AsyncBaseTransport | None = None,
+    cache: ResponseCache | None = None,
+    buffered_pages: int = DEFAULT_BUFFERED_PAGES,
+) -> Generator[tuple[BoardKey, Iterator[list[dict[str, Any]]]], None, None]:
+    """Fetch boards as ``fetch_boards`` does, but hand each one over page by page.
+
+    The fetches run concurrently on one pooled ``httpx.AsyncClient`` in a
+    background event loop, while the caller consumes boards one at a time from
+    this blocking generator. Each board's pages pass through a queue of at most
+    ``buffered_pages`` pages, so a fetch waits for the caller rather than
+    holding its board in memory. Boards are yielded as their first page
+    arrives, together with an iterator over their pages that raises
+    ``ProviderError`` if the board fails part way; pages already handed over
+    stay valid. Boards the cache proves unchanged are not yielded. Closing the
+    generator early stops the remaining fetches.
+    """
+
+    keys = list(dict.fromkeys((ProviderEnum(source), token) for source, token in boards))
+    ready: queue.Queue[tuple[BoardKey, queue.Queue[Any]] | None] = queue.Queue()
+    stop = threading.Event()
+    feeder = threading.Thread(
+        target=asyncio.run,
+        args=(_feed_boards(keys, ready, stop, concurrency, transport, cache, buffered_pages),),
+        name="board-fetch",
+        daemon=True,
+    )
+    feeder.start()
+    try:
+        while (item := ready.get()) is not None:
+            key, pages = item
+            board_pages = _queued_pages(pages)
+            yield key, board_pages
+            # Whatever the caller left unread is drained so the fetch can finish.
+            for _ in _skip_failure(board_pages):
+                pass
+    finally:
+        stop.set()
+        feeder.join()
+
+
+class _Stopped(Exception):
+    """The consumer of ``stream_boards`` went away; the fetch is abandoned."""
+
+
+_END_OF_BOARD = object()
+
+
+def _queued_pages(pages: queue.Queue[Any]) -> Iterator[list[dict[str, Any]]]:
+    while (item := pages.get()) is not _END_OF_BOARD:
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def _skip_failure(pages: Iterator[list[dict[str, Any]]]) -> Iterator[list[dict[str, Any]]]:
+    try:
+        yield from pages
+    except ProviderError:
+        return
+
+
+async def _put_until_stopped(pages: queue.Queue[Any], item: Any, stop: threading.Event) -> None:
+    # Poll rather than block a worker thread on ``put``: a full queue of a board the
+    # consumer has not reached yet must not starve the thread pool of the one it is reading.
+    while True:
+        try:
+            pages.put_nowait(item)
+            return
+        except queue.Full:
+            if stop.is_set():
+                raise _Stopped from None
+            await asyncio.sleep(0.05)
+
+
+async def _feed_boards(
+    keys: list[BoardKey],
+    ready: queue.Queue[tuple[BoardKey, queue.Queue[Any]] | None],
+    stop: threading.Event,
+    concurrency: int,
+    transport: httpx.AsyncBaseTransport | None,
+    cache: ResponseCache | None,
+    buffered_pages: int,
+) -> None:
+    """Producer side of ``stream_boards``; always ends by putting ``None`` on ``ready``."""
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT}, limits=limits, timeout=10, transport=transport
+        ) as client:
+
+            async def feed(key: BoardKey) -> None:
+                pages: queue.Queue[Any] = queue.Queue(maxsize=buffered_pages)
+                announced = False
+
+                async def hand_over(item: Any) -> None:
+                    nonlocal announced
+                    if not announced:
+                        ready.put((key, pages))
+                        announced = True
+                    await _put_until_stopped(pages, item, stop)
+
+                circuit = _circuit_key(*key)
+                try:
+                    if not rate_limit.board_breaker.allow(circuit):
+                        raise ProviderError(f"Circuit open for {circuit}")
+                    async with semaphore:
+                        if stop.is_set():
+                            return
+                        try:
+                            adapter = get_provider(key[0])
+                            async for page in _iter_changed_pages(client, adapter, key[1], cache):
+                                await hand_over(page)
+                        except ProviderError:
+                            rate_limit.board_breaker.record_failure(circuit)
+                            raise
+                    rate_limit.board_breaker.record_success(circuit)
+                except _Stopped:
+                    return
+                except ProviderError as exc:
+                    await hand_over(exc)
+                    return
+                except Exception as exc:
+                    # As in ``fetch_boards``, any failure only fails this board.
+                    error = ProviderError(f"{key[0]} fetch failed: {exc}")
+                    error.__cause__ = exc
+                    await hand_over(error)
+                    return
+                if announced:
+                    await hand_over(_END_OF_BOARD)
+                else:
+                    logger.debug("Board unchanged", provider=key[0], board_token=key[1])
+
+            await asyncio.gather(*(feed(key) for key in keys), return_exceptions=True)
+        logger.info("Provider fetch completed", boards=len(keys), metrics=metrics_snapshot())
+    finally:
+        ready.put(None)
+
+
+async def fetch_greenhouse_boards(
+    board_tokens: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: httpx.AsyncBaseTransport | None = None,
+    cache: ResponseCache | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """``fetch_boards`` for Greenhouse board tokens, keyed by token."""
+
+    fetched = await fetch_boards(
+        ((ProviderEnum.GREENHOUSE, token) for token in board_tokens),
+        concurrency=concurrency,
+        transport=transport,
+        cache=cache,
+    )
+    return {token: jobs for (_, token), jobs in fetched.items()}
+
+
+def fetch_greenhouse_boards_sync(
+    board_tokens: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: httpx.AsyncBaseTransport | None = None,
+    cache: ResponseCache | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Blocking entrypoint to ``fetch_greenhouse_boards`` for Celery tasks."""
+
+    return asyncio.run(
+        fetch_greenhouse_boards(board_tokens, concurrency=concurrency, transport=transport, cache=cache)
+    )
+
+
+async def _fetch_board_async(
+    client: httpx.AsyncClient,
+    adapter: ProviderAdapter,
+    board_token: str,
+    cache: ResponseCache | None = None,
+) -> list[dict[str, Any]] | None:
+    """Walk every page of a board; ``None`` means the cache proved it unchanged."""
+
+    pages = [page async for page in _iter_changed_pages(client, adapter, board_token, cache)]
+    if not pages:
+        return None
+    return [job for page in pages for job in page]
+
+
+async def _iter_changed_pages(
+    client: httpx.AsyncClient,
+    adapter: ProviderAdapter,
+    board_token: str,
+    cache: ResponseCache | None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield a board's pages, or nothing if ``cache`` proves every page unchanged.
+
+    Requests are conditional until a page turns out to have changed. From then
+    on the board is yielded in full: the unchanged pages before it are
+    refetched, and later pages are fetched unconditionally. New validators are
+    only stored once the whole board has been read, so a board that fails
+    halfway is fetched in full next time.
+    """
+
+    fresh: dict[str, CachedResponse] = {}
+    # Unchanged pages seen before the first changed one; refetched if the board changed.
+    held_back: list[str] = []
+    changed = cache is None
+    next_url: str | None = adapter.board_url(board_token)
+    while next_url:
+        logger.debug("Fetching provider payload", provider=adapter.source, url=next_url)
+        # The cache may be Redis-backed; keep its round trips off the event loop.
+        cached = await asyncio.to_thread(cache.get, next_url) if cache is not None else None
+        headers = cached.conditional_headers() if cached is not None and not changed else None
+        response = await _request_with_backoff_async(client, next_url, adapter.source, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            _record(adapter.source, not_modified=1)
+            held_back.append(next_url)
+            next_url = cached.next_url
+            continue
+
+        jobs, page_next = adapter.parse_page(response.json(), next_url)
+        if cache is not None:
+            entry = CachedResponse(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=body_hash(response.content),
+                next_url=page_next,
+            )
+            fresh[next_url] = entry
+            changed = changed or cached is None or cached.body_hash != entry.body_hash
+        if not changed:
+            held_back.append(next_url)
+        else:
+            for url in held_back:
+                earlier = (await _request_with_backoff_async(client, url, adapter.source)).json()
+                earlier_jobs = adapter.parse_page(earlier, url)[0]
+                _record(adapter.source, jobs=len(earlier_jobs))
+                yield earlier_jobs
+            held_back.clear()
+            _record(adapter.source, jobs=len(jobs))
+            yield jobs
+        next_url = page_next
+
+    if cache is not None:
+        for url, entry in fresh.items():
+            await asyncio.to_thread(cache.put, url, entry)
+
+
+async def _request_with_backoff_async(
+    client: httpx.AsyncClient,
+    url: str,
+    source: ProviderEnum = ProviderEnum.GREENHOUSE,
+    retries: int = 3,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    host = httpx.URL(url).host
     for attempt in range(retries + 1):
+        # The limiter may be Redis-backed; keep its round trips off the event loop.
+        await asyncio.sleep(await asyncio.to_thread(rate_limit.provider_limiter.reserve, host))
+        started = time.perf_counter()
         try:
-            response = client.get(url, timeout=10)
+            response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                return response
             response.raise_for_status()
-            return response.json()
+            return response
         except httpx.HTTPStatusError as exc:
-            should_retry = exc.response.status_code >= 500 and attempt < retries
+            wait = await asyncio.to_thread(_retry_wait, exc.response, attempt)
             logger.warning(
-                "Greenhouse request failed",
+                "Provider request failed",
+                provider=source,
                 status=exc.response.status_code,
                 url=url,
                 attempt=attempt,
-                retrying=should_retry,
+                retrying=wait is not None and attempt < retries,
             )
-            if should_retry:
-                time.sleep(0.5 * (2**attempt))
+            if wait is not None and attempt < retries:
+                _record(source, retries=1)
+                await asyncio.sleep(wait)
                 continue
-            raise ProviderError(f"Greenhouse returned {exc.response.status_code}") from exc
+            _record(source, failures=1)
+            raise ProviderError(f"{source} returned {exc.response.status_code}") from exc
         except httpx.RequestError as exc:
-            logger.warning("Greenhouse network error", error=str(exc), attempt=attempt)
+            logger.warning("Provider network error", provider=source, error=str(exc), attempt=attempt)
             if attempt < retries:
-                time.sleep(0.5 * (2**attempt))
+                _record(source, retries=1)
+                await asyncio.sleep(_backoff_seconds(attempt))
                 continue
-            raise ProviderError("Failed to reach Greenhouse") from exc
-    raise ProviderError("Exhausted retries talking to Greenhouse")
+            _record(source, failures=1)
+            raise ProviderError(f"Failed to reach {source}") from exc
+        finally:
+            _record(source, requests=1, seconds=time.perf_counter() - started)
+    raise ProviderError(f"Exhausted retries talking to {source}")
+
+
+def _is_remote(*values: Any) -> bool:
+    return any(isinstance(value, str) and "remote" in value.lower() for value in values)
 
 
 def normalize_greenhouse_posting(raw: dict[str, Any]) -> dict[str, Any]:
@@ -91,3 +624,65 @@ def normalize_greenhouse_posting(raw: dict[str, Any]) -> dict[str, Any]:
             "domain": company.get("url") if isinstance(company, dict) else None,
         },
     }
+
+
+def normalize_lever_posting(raw: dict[str, Any]) -> dict[str, Any]:
+    categories = raw.get("categories") or {}
+    location_name = categories.get("location")
+    departments = [name for name in (categories.get("department"), categories.get("team")) if name]
+
+    salary = raw.get("salaryRange") or {}
+    salary_min = salary.get("min") if isinstance(salary.get("min"), (int, float)) else None
+    salary_max = salary.get("max") if isinstance(salary.get("max"), (int, float)) else None
+
+    return {
+        "source": "lever",
+        "source_id": str(raw.get("id")),
+        "title": raw.get("text") or "Untitled",
+        "url": raw.get("hostedUrl") or raw.get("applyUrl") or "",
+        "location_raw": location_name,
+        "is_remote": raw.get("workplaceType") == "remote" or _is_remote(location_name),
+        "metadata_json": {
+            "departments": departments,
+            "offices": categories.get("allLocations") or [],
+        },
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": salary.get("currency") or "USD",
+        "company": {"name": None, "domain": None},
+    }
+
+
+def normalize_ashby_posting(raw: dict[str, Any]) -> dict[str, Any]:
+    location_name = raw.get("location")
+    departments = [name for name in (raw.get("department"), raw.get("team")) if name]
+    offices = [entry.get("location") for entry in raw.get("secondaryLocations") or [] if entry.get("location")]
+
+    compensation = raw.get("compensation") or {}
+    salary: dict[str, Any] = next(
+        (
+            component
+            for component in compensation.get("summaryComponents") or []
+            if component.get("compensationType") == "Salary"
+        ),
+        {},
+    )
+    salary_min = salary.get("minValue") if isinstance(salary.get("minValue"), (int, float)) else None
+    salary_max = salary.get("maxValue") if isinstance(salary.get("maxValue"), (int, float)) else None
+
+    return {
+        "source": "ashby",
+        "source_id": str(raw.get("id")),
+        "title": raw.get("title") or "Untitled",
+        "url": raw.get("jobUrl") or raw.get("applyUrl") or "",
+        "location_raw": location_name,
+        "is_remote": bool(raw.get("isRemote")) or _is_remote(location_name, raw.get("workplaceType")),
+        "metadata_json": {
+            "departments": departments,
+            "offices": offices,
+        },
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": salary.get("currencyCode") or "USD",
+        "company": {"name": None, "domain": None},
+    }
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import cast
+
+import redis
+from loguru import logger
+
+from apps.api.config import settings
+
+REDIS_KEY_PREFIX = "vanta:rate-limit:"
+
+# Reserve one token from a host bucket, letting the balance go negative so
+# concurrent callers queue up behind each other. Returns the seconds to wait.
+_RESERVE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'blocked_until')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+local blocked_until = tonumber(state[3]) or 0
+tokens = math.min(capacity, tokens + (now - ts) * rate) - 1
+local wait = math.max(0, -tokens / rate, blocked_until - now)
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate + wait) + 60)
+return tostring(wait)
+"""
+
+_DEFER_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local until_ts = now + tonumber(ARGV[1])
+local current = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+if until_ts > current then
+  redis.call('HSET', KEYS[1], 'blocked_until', until_ts)
+end
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[1])) + 60)
+return 1
+"""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return max(0.0, (moment - datetime.now(UTC)).total_seconds())
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+
+
+class HostRateLimiter:
+    """Token bucket per host: ``rate`` requests per second with bursts up to ``capacity``.
+
+    With a Redis client the bucket is shared by every worker process; Redis
+    failures are logged and the process-local bucket is used instead, so a Redis
+    outage degrades to per-process limiting rather than stopping fetches.
+    """
+
+    def __init__(
+        self, rate: float = 10.0, capacity: float = 20.0, redis_client: redis.Redis | None = None
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._redis = redis_client
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str) -> float:
+        """Take a token for ``host`` and return how many seconds to wait before using it."""
+
+        if self._redis is not None:
+            try:
+                # A sync client returns the script's string result directly.
+                wait = self._redis.eval(
+                    _RESERVE_SCRIPT, 1, REDIS_KEY_PREFIX + host, str(self.rate), str(self.capacity)
+                )
+                return float(cast(str, wait))
+            except redis.RedisError as exc:
+                logger.warning("Shared rate limiter unavailable", host=host, error=str(exc))
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(host, _Bucket(tokens=self.capacity, updated=now))
+            bucket.tokens = (
+                min(self.capacity, bucket.tokens + (now - bucket.updated) * self.rate) - 1
+            )
+            bucket.updated = now
+            return max(0.0, -bucket.tokens / self.rate, bucket.blocked_until - now)
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold every request to ``host`` for ``seconds`` (a provider's ``Retry-After``)."""
+
+        if self._redis is not None:
+            try:
+                self._redis.eval(_DEFER_SCRIPT, 1, REDIS_KEY_PREFIX + host, str(seconds))
+            except redis.RedisError as exc:
+                logger.warning("Shared rate limiter unavailable", host=host, error=str(exc))
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(host, _Bucket(tokens=self.capacity, updated=now))
+            bucket.blocked_until = max(bucket.blocked_until, now + seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: float | None = None
+
+
+class CircuitBreaker:
+    """Stop calling a key (e.g. one board) after ``threshold`` consecutive failures.
+
+    An open circuit rejects calls for ``reset_seconds``; after that one trial
+    call is let through, closing the circuit on success and reopening it on
+    failure.
+    """
+
+    def __init__(self, threshold: int = 5, reset_seconds: float = 300.0) -> None:
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.opened_at is None:
+                return True
+            if time.monotonic() - circuit.opened_at < self.reset_seconds:
+                return False
+            # Half-open: let this call through and hold others until it reports back.
+            circuit.opened_at = time.monotonic()
+            return True
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.failures >= self.threshold:
+                if circuit.opened_at is None:
+                    logger.warning("Circuit opened", key=key, failures=circuit.failures)
+                circuit.opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+
+provider_limiter = HostRateLimiter(
+    rate=settings.provider_rate_limit_per_second,
+    capacity=settings.provider_rate_limit_burst,
+    redis_client=redis.Redis.from_url(settings.redis_url)
+    if settings.provider_rate_limit_redis
+    else None,
+)
+board_breaker = CircuitBreaker(
+    threshold=settings.provider_circuit_failure_threshold,
+    reset_seconds=settings.provider_circuit_reset_seconds,
+)
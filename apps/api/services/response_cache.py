@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import cast
+
+import redis
+from loguru import logger
+
+from apps.api.config import settings
+
+REDIS_KEY_PREFIX = "vanta:provider-response:"
+
+
+def body_hash(content: bytes) -> str:
+    """Hash of a raw response body, used when a provider sends no validators."""
+
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Validators and body hash recorded for one provider URL."""
+
+    etag: str | None
+    last_modified: str | None
+    body_hash: str
+    next_url: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _board_base(url: str) -> str:
+    return url.split("?", 1)[0]
+
+
+class ResponseCache:
+    """Provider response validators keyed by URL.
+
+    Only validators and hashes are kept, never bodies, so a cached board costs a
+    few hundred bytes regardless of how many jobs it lists. With a Redis client
+    the entries live in Redis only, one hash per board, so every worker process
+    (Celery prefork children included) sees the validators the previous cycle
+    stored and a board forgotten by one process is forgotten for all. Without
+    one they sit in a bounded in-process LRU, which only pays off for a single
+    long-lived worker process. Redis failures are logged and treated as misses,
+    which costs a full fetch, never a skipped board.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        redis_client: redis.Redis | None = None,
+        ttl_seconds: int = 7 * 86400,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis_client
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> CachedResponse | None:
+        if self._redis is not None:
+            try:
+                raw = self._redis.hget(REDIS_KEY_PREFIX + _board_base(url), url)
+            except redis.RedisError as exc:
+                logger.warning("Provider response cache read failed", error=str(exc))
+                return None
+            return CachedResponse(**json.loads(cast(bytes, raw))) if raw is not None else None
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def put(self, url: str, entry: CachedResponse) -> None:
+        if self._redis is not None:
+            key = REDIS_KEY_PREFIX + _board_base(url)
+            try:
+                with self._redis.pipeline() as pipe:
+                    pipe.hset(key, url, json.dumps(asdict(entry)))
+                    pipe.expire(key, self.ttl_seconds)
+                    pipe.execute()
+            except redis.RedisError as exc:
+                logger.warning("Provider response cache write failed", error=str(exc))
+            return
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def forget_board(self, board_url: str) -> None:
+        """Drop the entries for every page of the board at ``board_url`` (any query string)."""
+
+        base = _board_base(board_url)
+        if self._redis is not None:
+            try:
+                self._redis.delete(REDIS_KEY_PREFIX + base)
+            except redis.RedisError as exc:
+                logger.warning("Provider response cache eviction failed", error=str(exc))
+            return
+        with self._lock:
+            for url in [url for url in self._entries if _board_base(url) == base]:
+                del self._entries[url]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+provider_responses = ResponseCache(
+    maxsize=settings.provider_response_cache_size,
+    redis_client=redis.Redis.from_url(settings.redis_url)
+    if settings.provider_response_cache_redis
+    else None,
+    ttl_seconds=settings.provider_response_cache_ttl_seconds,
+)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from loguru import logger
+
+from apps.api.models import SearchPref
+
+# How far ahead to look for a matching day before declaring a schedule
+# unsatisfiable (e.g. "0 0 30 2 *"). Covers leap-day schedules.
+_SEARCH_DAYS = 366 * 5
+
+# Stored as ``next_run_at`` for a schedule that cannot be interpreted: it is
+# never due, and unlike an empty value it is not picked up again as unscheduled.
+UNSCHEDULABLE = datetime(9999, 12, 31, tzinfo=UTC)
+
+_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_MONTH_NAMES = {
+    name: index
+    for index, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+_WEEKDAY_NAMES = {
+    name: index for index, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+
+
+class InvalidScheduleError(ValueError):
+    """Raised for a cron expression or timezone the scheduler cannot interpret."""
+
+
+def load_timezone(name: str) -> ZoneInfo:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise InvalidScheduleError(f"Unknown timezone: {name}") from exc
+
+
+def _parse_field(
+    text: str, low: int, high: int, names: dict[str, int] | None = None
+) -> tuple[frozenset[int], bool]:
+    """Expand one cron field into its values; also report whether it restricts anything."""
+
+    def value(token: str) -> int:
+        token = token.lower()
+        if names and token in names:
+            return names[token]
+        if not token.isdigit():
+            raise InvalidScheduleError(f"Invalid cron value: {token}")
+        number = int(token)
+        if not low <= number <= high:
+            raise InvalidScheduleError(f"Cron value {number} outside {low}-{high}")
+        return number
+
+    values: set[int] = set()
+    for part in text.split(","):
+        span, _, step_text = part.partition("/")
+        step = value(step_text) if step_text else 1
+        if step < 1:
+            raise InvalidScheduleError(f"Invalid cron step: {part}")
+        if span == "*":
+            start, end = low, high
+        elif "-" in span:
+            start_text, _, end_text = span.partition("-")
+            start, end = value(start_text), value(end_text)
+        else:
+            start = value(span)
+            end = high if step_text else start
+        if start > end:
+            raise InvalidScheduleError(f"Invalid cron range: {part}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values), text != "*"
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """A standard five-field cron expression (minute hour day-of-month month day-of-week)."""
+
+    minutes: tuple[int, ...]
+    hours: tuple[int, ...]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    day_restricted: bool
+    weekday_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> CronSchedule:
+        fields = _ALIASES.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise InvalidScheduleError(f"Cron expression needs 5 fields: {expression!r}")
+        minutes, _ = _parse_field(fields[0], 0, 59)
+        hours, _ = _parse_field(fields[1], 0, 23)
+        days, day_restricted = _parse_field(fields[2], 1, 31)
+        months, _ = _parse_field(fields[3], 1, 12, _MONTH_NAMES)
+        weekdays, weekday_restricted = _parse_field(fields[4], 0, 7, _WEEKDAY_NAMES)
+        return cls(
+            minutes=tuple(sorted(minutes)),
+            hours=tuple(sorted(hours)),
+            days=days,
+            months=months,
+            # Both 0 and 7 mean Sunday.
+            weekdays=frozenset(day % 7 for day in weekdays),
+            day_restricted=day_restricted,
+            weekday_restricted=weekday_restricted,
+        )
+
+    def matches_day(self, day: date) -> bool:
+        if day.month not in self.months:
+            return False
+        in_days = day.day in self.days
+        in_weekdays = day.isoweekday() % 7 in self.weekdays
+        # Classic cron: when both day fields are restricted, either may match.
+        if self.day_restricted and self.weekday_restricted:
+            return in_days or in_weekdays
+        return in_days and in_weekdays
+
+    def next_after(self, after: datetime, tz: ZoneInfo) -> datetime:
+        """First fire time strictly after ``after``, evaluated in ``tz`` and returned in UTC."""
+
+        after = after if after.tzinfo else after.replace(tzinfo=UTC)
+        day = after.astimezone(tz).date()
+        for _ in range(_SEARCH_DAYS):
+            if self.matches_day(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        candidate = datetime.combine(day, time(hour, minute), tzinfo=tz).astimezone(
+                            UTC
+                        )
+                        if candidate > after:
+                            return candidate
+            day += timedelta(days=1)
+        raise InvalidScheduleError("Cron expression never fires")
+
+
+def validate_schedule(expression: str, timezone: str) -> None:
+    CronSchedule.parse(expression).next_after(datetime.now(UTC), load_timezone(timezone))
+
+
+def next_run_at(expression: str, timezone: str, after: datetime) -> datetime:
+    """Next time a search preference with this cron and timezone is due, in UTC."""
+
+    return CronSchedule.parse(expression).next_after(after, load_timezone(timezone))
+
+
+def reschedule(pref: SearchPref, after: datetime | None = None) -> None:
+    """Set ``pref.next_run_at`` to its next fire time after ``after`` (default: now).
+
+    A schedule that cannot be interpreted is parked at ``UNSCHEDULABLE``, so the
+    preference is never picked up as due until its schedule is edited.
+    """
+
+    try:
+        pref.next_run_at = next_run_at(
+            pref.schedule_cron, pref.timezone, after or datetime.now(UTC)
+        )
+    except InvalidScheduleError as exc:
+        logger.warning(
+            "Unschedulable search preference", search_pref_id=str(pref.id), error=str(exc)
+        )
+        pref.next_run_at = UNSCHEDULABLE
+
+
+def upcoming_run(pref: SearchPref) -> datetime | None:
+    """``pref.next_run_at``, or ``None`` when it has no interpretable schedule."""
+
+    run_at = pref.next_run_at
+    if run_at is None or run_at.replace(tzinfo=None) >= UNSCHEDULABLE.replace(tzinfo=None):
+        return None
+    return run_at
@@ -0,0 +1,180 @@
+"""Deterministic synthetic postings and profiles for benchmarks and seeding.
+
+The same ``seed`` always yields the same data, so runs on different machines
+or commits are comparable. Job descriptions are drawn around 450 words (80 to
+1,500), roughly the spread of real Greenhouse and Lever postings.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from apps.api.models import Company, JobPosting, Profile, User
+from apps.api.models.enums import PlanTierEnum, ProviderEnum, StatusEnum
+from apps.api.services import matching
+
+# fmt: off
+SKILLS = [
+    "python", "go", "java", "kotlin", "typescript", "javascript", "react", "vue", "node",
+    "rust", "c++", "sql", "postgres", "mysql", "redis", "kafka", "spark", "airflow", "dbt",
+    "aws", "gcp", "azure", "kubernetes", "docker", "terraform", "linux", "graphql", "grpc",
+    "django", "fastapi", "flask", "rails", "swift", "android", "ios", "pandas", "pytorch",
+    "tensorflow", "statistics", "figma", "design", "product", "analytics", "security",
+    "networking", "observability", "ci", "testing", "leadership", "mentoring",
+]
+ROLES = [
+    "Backend Engineer", "Frontend Engineer", "Full Stack Engineer", "Data Engineer",
+    "Data Scientist", "Machine Learning Engineer", "Platform Engineer", "Site Reliability Engineer",
+    "Security Engineer", "Mobile Engineer", "Product Designer", "Product Manager",
+    "Engineering Manager", "Analytics Engineer", "DevOps Engineer",
+]
+SENIORITY = ["", "Junior", "Senior", "Staff", "Principal", "Lead"]
+LOCATIONS = [
+    "Remote", "New York, NY", "San Francisco, CA", "Toronto, ON", "London, UK", "Berlin, Germany",
+    "Austin, TX", "Seattle, WA", "Chicago, IL", "Amsterdam, Netherlands",
+]
+COMPANY_WORDS = [
+    "Acme", "Northwind", "Globex", "Initech", "Umbrella", "Hooli", "Vandelay", "Stark", "Wayne",
+    "Tyrell", "Soylent", "Cyberdyne", "Aperture", "Massive", "Dynamic", "Pied", "Piper", "Blue",
+]
+FILLER = (
+    "we are looking for an engineer to join our team and help build reliable scalable systems "
+    "you will work closely with product design and data partners to ship features customers love "
+    "our stack is modern and we care about code quality testing observability and operational "
+    "excellence you will own services end to end from design through deployment and on call "
+    "experience with distributed systems cloud infrastructure and mentoring is a plus we offer "
+    "competitive salary equity flexible hours health benefits and a generous learning budget"
+).split()
+# fmt: on
+
+JD_MEAN_WORDS = 450
+JD_STDDEV_WORDS = 180
+JD_MIN_WORDS = 80
+JD_MAX_WORDS = 1500
+
+
+@dataclass
+class SeededData:
+    user_ids: list[uuid.UUID]
+    posting_ids: list[uuid.UUID]
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _job_description(rng: random.Random, skills: list[str]) -> str:
+    words = int(min(JD_MAX_WORDS, max(JD_MIN_WORDS, rng.gauss(JD_MEAN_WORDS, JD_STDDEV_WORDS))))
+    # Roughly one word in twelve is a skill, weighted towards the posting's own tags.
+    vocabulary = skills * 4 + SKILLS
+    return " ".join(
+        rng.choice(vocabulary) if rng.random() < 1 / 12 else rng.choice(FILLER)
+        for _ in range(words)
+    )
+
+
+def make_companies(count: int, seed: int = 0) -> list[Company]:
+    rng = random.Random(f"companies:{seed}")
+    companies = []
+    for index in range(count):
+        name = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} {index}"
+        companies.append(
+            Company(id=_uuid(rng), name=name, domain=f"{name.lower().replace(' ', '-')}.example")
+        )
+    return companies
+
+
+def make_postings(
+    count: int, seed: int = 0, companies: list[Company] | None = None, start: int = 0
+) -> list[JobPosting]:
+    """Postings ``start`` to ``start + count`` of the ``seed`` stream, with ids assigned.
+
+    Each posting is drawn from its own generator, so the stream can be produced
+    in batches. Postings are attached to ``companies`` when given.
+    """
+
+    postings = []
+    for index in range(start, start + count):
+        rng = random.Random(f"postings:{seed}:{index}")
+        tags = rng.sample(SKILLS, rng.randint(2, 8))
+        title = " ".join(filter(None, [rng.choice(SENIORITY), rng.choice(ROLES)]))
+        location = rng.choice(LOCATIONS)
+        postings.append(
+            JobPosting(
+                id=_uuid(rng),
+                company=rng.choice(companies) if companies else None,
+                source=ProviderEnum.GREENHOUSE,
+                source_id=f"bench-{seed}-{index}",
+                url=f"https://boards.example/jobs/{seed}-{index}",
+                title=title,
+                jd_clean=_job_description(rng, tags),
+                location=location,
+                remote_flag=location == "Remote" or rng.random() < 0.2,
+                normalized_tags=tags,
+            )
+        )
+    return postings
+
+
+def make_profiles(count: int, seed: int = 0) -> list[Profile]:
+    """``count`` profiles, each owned by its own (unsaved) user."""
+
+    rng = random.Random(f"profiles:{seed}")
+    profiles = []
+    for index in range(count):
+        skills = rng.sample(SKILLS, rng.randint(3, 12))
+        role = rng.choice(ROLES)
+        user = User(
+            id=_uuid(rng),
+            email=f"bench-{seed}-{index}@example.com",
+            plan_tier=PlanTierEnum.FREE,
+            status=StatusEnum.ACTIVE,
+        )
+        profiles.append(
+            Profile(
+                id=_uuid(rng),
+                user=user,
+                user_id=user.id,
+                headline=f"{rng.choice(SENIORITY)} {role}".strip(),
+                summary=f"{role} working with {', '.join(skills[:4])}.",
+                skills=skills,
+                locations=rng.sample(LOCATIONS, rng.randint(1, 3)),
+                years_experience=rng.randint(0, 20),
+                version=1,
+            )
+        )
+    return profiles
+
+
+def seed_database(
+    session: Session, postings: int, profiles: int, seed: int = 0, batch_size: int = 1000
+) -> SeededData:
+    """Insert users, profiles, companies and postings (with term vectors) and commit."""
+
+    companies = make_companies(max(1, postings // 20), seed)
+    company_ids = [company.id for company in companies]
+    session.add_all(companies)
+    generated_profiles = make_profiles(profiles, seed)
+    user_ids = [profile.user_id for profile in generated_profiles]
+    session.add_all(generated_profiles)
+    session.commit()
+    session.expunge_all()
+
+    posting_ids: list[uuid.UUID] = []
+    for start in range(0, postings, batch_size):
+        batch = make_postings(min(batch_size, postings - start), seed, start=start)
+        for index, posting in enumerate(batch, start=start):
+            # Set the key rather than the relationship so company collections stay unloaded.
+            posting.company_id = company_ids[index % len(company_ids)]
+        posting_ids.extend(posting.id for posting in batch)
+        session.add_all(batch)
+        session.flush()
+        matching.refresh_term_vectors(session, batch)
+        session.commit()
+        # Keep the identity map small when seeding large datasets.
+        session.expunge_all()
+    return SeededData(user_ids=user_ids, posting_ids=posting_ids)
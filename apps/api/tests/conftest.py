@@ -4,6 +4,11 @@ from collections.abc import Iterator
 import os
 
 os.environ.setdefault("POSTGRES_URL", "sqlite+pysqlite:///./tests.db")
+os.environ.setdefault("TASK_GUARD_REDIS", "false")
+os.environ.setdefault("QUERY_COUNTER_ENABLED", "true")
+# Every request in the suite fails if it runs more statements than this.
+os.environ.setdefault("QUERY_BUDGET", "20")
+os.environ.setdefault("QUERY_BUDGET_STRICT", "true")
 
 import pytest
 from fastapi.testclient import TestClient
@@ -13,6 +18,18 @@ from sqlalchemy.orm import Session
 from apps.api.db.base import Base
 from apps.api.db.session import SessionLocal, engine, get_session
 from apps.api.main import app
+from apps.api.services import ingestion, rate_limit, response_cache
+from apps.workers import guards
+from apps.workers.app import celery_app
+
+
+@pytest.fixture(scope="session", autouse=True)
+def eager_celery() -> Iterator[None]:
+    """Run dispatched Celery work (including chords) inline instead of via the broker."""
+
+    celery_app.conf.task_always_eager = True
+    yield
+    celery_app.conf.task_always_eager = False
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -26,6 +43,11 @@ def setup_database() -> Iterator[None]:
 @pytest.fixture(autouse=True)
 def clean_tables() -> Iterator[None]:
     yield
+    ingestion.clear_company_cache()
+    response_cache.provider_responses.clear()
+    rate_limit.provider_limiter.reset()
+    rate_limit.board_breaker.reset()
+    guards.task_guard.clear()
     table_names = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
     if not table_names:
         return
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import uuid
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 
 from sqlalchemy.orm import Session
 
-from apps.api.models import HiddenPosting, JobPosting, User
+from apps.api.models import HiddenPosting, JobPosting, PostingEnrichment, User
 from apps.api.models.enums import PlanTierEnum, ProviderEnum, StatusEnum
+from apps.api.services import matching
 
 
 def _seed_user(db: Session) -> User:
@@ -62,3 +65,101 @@ def test_feed_hide_endpoint_marks_posting(client, db_session: Session):
 
     response = client.get("/feed/jobs", headers={"X-User-Id": str(user.id)})
     assert response.json()["total"] == 0
+
+
+def test_feed_paginates_in_database_and_skips_hidden(client, db_session: Session):
+    user = _seed_user(db_session)
+    postings = [_seed_posting(db_session, f"Role{index}") for index in range(5)]
+    db_session.add(HiddenPosting(user_id=user.id, job_posting_id=postings[0].id))
+    db_session.commit()
+
+    first = client.get("/feed/jobs?page=1&limit=3", headers={"X-User-Id": str(user.id)}).json()
+    second = client.get("/feed/jobs?page=2&limit=3", headers={"X-User-Id": str(user.id)}).json()
+
+    assert first["total"] == 4
+    assert len(first["items"]) == 3
+    assert len(second["items"]) == 1
+    seen = {item["id"] for item in first["items"] + second["items"]}
+    assert str(postings[0].id) not in seen
+    assert len(seen) == 4
+
+
+def test_feed_cursor_walks_all_postings_without_duplicates(client, db_session: Session):
+    user = _seed_user(db_session)
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    for index in range(5):
+        posting = _seed_posting(db_session, f"Cursor{index}")
+        # Two postings share each timestamp so the id tie-breaker is exercised.
+        posting.created_at = base + timedelta(minutes=index // 2)
+    db_session.commit()
+
+    headers = {"X-User-Id": str(user.id)}
+    first = client.get("/feed/jobs?limit=2", headers=headers).json()
+    assert first["next_cursor"]
+
+    collected = [item["id"] for item in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        data = client.get(f"/feed/jobs?limit=2&cursor={cursor}", headers=headers).json()
+        collected.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+
+    assert len(collected) == 5
+    assert len(set(collected)) == 5
+    titles = [db_session.get(JobPosting, uuid.UUID(posting_id)).title for posting_id in collected]
+    assert titles[0] == "Cursor4"
+    assert set(titles[-2:]) == {"Cursor0", "Cursor1"}
+
+
+def test_feed_rejects_malformed_cursor(client, db_session: Session):
+    user = _seed_user(db_session)
+    response = client.get("/feed/jobs?cursor=not-a-cursor", headers={"X-User-Id": str(user.id)})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_feed_reuses_stored_enrichments(client, db_session: Session):
+    user = _seed_user(db_session)
+    posting = _seed_posting(db_session, "Analyst")
+    headers = {"X-User-Id": str(user.id)}
+
+    first = client.get("/feed/jobs", headers=headers).json()
+    stored = db_session.query(PostingEnrichment).filter_by(user_id=user.id, job_posting_id=posting.id).one()
+    assert stored.input_fingerprint is not None
+    assert first["items"][0]["fit_score"] == stored.fit_score
+
+    stored.fit_score = 99
+    db_session.commit()
+
+    second = client.get("/feed/jobs", headers=headers).json()
+    assert second["items"][0]["fit_score"] == 99
+    assert db_session.query(PostingEnrichment).count() == 1
+
+
+def test_feed_sorts_and_filters_by_fit(client, db_session: Session):
+    user = _seed_user(db_session)
+    scores = {"Low": 30, "Mid": 60, "High": 90, "Top": 95}
+    for title, score in scores.items():
+        posting = _seed_posting(db_session, title)
+        db_session.add(
+            PostingEnrichment(
+                user_id=user.id,
+                job_posting_id=posting.id,
+                fit_score=score,
+                fit_factors={},
+                input_fingerprint=matching.input_fingerprint(None, posting),
+            )
+        )
+    _seed_posting(db_session, "Unscored")
+    db_session.commit()
+    headers = {"X-User-Id": str(user.id)}
+
+    first = client.get("/feed/jobs?sort=fit&min_fit=50&limit=2", headers=headers).json()
+    assert first["total"] == 3
+    assert [item["title"] for item in first["items"]] == ["Top", "High"]
+
+    second = client.get(f"/feed/jobs?sort=fit&min_fit=50&limit=2&cursor={first['next_cursor']}", headers=headers)
+    assert [item["title"] for item in second.json()["items"]] == ["Mid"]
+    assert second.json()["next_cursor"] is None
+
+    mismatched = client.get(f"/feed/jobs?cursor={first['next_cursor']}", headers=headers)
+    assert mismatched.status_code == HTTPStatus.BAD_REQUEST
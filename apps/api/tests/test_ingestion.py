@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import httpx
+import redis
 from sqlalchemy.orm import Session
 
 from apps.api.models import Company, JobPosting
 from apps.api.models.enums import ProviderEnum
 from apps.api.services import ingestion, providers
+from apps.api.services.response_cache import ResponseCache
 
 
 def test_normalize_greenhouse_posting_sets_remote_flag():
@@ -43,6 +54,8 @@ def test_upsert_job_postings_creates_and_updates(db_session: Session):
 
     posting = db_session.query(JobPosting).filter_by(source=ProviderEnum.GREENHOUSE, source_id="abc").one()
     assert posting.remote_flag is True
+    assert posting.term_vector is not None
+    assert "acme" in posting.term_vector.terms
     assert posting.company is not None
     assert posting.company.name == "Acme"
 
@@ -72,3 +85,274 @@ def test_upsert_job_postings_skips_invalid_provider(db_session: Session):
     assert result.inserted == 0
     assert result.postings == []
     assert db_session.query(JobPosting).count() == 0
+
+
+def test_upsert_job_postings_reports_inserted_and_updated_ids(db_session: Session):
+    first = ingestion.upsert_job_postings(
+        db_session,
+        [
+            {"source": "greenhouse", "source_id": "1", "title": "Engineer", "url": "https://example.com/1"},
+            {"source": "greenhouse", "source_id": "2", "title": "Designer", "url": "https://example.com/2"},
+        ],
+    )
+    assert first.inserted == 2
+    assert first.updated_ids == []
+
+    second = ingestion.upsert_job_postings(
+        db_session,
+        [
+            {"source": "greenhouse", "source_id": "2", "title": "Senior Designer"},
+            {"source": "greenhouse", "source_id": "3", "title": "Analyst", "url": "https://example.com/3"},
+            {"source": "greenhouse", "source_id": "3", "title": "Lead Analyst", "url": "https://example.com/3"},
+        ],
+    )
+    assert second.inserted == 1
+    assert len(second.inserted_ids) == 1
+    assert len(second.updated_ids) == 1
+    assert db_session.query(JobPosting).count() == 3
+
+    designer = db_session.get(JobPosting, second.updated_ids[0])
+    assert designer.title == "Senior Designer"
+    assert designer.url == "https://example.com/2"
+    assert db_session.get(JobPosting, second.inserted_ids[0]).title == "Lead Analyst"
+
+
+def test_upsert_job_postings_resolves_companies_once_per_batch(db_session: Session):
+    payloads = [
+        {
+            "source": "greenhouse",
+            "source_id": str(index),
+            "title": f"Role {index}",
+            "url": f"https://example.com/{index}",
+            "company": {"name": "Acme", "domain": "acme.com"},
+        }
+        for index in range(3)
+    ]
+    payloads.append(
+        {
+            "source": "greenhouse",
+            "source_id": "other",
+            "title": "Other",
+            "url": "https://example.com/other",
+            "company": {"name": "Nameless Co", "domain": None},
+        }
+    )
+
+    result = ingestion.upsert_job_postings(db_session, payloads)
+
+    assert result.inserted == 4
+    assert db_session.query(Company).count() == 2
+    assert {posting.company.name for posting in result.postings} == {"Acme", "Nameless Co"}
+    assert "acme.com" in ingestion._company_cache
+
+    ingestion.upsert_job_postings(
+        db_session,
+        [
+            {
+                "source": "greenhouse",
+                "source_id": "later",
+                "title": "Later",
+                "url": "https://example.com/later",
+                "company": {"name": "Acme", "domain": "acme.com"},
+            }
+        ],
+    )
+    assert db_session.query(Company).count() == 2
+
+
+def test_upsert_job_postings_skips_unchanged_payloads(db_session: Session):
+    payload = {
+        "source": "greenhouse",
+        "source_id": "same",
+        "title": "Engineer",
+        "url": "https://example.com/same",
+        "metadata_json": {"departments": ["Engineering"]},
+    }
+    first = ingestion.upsert_job_postings(db_session, [payload])
+    assert first.inserted == 1
+
+    repeat = ingestion.upsert_job_postings(db_session, [dict(payload)])
+    assert repeat.inserted == 0
+    assert repeat.unchanged == 1
+    assert repeat.postings == []
+
+    changed = ingestion.upsert_job_postings(db_session, [dict(payload, title="Staff Engineer")])
+    assert changed.unchanged == 0
+    assert [posting.title for posting in changed.postings] == ["Staff Engineer"]
+
+
+def test_upsert_job_postings_in_chunks_streams_and_commits(db_session: Session):
+    pulled = 0
+
+    def payloads():
+        nonlocal pulled
+        for index in range(5):
+            pulled += 1
+            yield {"source": "greenhouse", "source_id": f"stream-{index}", "title": f"Role {index}"}
+
+    seen: list[tuple[int, int, int]] = []
+
+    def on_chunk(chunk: ingestion.UpsertResult) -> None:
+        committed = db_session.query(JobPosting).count()
+        seen.append((pulled, len(chunk.postings), committed))
+
+    result = ingestion.upsert_job_postings_in_chunks(db_session, payloads(), chunk_size=2, on_chunk=on_chunk)
+
+    assert seen == [(2, 2, 2), (4, 2, 4), (5, 1, 5)]
+    assert result.inserted == 5
+    assert len(result.inserted_ids) == 5
+    assert result.postings == []
+
+
+def test_fetch_greenhouse_boards_concurrently(monkeypatch):
+    monkeypatch.setattr(providers, "_backoff_seconds", lambda attempt: 0)
+    in_flight = 0
+    peak = 0
+    failures = {"flaky": 1}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+        token = request.url.path.split("/")[3]
+        if token == "missing":
+            return httpx.Response(404)
+        if failures.get(token):
+            failures[token] -= 1
+            return httpx.Response(503)
+        if token == "paged" and request.url.params.get("page") != "2":
+            next_url = f"{request.url.copy_with(query=None)}?page=2"
+            return httpx.Response(200, json={"jobs": [{"id": 1}], "meta": {"next": next_url}})
+        return httpx.Response(200, json={"jobs": [{"id": f"{token}-job"}], "meta": {"next": None}})
+
+    tokens = ["paged", "flaky", "missing", *[f"board{index}" for index in range(6)]]
+    boards = providers.fetch_greenhouse_boards_sync(tokens, concurrency=3, transport=httpx.MockTransport(handler))
+
+    assert "missing" not in boards
+    assert boards["paged"] == [{"id": 1}, {"id": "paged-job"}]
+    assert boards["flaky"] == [{"id": "flaky-job"}]
+    assert len(boards) == 8
+    assert 1 < peak <= 3
+
+
+@contextmanager
+def _stub_greenhouse(boards: dict[str, dict[str, object]]) -> Iterator[tuple[str, list[tuple[str, int]]]]:
+    """Serve ``boards`` over real HTTP with ETags; yields the board URL template and a request log."""
+
+    log: list[tuple[str, int]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            body = json.dumps(boards[self.path.split("/")[3]]).encode()
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.path.startswith("/v1/boards/plain/"):
+                etag = None  # Only the body hash can detect an unchanged board.
+            status = 304 if etag and self.headers.get("If-None-Match") == etag else 200
+            log.append((self.path, status))
+            self.send_response(status)
+            if etag:
+                self.send_header("ETag", etag)
+            if status == 304:
+                self.end_headers()
+                return
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/v1/boards/{{board_token}}/jobs", log
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch_greenhouse_boards_skips_unchanged_boards(monkeypatch):
+    boards = {
+        "tagged": {"jobs": [{"id": 1}], "meta": {"next": None}},
+        "plain": {"jobs": [{"id": 2}], "meta": {"next": None}},
+    }
+    cache = ResponseCache()
+    with _stub_greenhouse(boards) as (url_template, log):
+        monkeypatch.setattr(providers, "GREENHOUSE_BOARD_URL", url_template)
+
+        first = providers.fetch_greenhouse_boards_sync(["tagged", "plain"], cache=cache)
+        assert first == {"tagged": [{"id": 1}], "plain": [{"id": 2}]}
+
+        log.clear()
+        assert providers.fetch_greenhouse_boards_sync(["tagged", "plain"], cache=cache) == {}
+        assert sorted(log) == [("/v1/boards/plain/jobs", 200), ("/v1/boards/tagged/jobs", 304)]
+
+        async def fetch_one(board_token: str) -> list[dict[str, object]] | None:
+            async with httpx.AsyncClient() as client:
+                return await providers._fetch_board_async(
+                    client, providers.get_provider(ProviderEnum.GREENHOUSE), board_token, cache
+                )
+
+        # Unchanged is reported as ``None`` rather than as a failed fetch.
+        assert asyncio.run(fetch_one("tagged")) is None
+        assert asyncio.run(fetch_one("plain")) is None
+
+        boards["tagged"] = {"jobs": [{"id": 1}, {"id": 3}], "meta": {"next": None}}
+        changed = providers.fetch_greenhouse_boards_sync(["tagged", "plain"], cache=cache)
+        assert changed == {"tagged": [{"id": 1}, {"id": 3}]}
+
+
+def test_fetch_greenhouse_boards_refetches_unchanged_pages_of_changed_board(monkeypatch):
+    boards: dict[str, dict[str, object]] = {}
+    cache = ResponseCache()
+    with _stub_greenhouse(boards) as (url_template, log):
+        monkeypatch.setattr(providers, "GREENHOUSE_BOARD_URL", url_template)
+        boards["paged"] = {"jobs": [{"id": 1}], "meta": {"next": url_template.format(board_token="second")}}
+        boards["second"] = {"jobs": [{"id": 2}], "meta": {"next": None}}
+        assert providers.fetch_greenhouse_boards_sync(["paged"], cache=cache) == {"paged": [{"id": 1}, {"id": 2}]}
+
+        log.clear()
+        boards["second"] = {"jobs": [{"id": 2}, {"id": 3}], "meta": {"next": None}}
+        changed = providers.fetch_greenhouse_boards_sync(["paged"], cache=cache)
+
+    assert changed == {"paged": [{"id": 1}, {"id": 2}, {"id": 3}]}
+    assert log == [("/v1/boards/paged/jobs", 304), ("/v1/boards/second/jobs", 200), ("/v1/boards/paged/jobs", 200)]
+
+
+def test_iter_board_pages_streams_only_changed_boards(monkeypatch):
+    boards: dict[str, dict[str, object]] = {}
+    cache = ResponseCache()
+    with _stub_greenhouse(boards) as (url_template, log):
+        monkeypatch.setattr(providers, "GREENHOUSE_BOARD_URL", url_template)
+        boards["paged"] = {"jobs": [{"id": 1}], "meta": {"next": url_template.format(board_token="second")}}
+        boards["second"] = {"jobs": [{"id": 2}], "meta": {"next": None}}
+        pages = providers.iter_board_pages(ProviderEnum.GREENHOUSE, "paged", cache=cache)
+        assert list(pages) == [[{"id": 1}], [{"id": 2}]]
+
+        log.clear()
+        assert list(providers.iter_board_pages(ProviderEnum.GREENHOUSE, "paged", cache=cache)) == []
+        assert log == [("/v1/boards/paged/jobs", 304), ("/v1/boards/second/jobs", 304)]
+
+        log.clear()
+        boards["second"] = {"jobs": [{"id": 2}, {"id": 3}], "meta": {"next": None}}
+        pages = providers.iter_board_pages(ProviderEnum.GREENHOUSE, "paged", cache=cache)
+        assert list(pages) == [[{"id": 1}], [{"id": 2}, {"id": 3}]]
+
+    assert log == [("/v1/boards/paged/jobs", 304), ("/v1/boards/second/jobs", 200), ("/v1/boards/paged/jobs", 200)]
+
+
+def test_response_cache_treats_redis_outage_as_a_miss(monkeypatch):
+    unreachable = redis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+    cache = ResponseCache(redis_client=unreachable)
+    boards = {"tagged": {"jobs": [{"id": 1}], "meta": {"next": None}}}
+    with _stub_greenhouse(boards) as (url_template, log):
+        monkeypatch.setattr(providers, "GREENHOUSE_BOARD_URL", url_template)
+        assert providers.fetch_greenhouse_boards_sync(["tagged"], cache=cache) == {"tagged": [{"id": 1}]}
+        # Nothing could be stored, so the next cycle fetches in full rather than skipping the board.
+        assert providers.fetch_greenhouse_boards_sync(["tagged"], cache=cache) == {"tagged": [{"id": 1}]}
+    assert log == [("/v1/boards/tagged/jobs", 200), ("/v1/boards/tagged/jobs", 200)]
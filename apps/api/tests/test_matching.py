@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections import Counter
+
 from sqlalchemy.orm import Session
 
-from apps.api.models import JobPosting, PostingEnrichment, Profile, User
+from apps.api.db.session import SessionLocal
+from apps.api.models import HiddenPosting, JobPosting, PostingEnrichment, Profile, User
 from apps.api.models.enums import PlanTierEnum, ProviderEnum, StatusEnum
-from apps.api.services import matching
+from apps.api.services import ingestion, matching, profile_cache
 
 
 def test_compute_fit_score_uses_skill_overlap():
@@ -45,3 +48,301 @@ def test_update_posting_enrichment_persists(db_session: Session):
     stored = db_session.query(PostingEnrichment).filter_by(user_id=user.id, job_posting_id=posting.id).one()
     assert stored.fit_factors["skill_overlap"] == 1.0
     assert stored.rationale is not None
+
+
+def test_ensure_enrichments_only_rescores_missing_or_stale(db_session: Session):
+    user = User(email="ensure@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    profile = Profile(user=user, skills=["python"], headline="Backend Engineer", locations=["Remote"])
+    postings = [
+        JobPosting(
+            source=ProviderEnum.GREENHOUSE,
+            source_id=f"be-{index}",
+            title="Backend Engineer",
+            url=f"https://example.com/be-{index}",
+            remote_flag=True,
+            normalized_tags=["python"],
+        )
+        for index in range(3)
+    ]
+    db_session.add_all([user, profile, *postings])
+    db_session.commit()
+
+    enrichments, written = matching.ensure_enrichments(db_session, user.id, postings)
+    db_session.commit()
+    assert written == 3
+    assert set(enrichments) == {posting.id for posting in postings}
+
+    _, written = matching.ensure_enrichments(db_session, user.id, postings)
+    assert written == 0
+
+    profile.skills = ["go"]
+    db_session.commit()
+    enrichments, written = matching.ensure_enrichments(db_session, user.id, postings)
+    db_session.commit()
+    assert written == 3
+    assert all(enrichment.fit_factors["skill_overlap"] == 0.0 for enrichment in enrichments.values())
+
+
+def test_ensure_enrichments_tolerates_a_concurrent_insert(db_session: Session, monkeypatch):
+    user = User(email="race@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    profile = Profile(user=user, skills=["python"], headline="Backend Engineer")
+    posting = JobPosting(
+        source=ProviderEnum.GREENHOUSE,
+        source_id="race-1",
+        title="Backend Engineer",
+        url="https://example.com/race-1",
+        normalized_tags=["python"],
+    )
+    db_session.add_all([user, profile, posting])
+    db_session.commit()
+    user_id, posting_id = user.id, posting.id
+
+    original = matching._load_profile
+    raced: list[bool] = []
+
+    def load_profile_after_another_request_scores(session, user_uuid):  # noqa: ANN001
+        # Another feed read scores the same posting after this one looked for rows.
+        if not raced:
+            raced.append(True)
+            with SessionLocal() as other:
+                matching.ensure_enrichments(other, user_uuid, [other.get(JobPosting, posting_id)])
+                other.commit()
+        return original(session, user_uuid)
+
+    monkeypatch.setattr(matching, "_load_profile", load_profile_after_another_request_scores)
+    enrichments, written = matching.ensure_enrichments(db_session, user_id, [posting])
+    db_session.commit()
+
+    assert written == 1
+    assert enrichments[posting_id].fit_factors["skill_overlap"] == 1.0
+    assert db_session.query(PostingEnrichment).filter_by(user_id=user_id).count() == 1
+
+
+def test_score_postings_matches_per_pair_scoring():
+    profiles = [
+        None,
+        Profile(skills=["Python", "SQL"], headline="Data Engineer", summary="Pipelines and SQL", locations=["Remote"]),
+        Profile(skills=None, headline=None, locations=["Toronto"]),
+        Profile(skills=["design"], headline="Product Designer", locations=[]),
+        Profile(skills=["python"], headline="Engineer", locations=["  "]),
+    ]
+    postings = [
+        JobPosting(
+            source=ProviderEnum.GREENHOUSE,
+            source_id="1",
+            title="Senior Data Engineer",
+            url="https://example.com/1",
+            normalized_tags=["python", "sql", "data"],
+            remote_flag=True,
+            location="Remote",
+            jd_clean="Build SQL pipelines in Python for the data platform.",
+        ),
+        JobPosting(
+            source=ProviderEnum.GREENHOUSE,
+            source_id="2",
+            title="Product Designer",
+            url="https://example.com/2",
+            normalized_tags=None,
+            remote_flag=False,
+            location=" Toronto ",
+            jd_raw="Design delightful product experiences.",
+        ),
+        JobPosting(
+            source=ProviderEnum.GREENHOUSE,
+            source_id="3",
+            title="",
+            url="https://example.com/3",
+            remote_flag=False,
+        ),
+    ]
+
+    expected = [[matching.compute_fit_score(profile, posting) for posting in postings] for profile in profiles]
+    for profile, profile_expected in zip(profiles, expected):
+        assert matching.score_postings(profile, postings) == profile_expected
+    assert matching.score_block(profiles, postings) == expected
+
+
+def test_rescore_users_upserts_the_whole_block(db_session: Session):
+    users = [
+        User(email=f"bulk-{index}@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+        for index in range(3)
+    ]
+    profiles = [
+        Profile(user=users[0], skills=["python"], headline="Backend Engineer", locations=["Remote"]),
+        Profile(user=users[1], skills=["design"], headline="Product Designer", locations=["Toronto"]),
+    ]
+    postings = [
+        JobPosting(
+            source=ProviderEnum.GREENHOUSE,
+            source_id=f"bulk-{index}",
+            title=title,
+            url=f"https://example.com/bulk-{index}",
+            remote_flag=index == 0,
+            normalized_tags=tags,
+        )
+        for index, (title, tags) in enumerate([("Backend Engineer", ["python"]), ("Product Designer", ["design"])])
+    ]
+    db_session.add_all([*users, *profiles, *postings])
+    db_session.commit()
+    matching.ensure_enrichments(db_session, users[0].id, postings[:1])
+    db_session.commit()
+
+    user_ids = [user.id for user in users]
+    assert matching.rescore_users(db_session, user_ids, postings) == 6
+    db_session.commit()
+
+    stored = db_session.query(PostingEnrichment).all()
+    assert len(stored) == 6
+    by_pair = {(row.user_id, row.job_posting_id): row for row in stored}
+    for user, profile in zip(users, [*profiles, None]):
+        for posting in postings:
+            row = by_pair[(user.id, posting.id)]
+            assert row.fit_score == matching.compute_fit_score(profile, posting).score
+            assert row.input_fingerprint == matching.input_fingerprint(profile, posting)
+    for user in users:
+        _, written = matching.ensure_enrichments(db_session, user.id, postings)
+        assert written == 0
+
+    profiles[0].skills = ["go"]
+    db_session.commit()
+    matching.rescore_users(db_session, user_ids[:1], postings)
+    db_session.commit()
+    db_session.expire_all()
+    assert by_pair[(users[0].id, postings[0].id)].fit_factors["skill_overlap"] == 0.0
+
+
+def test_stored_term_vectors_are_used_until_posting_changes(db_session: Session, monkeypatch):
+    posting = JobPosting(
+        source=ProviderEnum.GREENHOUSE,
+        source_id="vec-1",
+        title="Platform Engineer",
+        url="https://example.com/vec-1",
+        remote_flag=True,
+        jd_clean="Operate Kubernetes clusters with Python tooling.",
+    )
+    db_session.add(posting)
+    db_session.flush()
+    assert matching.refresh_term_vectors(db_session, [posting]) == 1
+    assert matching.refresh_term_vectors(db_session, [posting]) == 0
+    db_session.commit()
+
+    profile = Profile(skills=["python"], headline="Platform Engineer", summary="Kubernetes", locations=["Remote"])
+    vectors = matching.load_term_vectors(db_session, [posting.id])
+    expected = [matching.compute_fit_score(profile, posting)]
+
+    def no_tokenizing(posting):  # noqa: ANN001
+        raise AssertionError("a posting with a stored vector was re-tokenized")
+
+    monkeypatch.setattr(matching, "_posting_tokens", no_tokenizing)
+    assert matching.score_postings(profile, [posting], vectors) == expected
+    monkeypatch.undo()
+
+    posting.jd_clean = "Design marketing campaigns."
+    assert matching.refresh_term_vectors(db_session, [posting]) == 1
+    assert "marketing" in vectors[posting.id].terms
+    assert matching.score_postings(profile, [posting], vectors) == [matching.compute_fit_score(profile, posting)]
+
+
+def test_profile_vector_is_built_once_per_profile_content(monkeypatch):
+    builds: list[int] = []
+    original = matching._profile_tokens
+
+    def counting_tokens(profile):  # noqa: ANN001
+        builds.append(1)
+        return original(profile)
+
+    monkeypatch.setattr(matching, "_profile_tokens", counting_tokens)
+    profile_cache.profile_vectors.clear()
+    profile = Profile(skills=["python"], headline="Data Engineer", summary="Cache me", locations=["Remote"])
+    postings = [
+        JobPosting(source=ProviderEnum.GREENHOUSE, source_id=str(index), title="Engineer", url="https://example.com")
+        for index in range(25)
+    ]
+
+    for posting in postings:
+        matching.compute_fit_score(profile, posting)
+    matching.score_postings(profile, postings)
+    assert len(builds) == 1
+
+    profile.skills = ["go"]
+    matching.compute_fit_score(profile, postings[0])
+    assert len(builds) == 2
+
+
+def test_profile_vector_cache_evicts_least_recently_used():
+    cache = profile_cache.ProfileVectorCache(maxsize=2)
+    cache.put("a", Counter({"a": 1}))
+    cache.put("b", Counter({"b": 1}))
+    assert cache.get("a") is not None
+    cache.put("c", Counter({"c": 1}))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_candidate_generation_uses_inverted_index(db_session: Session):
+    payloads = [
+        {"source_id": "py", "title": "Python Engineer", "departments": ["python"]},
+        {"source_id": "data", "title": "Data Engineer", "departments": ["sql"]},
+        {"source_id": "chef", "title": "Pastry Chef", "departments": ["kitchen"]},
+    ]
+    ingestion.upsert_job_postings(
+        db_session,
+        [
+            {
+                "source": "greenhouse",
+                "source_id": payload["source_id"],
+                "title": payload["title"],
+                "url": f"https://example.com/{payload['source_id']}",
+                "metadata_json": {"departments": payload["departments"]},
+            }
+            for payload in payloads
+        ],
+    )
+    user = User(email="candidates@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    profile = Profile(user=user, skills=["Python"], headline="Senior Engineer")
+    db_session.add_all([user, profile])
+    db_session.commit()
+    by_source = {posting.source_id: posting.id for posting in db_session.query(JobPosting)}
+
+    candidates = matching.candidate_posting_ids(db_session, profile, limit=10)
+    assert candidates[0] == by_source["py"]
+    assert by_source["chef"] not in candidates
+    assert matching.candidate_posting_ids(db_session, profile, limit=1) == [by_source["py"]]
+
+    enrichments = matching.ensure_candidate_enrichments(db_session, user.id, limit=10)
+    db_session.commit()
+    assert set(enrichments) == {by_source["py"], by_source["data"]}
+    assert db_session.query(PostingEnrichment).count() == 2
+
+    db_session.add(HiddenPosting(user_id=user.id, job_posting_id=by_source["py"]))
+    db_session.commit()
+    assert by_source["py"] not in matching.candidate_posting_ids(db_session, profile, limit=10)
+
+
+def test_rescore_users_can_write_only_candidates(db_session: Session):
+    user = User(email="only-candidates@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    profile = Profile(user=user, skills=["python"], headline="Backend Engineer")
+    postings = [
+        JobPosting(
+            source=ProviderEnum.GREENHOUSE,
+            source_id=source_id,
+            title=title,
+            url=f"https://example.com/{source_id}",
+            normalized_tags=tags,
+        )
+        for source_id, title, tags in [
+            ("py", "Python Developer", ["python"]),
+            ("chef", "Pastry Chef", ["baking"]),
+        ]
+    ]
+    db_session.add_all([user, profile, *postings])
+    db_session.commit()
+
+    assert matching.rescore_users(db_session, [user.id], postings, candidates_only=True) == 1
+    db_session.commit()
+    stored = db_session.query(PostingEnrichment).filter_by(user_id=user.id).one()
+    assert stored.job_posting_id == postings[0].id
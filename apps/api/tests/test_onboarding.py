@@ -81,6 +81,11 @@ def test_submit_profile_validation(client):
     response = client.post("/onboarding/profile", data=data)
     assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
+    for schedule in ({"schedule_cron": "every morning"}, {"timezone": "Mars/Olympus"}):
+        data["years_experience"] = "5"
+        response = client.post("/onboarding/profile", data={**data, **schedule})
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
 
 def test_submit_profile_without_resume(monkeypatch, client, db_session):
     # Ensure resume upload helpers are not invoked when resume is omitted
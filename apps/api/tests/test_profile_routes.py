@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections import Counter
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from apps.api.models import Profile, User
-from apps.api.models.enums import PlanTierEnum, StatusEnum
+from apps.api.models import JobPosting, PostingEnrichment, Profile, User
+from apps.api.models.enums import PlanTierEnum, ProviderEnum, StatusEnum
+from apps.api.services import ingestion, matching, profile_cache
+from apps.workers.tasks import rescore
 
 
 def _seed_user(db_session: Session) -> User:
@@ -42,3 +47,140 @@ def test_update_profile(client, db_session: Session):
     updated = response.json()
     assert updated["headline"] == "Product Manager"
     assert updated["remote_only"] is False
+
+
+def test_update_profile_evicts_cached_vector(client, db_session: Session):
+    user = _seed_user(db_session)
+    profile = db_session.query(Profile).filter_by(user_id=user.id).one()
+    previous_hash = profile_cache.profile_content_hash(profile)
+    profile_cache.profile_vectors.put(previous_hash, Counter({"stale": 1}))
+
+    response = client.put("/profile/me", json={"skills": ["Python"]}, headers={"X-User-Id": str(user.id)})
+    assert response.status_code == HTTPStatus.OK
+    assert profile_cache.profile_vectors.get(previous_hash) is None
+
+
+def _seed_enriched_user(db_session: Session, count: int = 3) -> tuple[User, list[JobPosting]]:
+    user = _seed_user(db_session)
+    profile = db_session.query(Profile).filter_by(user_id=user.id).one()
+    profile.skills = ["Python", "SQL"]
+    postings = [
+        JobPosting(
+            source=ProviderEnum.GREENHOUSE,
+            source_id=f"rescore-{index}",
+            title="Backend Engineer",
+            url=f"https://example.com/rescore-{index}",
+            normalized_tags=["python", "go"],
+        )
+        for index in range(count)
+    ]
+    db_session.add_all(postings)
+    db_session.commit()
+    matching.rescore_users(db_session, [user.id], postings)
+    db_session.commit()
+    return user, postings
+
+
+def test_profile_edit_rescores_enrichments_in_background(client, db_session: Session):
+    user, _ = _seed_enriched_user(db_session)
+
+    response = client.put("/profile/me", json={"skills": ["Go"]}, headers={"X-User-Id": str(user.id)})
+    assert response.status_code == HTTPStatus.OK
+
+    db_session.expire_all()
+    profile = db_session.query(Profile).filter_by(user_id=user.id).one()
+    assert profile.version == 2
+    enrichments = db_session.query(PostingEnrichment).filter_by(user_id=user.id).all()
+    assert len(enrichments) == 3
+    assert all(enrichment.profile_version == 2 for enrichment in enrichments)
+    assert all(enrichment.fit_factors["skill_overlap"] == 1.0 for enrichment in enrichments)
+
+    # Fields that do not feed matching leave the version and enrichments alone.
+    client.put("/profile/me", json={"work_auth": "Citizen"}, headers={"X-User-Id": str(user.id)})
+    db_session.expire_all()
+    assert db_session.query(Profile).filter_by(user_id=user.id).one().version == 2
+
+
+def test_profile_edit_scores_new_candidates(client, db_session: Session):
+    user = _seed_user(db_session)
+    ingestion.upsert_job_postings(
+        db_session,
+        [
+            {
+                "source": "greenhouse",
+                "source_id": source_id,
+                "title": title,
+                "url": f"https://example.com/{source_id}",
+                "metadata_json": {"departments": [tag]},
+            }
+            for source_id, title, tag in [("go", "Go Developer", "go"), ("chef", "Pastry Chef", "kitchen")]
+        ],
+    )
+    db_session.commit()
+
+    client.put("/profile/me", json={"skills": ["Go"]}, headers={"X-User-Id": str(user.id)})
+
+    db_session.expire_all()
+    scored = db_session.query(PostingEnrichment).filter_by(user_id=user.id).all()
+    assert [enrichment.job_posting.source_id for enrichment in scored] == ["go"]
+
+
+def test_feed_serves_stale_scores_until_rescore_runs(monkeypatch, client, db_session: Session):
+    user, _ = _seed_enriched_user(db_session, count=1)
+    queued: list[tuple[str, int]] = []
+    monkeypatch.setattr(rescore.rescore_profile, "delay", lambda *args: queued.append(args))
+
+    client.put("/profile/me", json={"skills": ["Go"]}, headers={"X-User-Id": str(user.id)})
+    assert queued == [(str(user.id), 2)]
+
+    item = client.get("/feed/jobs", headers={"X-User-Id": str(user.id)}).json()["items"][0]
+    assert item["fit_stale"] is True
+    assert item["fit_factors"]["skill_overlap"] == 0.5
+
+    # A message for a superseded version is dropped; the current one rescores.
+    rescore.rescore_profile(str(user.id), 1)
+    db_session.expire_all()
+    assert db_session.query(PostingEnrichment).one().profile_version == 1
+    rescore.rescore_profile(*queued[0])
+
+    item = client.get("/feed/jobs", headers={"X-User-Id": str(user.id)}).json()["items"][0]
+    assert item["fit_stale"] is False
+    assert item["fit_factors"]["skill_overlap"] == 1.0
+
+
+def test_feed_rescores_inline_when_the_rescore_never_arrives(monkeypatch, client, db_session: Session):
+    user, _ = _seed_enriched_user(db_session, count=1)
+
+    def broker_down(*args: object) -> None:
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(rescore.rescore_profile, "delay", broker_down)
+    client.put("/profile/me", json={"skills": ["Go"]}, headers={"X-User-Id": str(user.id)})
+
+    item = client.get("/feed/jobs", headers={"X-User-Id": str(user.id)}).json()["items"][0]
+    assert item["fit_stale"] is True
+
+    # Once the grace period has passed, the feed stops waiting for the job.
+    monkeypatch.setattr(matching.settings, "rescore_grace_seconds", 0)
+    item = client.get("/feed/jobs", headers={"X-User-Id": str(user.id)}).json()["items"][0]
+    assert item["fit_stale"] is False
+    assert item["fit_factors"]["skill_overlap"] == 1.0
+
+
+def test_profile_rescore_skips_inactive_postings(client, db_session: Session):
+    user, postings = _seed_enriched_user(db_session, count=2)
+    db_session.execute(
+        update(JobPosting)
+        .where(JobPosting.id == postings[0].id)
+        .values(updated_at=datetime.now(UTC) - timedelta(days=90))
+    )
+    db_session.commit()
+
+    client.put("/profile/me", json={"skills": ["Go"]}, headers={"X-User-Id": str(user.id)})
+
+    db_session.expire_all()
+    versions = {
+        enrichment.job_posting_id: enrichment.profile_version
+        for enrichment in db_session.query(PostingEnrichment).filter_by(user_id=user.id)
+    }
+    assert versions == {postings[0].id: 1, postings[1].id: 2}
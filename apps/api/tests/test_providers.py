@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import httpx
+import redis
+from sqlalchemy.orm import Session
+
+from apps.api.models import JobPosting
+from apps.api.models.enums import ProviderEnum
+from apps.api.services import ingestion, providers, rate_limit
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _fixture(name: str) -> object:
+    return json.loads((FIXTURES / name).read_text())
+
+
+def _recorded_transport(requests: list[httpx.URL]) -> httpx.MockTransport:
+    lever = _fixture("lever_postings.json")
+    ashby = _fixture("ashby_job_board.json")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url)
+        if request.url.host == "api.lever.co":
+            skip = int(request.url.params["skip"])
+            limit = int(request.url.params["limit"])
+            return httpx.Response(200, json=lever[skip : skip + limit])
+        if request.url.host == "api.ashbyhq.com":
+            return httpx.Response(200, json=ashby)
+        return httpx.Response(
+            200, json={"jobs": [{"id": 7, "title": "Greenhouse Role"}], "meta": {"next": None}}
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_fetch_boards_mixes_providers_in_one_batch(monkeypatch):
+    monkeypatch.setattr(providers, "LEVER_PAGE_SIZE", 2)
+    requests: list[httpx.URL] = []
+
+    boards = providers.fetch_boards_sync(
+        [
+            (ProviderEnum.LEVER, "acme"),
+            (ProviderEnum.ASHBY, "acme"),
+            (ProviderEnum.GREENHOUSE, "acme"),
+        ],
+        transport=_recorded_transport(requests),
+    )
+
+    assert [job["text"] for job in boards[(ProviderEnum.LEVER, "acme")]] == [
+        "Senior Backend Engineer",
+        "Product Designer",
+        "Data Engineer",
+    ]
+    assert [url.params["skip"] for url in requests if url.host == "api.lever.co"] == ["0", "2"]
+    # Unlisted Ashby postings are dropped at the adapter.
+    assert [job["title"] for job in boards[(ProviderEnum.ASHBY, "acme")]] == [
+        "Machine Learning Engineer",
+        "Account Executive",
+    ]
+    assert boards[(ProviderEnum.GREENHOUSE, "acme")] == [{"id": 7, "title": "Greenhouse Role"}]
+    assert providers.metrics_snapshot()["lever"]["jobs"] >= 3
+
+
+def test_normalize_lever_posting():
+    remote, onsite, hybrid = (
+        providers.normalize_lever_posting(raw) for raw in _fixture("lever_postings.json")
+    )
+
+    assert remote["source"] == "lever"
+    assert remote["source_id"] == "5ac21346-8e0c-4494-8e7a-3eb92ff77902"
+    assert remote["title"] == "Senior Backend Engineer"
+    assert remote["url"].startswith("https://jobs.lever.co/acme/")
+    assert remote["is_remote"] is True
+    assert remote["metadata_json"] == {
+        "departments": ["Engineering", "Platform"],
+        "offices": ["United States", "Canada"],
+    }
+    assert (remote["salary_min"], remote["salary_max"], remote["salary_currency"]) == (
+        170000,
+        210000,
+        "USD",
+    )
+    assert onsite["is_remote"] is False
+    assert onsite["salary_min"] is None
+    assert hybrid["is_remote"] is True
+
+
+def test_normalize_ashby_posting():
+    listed = _fixture("ashby_job_board.json")["jobs"]
+    engineer = providers.normalize_ashby_posting(listed[0])
+    sales = providers.normalize_ashby_posting(listed[1])
+
+    assert engineer["source"] == "ashby"
+    assert engineer["location_raw"] == "San Francisco"
+    assert engineer["is_remote"] is True
+    assert engineer["metadata_json"] == {
+        "departments": ["Engineering", "Applied ML"],
+        "offices": ["Seattle", "Remote (US)"],
+    }
+    assert (engineer["salary_min"], engineer["salary_max"]) == (180000, 230000)
+    assert sales["is_remote"] is False
+    assert sales["salary_min"] is None
+    assert sales["metadata_json"]["departments"] == ["Sales"]
+
+
+def test_normalized_provider_payloads_ingest(db_session: Session):
+    payloads = [providers.normalize_lever_posting(raw) for raw in _fixture("lever_postings.json")]
+    payloads += [
+        providers.normalize_ashby_posting(raw)
+        for raw in _fixture("ashby_job_board.json")["jobs"][:2]
+    ]
+
+    result = ingestion.upsert_job_postings(db_session, payloads)
+
+    assert result.inserted == 5
+    sources = {posting.source for posting in db_session.query(JobPosting)}
+    assert sources == {ProviderEnum.LEVER, ProviderEnum.ASHBY}
+
+
+def test_host_rate_limiter_spaces_requests_and_honors_defer():
+    limiter = rate_limit.HostRateLimiter(rate=10, capacity=2)
+
+    waits = [limiter.reserve("boards.example.com") for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert 0.09 < waits[2] < 0.11
+    assert 0.19 < waits[3] < 0.21
+    assert limiter.reserve("other.example.com") == 0
+
+    limiter.defer("other.example.com", 30)
+    assert 29 < limiter.reserve("other.example.com") <= 30
+
+
+def test_host_rate_limiter_falls_back_when_redis_is_down():
+    unreachable = redis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+    limiter = rate_limit.HostRateLimiter(rate=10, capacity=1, redis_client=unreachable)
+
+    assert limiter.reserve("boards.example.com") == 0
+    limiter.defer("boards.example.com", 5)
+    assert limiter.reserve("boards.example.com") > 4
+
+
+def test_parse_retry_after():
+    assert rate_limit.parse_retry_after("12") == 12
+    assert rate_limit.parse_retry_after(None) is None
+    assert rate_limit.parse_retry_after("soon") is None
+    assert rate_limit.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_fetch_retries_429_after_retry_after(monkeypatch):
+    limiter = rate_limit.HostRateLimiter(rate=1000, capacity=1000)
+    monkeypatch.setattr(rate_limit, "provider_limiter", limiter)
+    deferred: list[tuple[str, float]] = []
+    monkeypatch.setattr(limiter, "defer", lambda host, seconds: deferred.append((host, seconds)))
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"jobs": [{"id": 1}], "meta": {"next": None}}),
+        ]
+    )
+
+    boards = providers.fetch_greenhouse_boards_sync(
+        ["busy"], transport=httpx.MockTransport(lambda request: next(responses))
+    )
+
+    assert boards == {"busy": [{"id": 1}]}
+    assert deferred == [("boards-api.greenhouse.io", 0)]
+
+
+def test_slow_rate_limiter_does_not_block_other_boards(monkeypatch):
+    limiter = rate_limit.HostRateLimiter(rate=1000, capacity=1000)
+    monkeypatch.setattr(rate_limit, "provider_limiter", limiter)
+
+    def slow_reserve(host: str) -> float:
+        time.sleep(0.2)  # A Redis round trip that blocks its thread.
+        return 0.0
+
+    monkeypatch.setattr(limiter, "reserve", slow_reserve)
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"jobs": [{"id": 1}], "meta": {"next": None}})
+    )
+
+    started = time.perf_counter()
+    boards = providers.fetch_greenhouse_boards_sync(
+        [f"board{index}" for index in range(4)], concurrency=4, transport=transport
+    )
+
+    assert len(boards) == 4
+    assert time.perf_counter() - started < 0.6
+
+
+def test_stream_boards_fetches_concurrently_and_buffers_few_pages(monkeypatch):
+    monkeypatch.setattr(rate_limit, "provider_limiter", rate_limit.HostRateLimiter(rate=1000, capacity=1000))
+    requested: dict[str, int] = {}
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        board_token = request.url.path.split("/")[3]
+        page = int(request.url.params.get("page", 0))
+        requested[board_token] = requested.get(board_token, 0) + 1
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        next_url = str(request.url.copy_set_param("page", page + 1)) if page < 9 else None
+        return httpx.Response(200, json={"jobs": [{"id": f"{board_token}-{page}"}], "meta": {"next": next_url}})
+
+    streamed = providers.stream_boards(
+        [(ProviderEnum.GREENHOUSE, f"board{index}") for index in range(4)],
+        concurrency=4,
+        transport=httpx.MockTransport(handler),
+        buffered_pages=2,
+    )
+    first_board, first_pages = next(streamed)
+    first_page = next(first_pages)
+    time.sleep(0.3)
+    # Nobody reads the other boards yet, so each fetch stalls once its queue is full.
+    assert all(count <= 4 for count in requested.values())
+
+    jobs = {first_board[1]: first_page + [job for page in first_pages for job in page]}
+    for (_, board_token), pages in streamed:
+        jobs[board_token] = [job for page in pages for job in page]
+
+    assert peak > 1
+    assert sorted(jobs) == [f"board{index}" for index in range(4)]
+    assert all(len(board_jobs) == 10 for board_jobs in jobs.values())
+    assert sum(requested.values()) == 40
+
+    # Closing the stream early abandons the fetches still waiting on the consumer.
+    requested.clear()
+    streamed = providers.stream_boards(
+        [(ProviderEnum.GREENHOUSE, f"board{index}") for index in range(4)],
+        concurrency=4,
+        transport=httpx.MockTransport(handler),
+        buffered_pages=2,
+    )
+    next(streamed)
+    streamed.close()
+    assert sum(requested.values()) < 40
+
+
+def test_fetch_gives_up_on_long_retry_after(monkeypatch):
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    assert (
+        providers.fetch_greenhouse_boards_sync(["busy"], transport=httpx.MockTransport(handler))
+        == {}
+    )
+    assert attempts == 1
+    assert rate_limit.provider_limiter.reserve("boards-api.greenhouse.io") > 3500
+
+
+def test_circuit_breaker_stops_requests_to_failing_board(monkeypatch):
+    monkeypatch.setattr(
+        rate_limit, "board_breaker", rate_limit.CircuitBreaker(threshold=2, reset_seconds=60)
+    )
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    for _ in range(4):
+        assert providers.fetch_greenhouse_boards_sync(["gone"], transport=transport) == {}
+    assert attempts == 2
+
+    breaker = rate_limit.board_breaker
+    breaker.record_success("greenhouse:gone")
+    assert breaker.allow("greenhouse:gone")
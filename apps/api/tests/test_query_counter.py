@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from apps.api.db import query_counter
+from apps.api.db.session import engine
+from apps.api.middleware import QUERY_COUNT_HEADER, QueryBudgetExceeded, QueryCounterMiddleware
+from apps.api.models import Application, ApplicationNote, Company, JobPosting, Task, User
+from apps.api.models.enums import PlanTierEnum, PriorityEnum, ProviderEnum, StatusEnum, TaskTypeEnum
+
+
+def _seed_pipeline(db_session: Session, user_id: uuid.UUID, count: int, offset: int = 0) -> None:
+    company = Company(name=f"Acme {offset}")
+    for index in range(offset, offset + count):
+        posting = JobPosting(
+            company=company,
+            source=ProviderEnum.GREENHOUSE,
+            source_id=f"qc-{index}",
+            title=f"Engineer {index}",
+            url=f"https://example.com/jobs/qc-{index}",
+        )
+        application = Application(user_id=user_id, job_posting=posting)
+        db_session.add_all(
+            [
+                posting,
+                application,
+                ApplicationNote(application=application, user_id=user_id, body="Call back"),
+                Task(
+                    user_id=user_id,
+                    application=application,
+                    title=f"Follow up {index}",
+                    nudge_type=TaskTypeEnum.FOLLOW_UP,
+                    priority=PriorityEnum.NORMAL,
+                    due_at=datetime.now(timezone.utc),
+                ),
+            ]
+        )
+    db_session.commit()
+    # Start each request from an empty identity map, as a fresh request session would.
+    db_session.expunge_all()
+
+
+def _query_count(client: TestClient, path: str, user_id: uuid.UUID) -> int:
+    response = client.get(path, headers={"X-User-Id": str(user_id)})
+    assert response.status_code == HTTPStatus.OK
+    return int(response.headers[QUERY_COUNT_HEADER])
+
+
+@pytest.mark.parametrize("path", ["/applications/", "/tasks/"])
+def test_list_query_count_does_not_grow_with_rows(client, db_session: Session, path: str):
+    user = User(email="queries@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    db_session.add(user)
+    db_session.commit()
+    user_id = user.id
+    _seed_pipeline(db_session, user_id, 1)
+    one_row = _query_count(client, path, user_id)
+
+    _seed_pipeline(db_session, user_id, 10, offset=1)
+    assert _query_count(client, path, user_id) == one_row
+
+
+def test_track_reports_repeated_statements():
+    query_counter.install(engine)
+    with query_counter.track() as stats, engine.connect() as connection:
+        for value in range(3):
+            connection.execute(text("SELECT :value"), {"value": value})
+        connection.execute(text("SELECT 1"))
+
+    assert stats.statements == 4
+    assert stats.seconds > 0
+    assert stats.repeated(3) == [("SELECT ?", 3)]
+
+
+def test_strict_budget_fails_the_request():
+    query_counter.install(engine)
+    app = FastAPI()
+    app.add_middleware(QueryCounterMiddleware, budget=1, strict=True)
+
+    @app.get("/two-queries")
+    def two_queries() -> dict[str, int]:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        return {"ok": 1}
+
+    with TestClient(app) as test_client, pytest.raises(QueryBudgetExceeded):
+        test_client.get("/two-queries")
@@ -9,6 +9,7 @@ from apps.api.config import settings
 from apps.api.models import Profile, ResumeVersion, User
 from apps.api.models.enums import PlanTierEnum, StatusEnum
 from apps.api.services import storage
+from apps.workers import guards
 from apps.workers.tasks import resume as resume_tasks
 
 
@@ -79,3 +80,31 @@ def test_process_resume_populates_sections(monkeypatch, db_session: Session):
     assert resume.ats_score and resume.ats_score > 50
     assert resume.keywords == ["Analytics", "Machine Learning", "Python"]
     assert profile.skills == ["Analytics", "Machine Learning", "Python"]
+
+
+def test_process_resume_skips_duplicate_and_concurrent_runs(monkeypatch, db_session: Session):
+    user = User(email="resume-dupe@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    resume = ResumeVersion(user=user, base_flag=True, doc_url=None)
+    db_session.add_all([user, resume])
+    db_session.commit()
+    resume.doc_url = f"{settings.s3_endpoint}/{settings.s3_bucket}/resumes/{resume.id}/sample.docx"
+    resume.original_filename = "sample.docx"
+    resume.content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    db_session.commit()
+
+    downloads: list[str] = []
+    docx_bytes = _build_docx_resume("Grace Hopper", "Skills: Python", "• Shipped compilers.")
+
+    def download(key: str) -> bytes:
+        downloads.append(key)
+        return docx_bytes
+
+    monkeypatch.setattr(storage, "download_bytes", download)
+
+    with guards.task_guard.lock(f"resume:{resume.id}"):
+        resume_tasks.process_resume(str(resume.id))
+    assert downloads == []
+
+    resume_tasks.process_resume(str(resume.id))
+    resume_tasks.parse_resume(str(resume.id))
+    assert len(downloads) == 1
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+
+import pytest
 from sqlalchemy.orm import Session
 
 from apps.api.models import SearchPref, User
 from apps.api.models.enums import PlanTierEnum, StatusEnum
+from apps.api.services import schedule
 from apps.workers.tasks import scheduler, search
 
 
+def _capture_dispatch(monkeypatch) -> list[list[str]]:  # noqa: ANN001
+    dispatched: list[list[str]] = []
+
+    def fake_delay(user_ids: list[str]) -> None:  # noqa: ANN001
+        dispatched.append(user_ids)
+
+    monkeypatch.setattr(search.run_board_ingestion, "delay", fake_delay)
+    return dispatched
+
+
 def test_scheduler_tick_enqueues_runs(monkeypatch, db_session: Session):
     user = User(email="schedule@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
     pref = SearchPref(
@@ -15,17 +29,110 @@ def test_scheduler_tick_enqueues_runs(monkeypatch, db_session: Session):
         filters={"greenhouse_board_token": "token"},
         schedule_cron="0 5 * * *",
         timezone="UTC",
+        last_run_at=datetime.now(UTC) - timedelta(days=2),
     )
     db_session.add_all([user, pref])
     db_session.commit()
+    dispatched = _capture_dispatch(monkeypatch)
+
+    scheduler.scheduler_tick()
+
+    assert dispatched == [[str(user.id)]]
+    db_session.refresh(pref)
+    assert pref.last_run_at is not None
+    assert pref.next_run_at.replace(tzinfo=UTC) > datetime.now(UTC)
+
+
+def test_scheduler_tick_only_enqueues_due_prefs_once_per_user(monkeypatch, db_session: Session):
+    now = datetime.now(UTC)
+    busy = User(email="busy@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    idle = User(email="idle@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    prefs = [
+        SearchPref(user=busy, name=f"Due {index}", schedule_cron="*/5 * * * *", timezone="UTC")
+        for index in range(3)
+    ]
+    prefs.append(SearchPref(user=idle, name="Later", schedule_cron="0 5 * * *", timezone="UTC"))
+    for pref in prefs[:3]:
+        pref.next_run_at = now - timedelta(minutes=1)
+    prefs[3].next_run_at = now + timedelta(hours=1)
+    db_session.add_all([busy, idle, *prefs])
+    db_session.commit()
+    dispatched = _capture_dispatch(monkeypatch)
 
-    dispatched: list[str] = []
+    scheduler.scheduler_tick()
+    scheduler.scheduler_tick()
 
-    def fake_delay(user_id: str) -> None:  # noqa: ANN001
-        dispatched.append(user_id)
+    assert dispatched == [[str(busy.id)]]
+    for pref in prefs:
+        db_session.refresh(pref)
+    assert all(pref.last_run_at is not None for pref in prefs[:3])
+    assert prefs[3].last_run_at is None
 
-    monkeypatch.setattr(search.run_daily_search, "delay", fake_delay)
+
+def test_unschedulable_prefs_do_not_starve_the_unscheduled_batch(monkeypatch, db_session: Session):
+    user = User(email="starve@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    broken = SearchPref(user=user, name="Broken", schedule_cron="0 0 30 2 *", timezone="UTC")
+    db_session.add_all([user, broken])
+    db_session.commit()
+    valid = SearchPref(user=user, name="Valid", schedule_cron="0 5 * * *", timezone="UTC")
+    db_session.add(valid)
+    db_session.commit()
+    monkeypatch.setattr(scheduler, "SCHEDULER_BATCH_SIZE", 1)
+    _capture_dispatch(monkeypatch)
 
     scheduler.scheduler_tick()
+    scheduler.scheduler_tick()
+
+    db_session.refresh(broken)
+    db_session.refresh(valid)
+    assert schedule.upcoming_run(broken) is None
+    assert broken.next_run_at is not None
+    assert schedule.upcoming_run(valid) is not None
+
+
+def test_failed_enqueue_leaves_prefs_due(monkeypatch, db_session: Session):
+    user = User(email="enqueue@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    due_at = datetime.now(UTC) - timedelta(minutes=1)
+    pref = SearchPref(
+        user=user, name="Due", schedule_cron="*/5 * * * *", timezone="UTC", next_run_at=due_at
+    )
+    db_session.add_all([user, pref])
+    db_session.commit()
+
+    def broken_delay(user_ids: list[str]) -> None:
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(search.run_board_ingestion, "delay", broken_delay)
+    with pytest.raises(ConnectionError):
+        scheduler.scheduler_tick()
+
+    db_session.refresh(pref)
+    assert pref.last_run_at is None
+    assert pref.next_run_at.replace(tzinfo=UTC) == due_at
+
+    dispatched = _capture_dispatch(monkeypatch)
+    scheduler.scheduler_tick()
+    assert dispatched == [[str(user.id)]]
+
+
+def test_next_run_at_follows_timezone_and_dst():
+    after = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+    assert schedule.next_run_at("0 6 * * *", "America/Toronto", after) == datetime(
+        2026, 10, 19, 10, 0, tzinfo=UTC
+    )
+    # Toronto leaves daylight time on 2026-11-01, so 06:00 local moves to 11:00 UTC.
+    assert schedule.next_run_at(
+        "0 6 * * *", "America/Toronto", datetime(2026, 11, 1, 0, 0, tzinfo=UTC)
+    ) == (datetime(2026, 11, 1, 11, 0, tzinfo=UTC))
+    assert schedule.next_run_at("0 9 * * mon-fri", "UTC", after) == datetime(
+        2026, 10, 19, 9, 0, tzinfo=UTC
+    )
+    assert schedule.next_run_at("*/15 * * * *", "UTC", after) == datetime(
+        2026, 10, 18, 12, 15, tzinfo=UTC
+    )
+
 
-    assert dispatched == [str(user.id)]
+@pytest.mark.parametrize("cron", ["61 * * * *", "* * *", "0 0 30 2 *", "0 5 * * funday"])
+def test_invalid_schedules_are_rejected(cron: str):
+    with pytest.raises(schedule.InvalidScheduleError):
+        schedule.next_run_at(cron, "UTC", datetime.now(UTC))
@@ -68,3 +68,22 @@ def test_search_pref_name_conflict(client, db_session: Session):
     }
     response = client.post("/search-preferences/", json=payload, headers=headers)
     assert response.status_code == HTTPStatus.CONFLICT
+
+
+def test_search_pref_schedule_is_validated_and_scheduled(client, db_session: Session):
+    user = _seed_user(db_session)
+    headers = {"X-User-Id": str(user.id)}
+
+    bad_cron = {"name": "Bad", "schedule_cron": "every morning", "timezone": "UTC"}
+    assert client.post("/search-preferences/", json=bad_cron, headers=headers).status_code == 422
+    bad_zone = {"name": "Bad", "schedule_cron": "0 6 * * *", "timezone": "Mars/Olympus"}
+    assert client.post("/search-preferences/", json=bad_zone, headers=headers).status_code == 422
+
+    payload = {"name": "Morning", "schedule_cron": "0 6 * * *", "timezone": "America/Toronto"}
+    created = client.post("/search-preferences/", json=payload, headers=headers).json()
+    assert created["next_run_at"] is not None
+
+    updated = client.put(
+        f"/search-preferences/{created['id']}", json={"schedule_cron": "30 7 * * *"}, headers=headers
+    ).json()
+    assert updated["next_run_at"] != created["next_run_at"]
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import pytest
 from sqlalchemy.orm import Session
 
-from apps.api.models import Notification, Profile, SearchPref, User
+from apps.api.models import Notification, PostingEnrichment, Profile, SearchPref, User
 from apps.api.models.enums import PlanTierEnum, StatusEnum
+from apps.workers import guards
 from apps.workers.tasks import search
 
 
+def _streamed(board_pages):  # noqa: ANN001, ANN202
+    """A ``providers.stream_boards`` stand-in handing over ``board_pages(source, board_token)``."""
+
+    def stream_boards(boards, cache=None, **_):  # noqa: ANN001, ANN202
+        for board in boards:
+            yield board, board_pages(*board)
+
+    return stream_boards
+
+
 def test_run_daily_search_creates_enrichments_and_digest(monkeypatch, db_session: Session):
     user = User(email="task@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
     profile = Profile(user=user, skills=["python", "management"], headline="Engineering Manager", locations=["Remote"])
@@ -20,19 +32,14 @@ def test_run_daily_search_creates_enrichments_and_digest(monkeypatch, db_session
     db_session.add_all([user, profile, pref])
     db_session.commit()
 
-    monkeypatch.setattr(
-        search.providers,
-        "fetch_greenhouse_postings",
-        lambda board_token: [
-            {
-                "id": 1,
-                "title": "Senior Engineering Manager",
-                "absolute_url": "https://example.com/jobs/1",
-                "location": {"name": "Remote"},
-                "departments": [{"name": "Engineering"}],
-            }
-        ],
-    )
+    job = {
+        "id": 1,
+        "title": "Senior Engineering Manager",
+        "absolute_url": "https://example.com/jobs/1",
+        "location": {"name": "Remote"},
+        "departments": [{"name": "Engineering"}],
+    }
+    monkeypatch.setattr(search.providers, "stream_boards", _streamed(lambda source, board_token: iter([[job]])))
 
     search.run_daily_search(str(user.id))
 
@@ -41,3 +48,254 @@ def test_run_daily_search_creates_enrichments_and_digest(monkeypatch, db_session
     payload = digest_notifications[0].payload
     assert payload["items"][0]["title"] == "Senior Engineering Manager"
     assert payload["items"][0]["fit_score"] > 0
+
+
+def test_board_ingestion_fetches_each_board_once(monkeypatch, db_session: Session):
+    users = []
+    for index, board in enumerate(["shared", "shared", "solo"]):
+        user = User(email=f"board{index}@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+        profile = Profile(user=user, skills=["python"], headline="Engineer", locations=["Remote"])
+        pref = SearchPref(
+            user=user,
+            name="Daily",
+            filters={"greenhouse_board_token": board},
+            schedule_cron="0 7 * * *",
+            timezone="UTC",
+        )
+        db_session.add_all([user, profile, pref])
+        users.append(user)
+    db_session.commit()
+
+    fetched: list[str] = []
+
+    def fake_pages(source, board_token):  # noqa: ANN001
+        fetched.append(board_token)
+        return iter(
+            [
+                [
+                    {
+                        "id": f"{board_token}-1",
+                        "title": "Python Engineer",
+                        "absolute_url": f"https://example.com/{board_token}",
+                        "location": {"name": "Remote"},
+                        "departments": [{"name": "Engineering"}],
+                    }
+                ]
+            ]
+        )
+
+    monkeypatch.setattr(search.providers, "stream_boards", _streamed(fake_pages))
+
+    search.run_board_ingestion()
+
+    assert sorted(fetched) == ["shared", "solo"]
+    for user in users:
+        assert db_session.query(PostingEnrichment).filter_by(user_id=user.id).count() == 1
+        assert db_session.query(Notification).filter_by(user_id=user.id, kind="daily_digest").count() == 1
+
+
+def test_daily_search_drops_duplicates_and_concurrent_runs(monkeypatch, db_session: Session):
+    user = User(email="dupe@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    db_session.add(user)
+    db_session.commit()
+
+    runs: list[str] = []
+    monkeypatch.setattr(search, "_run_daily_search", runs.append)
+
+    search.run_daily_search(str(user.id), idempotency_key="slot-1")
+    search.run_daily_search(str(user.id), idempotency_key="slot-1")
+    with guards.task_guard.lock(f"search:user:{user.id}"):
+        search.run_daily_search(str(user.id), idempotency_key="slot-2")
+    search.run_daily_search(str(user.id), idempotency_key="slot-3")
+
+    assert runs == [str(user.id), str(user.id)]
+
+
+def test_failed_daily_search_releases_its_idempotency_key(monkeypatch):
+    calls = 0
+
+    def flaky(user_id: str) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("provider down")
+
+    monkeypatch.setattr(search, "_run_daily_search", flaky)
+
+    with pytest.raises(RuntimeError):
+        search.run_daily_search("user", idempotency_key="retry-me")
+    search.run_daily_search("user", idempotency_key="retry-me")
+    assert calls == 2
+
+
+def test_board_ingestion_skips_boards_locked_by_another_worker(monkeypatch, db_session: Session):
+    for index, board in enumerate(["busy", "free"]):
+        user = User(email=f"lock{index}@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+        pref = SearchPref(
+            user=user,
+            name="Daily",
+            filters={"greenhouse_board_token": board},
+            schedule_cron="0 7 * * *",
+            timezone="UTC",
+        )
+        db_session.add_all([user, pref])
+    db_session.commit()
+
+    fetched: list[str] = []
+
+    def fake_pages(source, board_token):  # noqa: ANN001
+        fetched.append(board_token)
+        return iter([])
+
+    monkeypatch.setattr(search.providers, "stream_boards", _streamed(fake_pages))
+
+    with guards.task_guard.lock("search:board:greenhouse:busy"):
+        search.run_board_ingestion()
+
+    assert fetched == ["free"]
+
+
+def test_board_ingestion_fans_scoring_out_in_chunks(monkeypatch, db_session: Session):
+    users = []
+    for index in range(2):
+        user = User(email=f"fanout{index}@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+        profile = Profile(user=user, skills=["python"], headline="Engineer", locations=["Remote"])
+        pref = SearchPref(
+            user=user,
+            name="Daily",
+            filters={"greenhouse_board_token": "big"},
+            schedule_cron="0 7 * * *",
+            timezone="UTC",
+        )
+        db_session.add_all([user, profile, pref])
+        users.append(user)
+    db_session.commit()
+
+    jobs = [
+        {"id": index, "title": f"Python Engineer {index}", "absolute_url": f"https://example.com/{index}"}
+        for index in range(5)
+    ]
+    monkeypatch.setattr(search.providers, "stream_boards", _streamed(lambda source, board_token: iter([jobs])))
+    monkeypatch.setattr(search.settings, "score_chunk_size", 2)
+    chunks: list[tuple[list[str], int]] = []
+    score_for_users = search._score_for_users
+
+    def record(session, user_ids, postings):  # noqa: ANN001
+        chunks.append((list(user_ids), len(postings)))
+        score_for_users(session, user_ids, postings)
+
+    monkeypatch.setattr(search, "_score_for_users", record)
+
+    search.run_board_ingestion()
+
+    subscribers = sorted(str(user.id) for user in users)
+    assert chunks == [(subscribers, 2), (subscribers, 2), (subscribers, 1)]
+    for user in users:
+        assert db_session.query(PostingEnrichment).filter_by(user_id=user.id).count() == 5
+        assert db_session.query(Notification).filter_by(user_id=user.id, kind="daily_digest").count() == 1
+
+
+def test_board_ingestion_scores_ingested_boards_when_a_later_board_fails(monkeypatch, db_session: Session):
+    user = User(email="partial@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    profile = Profile(user=user, skills=["python"], headline="Engineer", locations=["Remote"])
+    prefs = [
+        SearchPref(
+            user=user,
+            name=board,
+            filters={"greenhouse_board_token": board},
+            schedule_cron="0 7 * * *",
+            timezone="UTC",
+        )
+        for board in ["first", "second"]
+    ]
+    db_session.add_all([user, profile, *prefs])
+    db_session.commit()
+
+    requested: list[str] = []
+
+    def pages(source, board_token):  # noqa: ANN001
+        requested.append(board_token)
+        if len(requested) > 1:
+            raise RuntimeError("database went away")
+        yield [{"id": 1, "title": "Python Engineer", "absolute_url": "https://example.com/1"}]
+
+    monkeypatch.setattr(search.providers, "stream_boards", _streamed(pages))
+
+    with pytest.raises(RuntimeError):
+        search.run_board_ingestion()
+
+    assert db_session.query(PostingEnrichment).filter_by(user_id=user.id).count() == 1
+    assert db_session.query(Notification).filter_by(user_id=user.id, kind="daily_digest").count() == 1
+
+
+def test_board_ingestion_scores_subscribers_on_other_schedules(monkeypatch, db_session: Session):
+    users = []
+    for index, cron in enumerate(["0 7 * * *", "0 19 * * *"]):
+        user = User(email=f"sched{index}@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+        profile = Profile(user=user, skills=["python"], headline="Engineer", locations=["Remote"])
+        pref = SearchPref(
+            user=user,
+            name="Daily",
+            filters={"greenhouse_board_token": "shared"},
+            schedule_cron=cron,
+            timezone="UTC",
+        )
+        db_session.add_all([user, profile, pref])
+        users.append(user)
+    db_session.commit()
+
+    def fake_pages(source, board_token):  # noqa: ANN001
+        return iter(
+            [
+                [
+                    {
+                        "id": "shared-1",
+                        "title": "Python Engineer",
+                        "absolute_url": "https://example.com/shared",
+                        "location": {"name": "Remote"},
+                        "departments": [{"name": "Engineering"}],
+                    }
+                ]
+            ]
+        )
+
+    monkeypatch.setattr(search.providers, "stream_boards", _streamed(fake_pages))
+
+    # Only the first user is due, but the board's new posting reaches both subscribers.
+    search.run_board_ingestion([str(users[0].id)])
+    search.run_board_ingestion([str(users[1].id)])
+
+    for user in users:
+        assert db_session.query(PostingEnrichment).filter_by(user_id=user.id).count() == 1
+        assert db_session.query(Notification).filter_by(user_id=user.id, kind="daily_digest").count() == 1
+
+
+def test_board_ingestion_scores_chunks_committed_before_a_page_fails(monkeypatch, db_session: Session):
+    user = User(email="midboard@example.com", plan_tier=PlanTierEnum.FREE, status=StatusEnum.ACTIVE)
+    profile = Profile(user=user, skills=["python"], headline="Engineer", locations=["Remote"])
+    pref = SearchPref(
+        user=user,
+        name="Daily",
+        filters={"greenhouse_board_token": "flaky"},
+        schedule_cron="0 7 * * *",
+        timezone="UTC",
+    )
+    db_session.add_all([user, profile, pref])
+    db_session.commit()
+
+    def pages(source, board_token):  # noqa: ANN001
+        yield [{"id": 1, "title": "Python Engineer", "absolute_url": "https://example.com/1"}]
+        raise search.providers.ProviderError("greenhouse returned 500")
+
+    chunked = search.ingestion.upsert_job_postings_in_chunks
+    monkeypatch.setattr(
+        search.ingestion,
+        "upsert_job_postings_in_chunks",
+        lambda session, postings, on_chunk=None: chunked(session, postings, chunk_size=1, on_chunk=on_chunk),
+    )
+    monkeypatch.setattr(search.providers, "stream_boards", _streamed(pages))
+
+    search.run_board_ingestion()
+
+    assert db_session.query(PostingEnrichment).filter_by(user_id=user.id).count() == 1
+    assert db_session.query(Notification).filter_by(user_id=user.id, kind="daily_digest").count() == 1
@@ -12,11 +12,23 @@ celery_app = Celery(
         "apps.workers.tasks.resume",
         "apps.workers.tasks.search",
         "apps.workers.tasks.scheduler",
+        "apps.workers.tasks.rescore",
     ],
 )
 
 celery_app.conf.update(task_serializer="json", result_serializer="json", accept_content=["json"])
 
+# Each stage of the search pipeline has its own queue so ingestion, scoring and
+# digest workers can be scaled independently (``celery worker -Q scoring``).
+celery_app.conf.task_routes = {
+    "search.run": {"queue": settings.celery_ingest_queue},
+    "search.ingest_boards": {"queue": settings.celery_ingest_queue},
+    "search.score_postings": {"queue": settings.celery_scoring_queue},
+    "search.build_digests": {"queue": settings.celery_digest_queue},
+    "matching.rescore_profile": {"queue": settings.celery_scoring_queue},
+}
+
 
 def run() -> None:  # pragma: no cover - convenience entrypoint
-    celery_app.worker_main(["worker", "-l", "INFO"])
+    queues = ["celery", settings.celery_ingest_queue, settings.celery_scoring_queue, settings.celery_digest_queue]
+    celery_app.worker_main(["worker", "-l", "INFO", "-Q", ",".join(queues)])
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import redis
+from loguru import logger
+
+from apps.api.config import settings
+
+LOCK_PREFIX = "vanta:lock:"
+ONCE_PREFIX = "vanta:once:"
+
+# Delete a lock only if it still holds our token, so an expired lock that
+# another worker has since taken is left alone.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class TaskGuard:
+    """Per-entity locks and idempotency keys for Celery tasks.
+
+    Backed by Redis so every worker process sees the same keys; without a Redis
+    client (local development, tests) keys live in this process only. Redis
+    errors are logged and the guard fails open: a task may then repeat work,
+    but it is never blocked by a Redis outage.
+    """
+
+    def __init__(self, redis_client: redis.Redis | None = None) -> None:
+        self._redis = redis_client
+        self._keys: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _set_if_absent(self, key: str, value: str, ttl_seconds: int) -> bool:
+        if self._redis is not None:
+            try:
+                return bool(self._redis.set(key, value, nx=True, ex=ttl_seconds))
+            except redis.RedisError as exc:
+                logger.warning("Task guard unavailable", key=key, error=str(exc))
+                return True
+        now = time.monotonic()
+        with self._lock:
+            current = self._keys.get(key)
+            if current is not None and current[1] > now:
+                return False
+            self._keys[key] = (value, now + ttl_seconds)
+            return True
+
+    def _delete_if(self, key: str, value: str) -> None:
+        if self._redis is not None:
+            try:
+                self._redis.eval(_RELEASE_SCRIPT, 1, key, value)
+            except redis.RedisError as exc:
+                logger.warning("Task guard unavailable", key=key, error=str(exc))
+            return
+        with self._lock:
+            current = self._keys.get(key)
+            if current is not None and current[0] == value:
+                del self._keys[key]
+
+    @contextmanager
+    def lock(self, key: str, ttl_seconds: int | None = None) -> Iterator[bool]:
+        """Hold ``key`` exclusively; yields ``False`` when another worker already holds it.
+
+        The lock expires after ``ttl_seconds`` so a crashed worker cannot hold it forever.
+        """
+
+        token = uuid.uuid4().hex
+        full_key = LOCK_PREFIX + key
+        acquired = self._set_if_absent(full_key, token, ttl_seconds or settings.task_lock_ttl_seconds)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._delete_if(full_key, token)
+
+    @contextmanager
+    def once(self, key: str | None, ttl_seconds: int | None = None) -> Iterator[bool]:
+        """Claim idempotency ``key``; yields ``False`` if it was already claimed.
+
+        A claim survives for ``ttl_seconds`` after success so duplicate deliveries
+        are dropped, but is released if the body raises so a retry can run. A
+        ``None`` key is always claimable.
+        """
+
+        if key is None:
+            yield True
+            return
+        token = uuid.uuid4().hex
+        full_key = ONCE_PREFIX + key
+        claimed = self._set_if_absent(full_key, token, ttl_seconds or settings.task_idempotency_ttl_seconds)
+        try:
+            yield claimed
+        except BaseException:
+            if claimed:
+                self._delete_if(full_key, token)
+            raise
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+task_guard = TaskGuard(redis.Redis.from_url(settings.redis_url) if settings.task_guard_redis else None)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import uuid
+
+from loguru import logger
+from sqlalchemy import select
+
+from apps.api.config import settings
+from apps.api.db.session import SessionLocal
+from apps.api.models import Profile
+from apps.api.services import matching
+from apps.workers import guards
+from apps.workers.app import celery_app
+
+
+def enqueue_profile_rescore(profile: Profile) -> None:
+    """Best-effort enqueue of a rescore for ``profile`` at its current version.
+
+    If the enqueue fails, the feed rescores the stale rows it shows once the
+    rescore grace period has passed (see ``matching.awaiting_rescore``).
+    """
+
+    try:
+        rescore_profile.delay(str(profile.user_id), profile.version)
+    except Exception as exc:  # pragma: no cover - network dependency
+        logger.warning(
+            "Failed to enqueue profile rescore", user_id=str(profile.user_id), error=str(exc)
+        )
+
+
+@celery_app.task(name="matching.rescore_profile")
+def rescore_profile(user_id: str, version: int) -> None:
+    """Rescore one user's enrichments after their profile changed to ``version``.
+
+    A message for a version the profile has already moved past is dropped: the
+    edit that bumped it queued its own rescore. Enrichment writes never move a
+    row back to an older version, so overlapping rescores are safe.
+    """
+
+    with guards.task_guard.once(f"matching.rescore:{user_id}:{version}") as first:
+        if not first:
+            logger.info("Skipping duplicate profile rescore", user_id=user_id, version=version)
+            return
+        _rescore_profile(uuid.UUID(user_id), version)
+
+
+def _rescore_profile(user_id: uuid.UUID, version: int) -> None:
+    with SessionLocal() as session:
+        profile = session.scalars(select(Profile).where(Profile.user_id == user_id)).first()
+        if profile is None or profile.version != version:
+            logger.info("Profile rescore superseded", user_id=str(user_id), version=version)
+            return
+        rescored = matching.rescore_profile_enrichments(
+            session, profile, settings.score_chunk_size, settings.active_posting_days
+        )
+        # Postings the edit made relevant have no enrichment yet; score the best
+        # candidates so they can rank in the fit-sorted feed.
+        candidates = matching.ensure_candidate_enrichments(
+            session, user_id, settings.candidate_limit
+        )
+        session.commit()
+    logger.info(
+        "Rescored profile enrichments",
+        user_id=str(user_id),
+        version=version,
+        enrichments=rescored,
+        candidates=len(candidates),
+    )
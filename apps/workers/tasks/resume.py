@@ -3,11 +3,18 @@ from __future__ import annotations
 import uuid
 
 from loguru import logger
+from sqlalchemy.orm import Session
 
 from apps.api.db.session import SessionLocal
-from apps.api.models import ResumeVersion, User
-from apps.api.services import resume_parser, storage
+from apps.api.models import Profile, ResumeVersion, User
+from apps.api.services import matching, profile_cache, resume_parser, storage
+from apps.workers import guards
 from apps.workers.app import celery_app
+from apps.workers.tasks import rescore
+
+
+class _DownloadFailed(Exception):
+    pass
 
 
 def _resolve_storage_key(doc_url: str | None) -> str | None:
@@ -17,6 +24,13 @@ def _resolve_storage_key(doc_url: str | None) -> str | None:
 
 
 def process_resume(resume_id: str) -> None:
+    """Parse a stored resume into sections, keywords and an ATS score.
+
+    Onboarding both enqueues ``resume.parse`` and calls this inline, so the
+    resume is locked while it is parsed and a successful parse of a given
+    upload is recorded; whichever caller comes second returns without work.
+    """
+
     parsed_resume_id: uuid.UUID
     try:
         parsed_resume_id = uuid.UUID(resume_id)
@@ -24,6 +38,15 @@ def process_resume(resume_id: str) -> None:
         logger.warning("Invalid resume id", resume_id=resume_id)
         return
 
+    with guards.task_guard.lock(f"resume:{parsed_resume_id}") as exclusive:
+        if not exclusive:
+            logger.info("Resume already being parsed", resume_id=resume_id)
+            return
+        _process_resume(parsed_resume_id)
+
+
+def _process_resume(parsed_resume_id: uuid.UUID) -> None:
+    resume_id = str(parsed_resume_id)
     with SessionLocal() as session:
         resume: ResumeVersion | None = session.get(ResumeVersion, parsed_resume_id)
         if resume is None:
@@ -36,30 +59,50 @@ def process_resume(resume_id: str) -> None:
             return
 
         try:
-            raw_bytes = storage.download_bytes(storage_key)
-        except Exception as exc:  # pragma: no cover - external service
-            logger.exception("Failed to download resume from storage", resume_id=resume_id, error=str(exc))
+            with guards.task_guard.once(f"resume.parse:{resume_id}:{storage_key}") as first:
+                if not first:
+                    logger.info("Resume already parsed", resume_id=resume_id)
+                    return
+                _parse_into(session, resume, storage_key)
+        except _DownloadFailed:  # pragma: no cover - external service
+            # The claim was released, so a later delivery can try again.
             return
 
-        parsed = resume_parser.parse_resume_bytes(
-            raw_bytes, content_type=resume.content_type, filename=resume.original_filename
-        )
-
-        resume.sections_json = parsed.to_dict()
-        resume.keywords = parsed.skills
-        resume.ats_score = resume_parser.estimate_ats_score(parsed)
-        resume.base_flag = True
-
-        # Mark the owning user as having at least one parsed resume for downstream onboarding steps.
-        if resume.user_id is not None:
-            user = session.get(User, resume.user_id)
-            if user and user.profile:
-                # Populate skills from resume if profile is currently empty.
-                if not user.profile.skills and parsed.skills:
-                    user.profile.skills = parsed.skills
-
-        session.commit()
-        logger.info("Parsed resume successfully", resume_id=resume_id)
+
+def _parse_into(session: Session, resume: ResumeVersion, storage_key: str) -> None:
+    resume_id = str(resume.id)
+    try:
+        raw_bytes = storage.download_bytes(storage_key)
+    except Exception as exc:  # pragma: no cover - external service
+        logger.exception("Failed to download resume from storage", resume_id=resume_id, error=str(exc))
+        raise _DownloadFailed from exc
+
+    parsed = resume_parser.parse_resume_bytes(
+        raw_bytes, content_type=resume.content_type, filename=resume.original_filename
+    )
+
+    resume.sections_json = parsed.to_dict()
+    resume.keywords = parsed.skills
+    resume.ats_score = resume_parser.estimate_ats_score(parsed)
+    resume.base_flag = True
+
+    # Mark the owning user as having at least one parsed resume for downstream onboarding steps.
+    changed_profile: Profile | None = None
+    if resume.user_id is not None:
+        user = session.get(User, resume.user_id)
+        if user and user.profile:
+            profile = user.profile
+            # Populate skills from resume if profile is currently empty.
+            if not profile.skills and parsed.skills:
+                previous_hash = profile_cache.profile_content_hash(profile)
+                profile.skills = parsed.skills
+                if matching.record_profile_change(profile, previous_hash):
+                    changed_profile = profile
+
+    session.commit()
+    if changed_profile is not None:
+        rescore.enqueue_profile_rescore(changed_profile)
+    logger.info("Parsed resume successfully", resume_id=resume_id)
 
 
 @celery_app.task(name="resume.parse")
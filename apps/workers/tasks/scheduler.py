@@ -1,17 +1,78 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from apps.api.db.session import SessionLocal
 from apps.api.models import SearchPref
+from apps.api.services import schedule
 from apps.workers.app import celery_app
 from apps.workers.tasks import search
 
+SCHEDULER_BATCH_SIZE = 500
+
 
 @celery_app.task(name="scheduler.tick")
 def scheduler_tick() -> None:
+    """Enqueue one ingestion run for every user with at least one due search preference.
+
+    Only preferences whose ``next_run_at`` has passed are read, in batches, via
+    the ``next_run_at`` index. Each is stamped with ``last_run_at`` and moved to
+    its next cron fire time, and the batch's users are enqueued before the batch
+    commits, so a tick costs work proportional to what is due, a preference
+    never runs twice for one slot, and a failed enqueue leaves the batch due
+    for the next tick rather than silently skipped.
+    """
+
+    now = datetime.now(UTC)
     with SessionLocal() as session:
-        prefs = session.query(SearchPref).all()
-        for pref in prefs:
-            logger.debug("Queueing search run", user_id=str(pref.user_id), search_pref=str(pref.id))
-            search.run_daily_search.delay(str(pref.user_id))
+        _schedule_unscheduled(session, now)
+        queued: set[str] = set()
+        while True:
+            stmt = (
+                select(SearchPref)
+                .where(SearchPref.next_run_at <= now)
+                .order_by(SearchPref.next_run_at)
+                .limit(SCHEDULER_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            due = session.scalars(stmt).all()
+            if not due:
+                break
+            user_ids: set[str] = set()
+            for pref in due:
+                user_ids.add(str(pref.user_id))
+                pref.last_run_at = now
+                schedule.reschedule(pref, now)
+            # One run covers every preference of a user, so users already queued this tick are skipped.
+            user_ids -= queued
+            if user_ids:
+                logger.debug("Queueing board ingestion", users=len(user_ids))
+                search.run_board_ingestion.delay(sorted(user_ids))
+                queued |= user_ids
+            session.commit()
+
+
+def _schedule_unscheduled(session: Session, now: datetime) -> None:
+    """Give preferences created before ``next_run_at`` existed their next fire time.
+
+    The fire time follows the last run (or creation), so a preference that has
+    missed its slot becomes due on this tick and runs once, not once per missed slot.
+    Oldest preferences go first; ones whose schedule cannot be interpreted are
+    parked at ``schedule.UNSCHEDULABLE`` and so do not come back in later batches.
+    """
+
+    stmt = (
+        select(SearchPref)
+        .where(SearchPref.next_run_at.is_(None))
+        .order_by(SearchPref.created_at)
+        .limit(SCHEDULER_BATCH_SIZE)
+    )
+    pending = session.scalars(stmt).all()
+    for pref in pending:
+        schedule.reschedule(pref, pref.last_run_at or pref.created_at or now)
+    if pending:
+        session.commit()
@@ -1,36 +1,248 @@
 from __future__ import annotations
 
 import uuid
+from contextlib import ExitStack, closing
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
 
+from celery import chord
 from loguru import logger
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 
+from apps.api.config import settings
 from apps.api.db.session import SessionLocal
 from apps.api.models import JobPosting, SearchPref
-from apps.api.services import digest, ingestion, matching, providers
+from apps.api.models.enums import ProviderEnum
+from apps.api.services import digest, ingestion, matching, providers, response_cache
 
+from apps.workers import guards
 from apps.workers.app import celery_app
 
 
 @celery_app.task(name="search.run")
-def run_daily_search(user_id: str) -> None:
+def run_daily_search(user_id: str, idempotency_key: str | None = None) -> None:
+    """Fetch, ingest and score every board one user follows.
+
+    Runs at most once per ``idempotency_key`` (by default the Celery delivery
+    id, so redelivered messages are dropped) and never concurrently for the same
+    user.
+    """
+
+    key = idempotency_key or run_daily_search.request.id
+    with guards.task_guard.once(key and f"search.run:{key}") as first:
+        if not first:
+            logger.info("Skipping duplicate daily search", user_id=user_id, idempotency_key=key)
+            return
+        with guards.task_guard.lock(f"search:user:{user_id}") as exclusive:
+            if not exclusive:
+                logger.info("Daily search already running", user_id=user_id)
+                return
+            _run_daily_search(user_id)
+
+
+def _run_daily_search(user_id: str) -> None:
     logger.info("Running daily search", user_id=user_id)
+    committed = _Committed()
+    try:
+        with SessionLocal() as session:
+            prefs = _load_search_preferences(session, user_id)
+            boards = [board for pref in prefs for board in _followed_boards(pref.filters)]
+            with closing(providers.stream_boards(boards)) as streamed:
+                for (source, _), pages in streamed:
+                    _ingest_board(session, source, pages, on_chunk=committed.add)
+            logger.info("Ingestion completed", user_id=user_id, inserted=committed.inserted)
+    finally:
+        # Score whatever was committed, even if a later board or page failed.
+        _dispatch_scoring([([user_id], committed.changed)], [user_id] if committed.inserted else [])
+
+
+@celery_app.task(name="search.ingest_boards")
+def run_board_ingestion(user_ids: list[str] | None = None, idempotency_key: str | None = None) -> None:
+    """Board-centric ingestion: fetch and upsert each followed board once per cycle.
+
+    Distinct boards of every registered provider are collected across the search
+    preferences of ``user_ids`` (every user when omitted). They are fetched
+    concurrently over one pooled client and each is streamed page by page into
+    the upsert (see ``providers.stream_boards``), so only a few pages of raw
+    jobs per board are held in memory. Boards that fail to fetch are logged and
+    skipped. Scoring of the new or changed postings for every subscriber of
+    each board, including users outside ``user_ids``, is then fanned out across
+    the scoring queue, with digests built once it completes. Fetches are
+    conditional, so boards unchanged since the last cycle cost one 304 (or one
+    identical body) per page and nothing else.
+
+    Duplicate deliveries are dropped by idempotency key, and each board is
+    locked while it is ingested; boards another worker is already ingesting are
+    skipped.
+    """
+
+    key = idempotency_key or run_board_ingestion.request.id
+    with guards.task_guard.once(key and f"search.ingest_boards:{key}") as first:
+        if not first:
+            logger.info("Skipping duplicate board ingestion", idempotency_key=key)
+            return
+        _run_board_ingestion(user_ids)
+
+
+def _run_board_ingestion(user_ids: list[str] | None) -> None:
+    work: list[tuple[list[str], list[str]]] = []
+    digest_users: set[str] = set()
+    try:
+        with SessionLocal() as session, ExitStack() as held:
+            subscriptions = _board_subscriptions(session, user_ids)
+            for source, board_token in list(subscriptions):
+                if not held.enter_context(guards.task_guard.lock(f"search:board:{source}:{board_token}")):
+                    logger.info("Board already being ingested", provider=source, board_token=board_token)
+                    del subscriptions[(source, board_token)]
+            if not subscriptions:
+                return
+
+            # Boards are fetched concurrently and handed over page by page; boards whose
+            # cached validators prove them unchanged are never handed over at all.
+            streamed = providers.stream_boards(subscriptions, cache=response_cache.provider_responses)
+            for board, pages in held.enter_context(closing(streamed)):
+                source, board_token = board
+                committed = _Committed()
+                try:
+                    _ingest_board(session, source, pages, on_chunk=committed.add)
+                except providers.ProviderError as exc:
+                    logger.warning("Board fetch failed", provider=source, board_token=board_token, error=str(exc))
+                except Exception:
+                    # Forget the validators so the next cycle refetches and retries this board.
+                    board_url = providers.get_provider(source).board_url(board_token)
+                    response_cache.provider_responses.forget_board(board_url)
+                    raise
+                finally:
+                    # Chunks committed before a page failed are scored too: the next
+                    # cycle sees them as unchanged and would never score them.
+                    if committed.changed:
+                        work.append((sorted(subscriptions[board]), committed.changed))
+                    if committed.inserted:
+                        digest_users.update(subscriptions[board])
+
+            logger.info(
+                "Board ingestion completed", boards=len(subscriptions), changed=len(work), digests=len(digest_users)
+            )
+    finally:
+        # Boards ingested before a failure are committed and will look unchanged next
+        # cycle, so their scoring is dispatched even when a later board raises.
+        _dispatch_scoring(work, sorted(digest_users))
+
+
+@celery_app.task(name="search.score_postings")
+def score_postings(user_ids: list[str], posting_ids: list[str]) -> int:
+    """Score one chunk of postings for a set of users; a unit of the scoring fan-out."""
+
     with SessionLocal() as session:
-        prefs = _load_search_preferences(session, user_id)
-        total_inserted = 0
-        for pref in prefs:
-            board_token = pref.filters.get("greenhouse_board_token")
-            if not board_token:
-                continue
-            postings = providers.fetch_greenhouse_postings(board_token)
-            normalized = [providers.normalize_greenhouse_posting(posting) for posting in postings]
-            result = ingestion.upsert_job_postings(session, normalized)
-            total_inserted += result.inserted
-            for posting in result.postings:
-                matching.update_posting_enrichment(session, user_id, posting)
-        if total_inserted:
+        stmt = (
+            select(JobPosting)
+            .where(JobPosting.id.in_([uuid.UUID(posting_id) for posting_id in posting_ids]))
+            .options(selectinload(JobPosting.company))
+        )
+        postings = list(session.scalars(stmt))
+        _score_for_users(session, user_ids, postings)
+    return len(postings)
+
+
+@celery_app.task(name="search.build_digests")
+def build_digests(_scored: list[int] | None, user_ids: list[str]) -> None:
+    """Chord callback: build each user's digest once all of their scoring has finished."""
+
+    with SessionLocal() as session:
+        for user_id in user_ids:
             digest.build_daily_digest(session, user_id)
-        logger.info("Ingestion completed", user_id=user_id, inserted=total_inserted)
+
+
+def _dispatch_scoring(work: Iterable[tuple[list[str], list[str]]], digest_user_ids: list[str]) -> None:
+    """Fan ``(user ids, posting ids)`` work out as ``score_postings`` chunks, then digest.
+
+    Posting ids are split into chunks of ``score_chunk_size`` so one large board
+    spreads across every scoring worker. The chunks run as a chord whose
+    callback builds the digests for ``digest_user_ids``.
+    """
+
+    chunk_size = settings.score_chunk_size
+    header = [
+        score_postings.s(user_ids, posting_ids[start : start + chunk_size])
+        for user_ids, posting_ids in work
+        if user_ids
+        for start in range(0, len(posting_ids), chunk_size)
+    ]
+    if header:
+        chord(header)(build_digests.s(digest_user_ids))
+    elif digest_user_ids:
+        build_digests.delay(None, digest_user_ids)
+
+
+@dataclass
+class _Committed:
+    """Postings committed so far, recorded chunk by chunk as ``upsert_job_postings_in_chunks`` commits."""
+
+    changed: list[str] = field(default_factory=list)
+    inserted: int = 0
+
+    def add(self, result: ingestion.UpsertResult) -> None:
+        self.changed.extend(str(posting_id) for posting_id in [*result.inserted_ids, *result.updated_ids])
+        self.inserted += result.inserted
+
+
+def _ingest_board(
+    session: Session,
+    source: ProviderEnum,
+    raw_pages: Iterable[list[dict[str, Any]]],
+    on_chunk: Callable[[ingestion.UpsertResult], None] | None = None,
+) -> ingestion.UpsertResult:
+    """Normalize and upsert a board page by page, one committed chunk at a time."""
+
+    adapter = providers.get_provider(source)
+    normalized = (adapter.normalize(posting) for page in raw_pages for posting in page)
+    return ingestion.upsert_job_postings_in_chunks(session, normalized, on_chunk=on_chunk)
+
+
+def _score_for_users(session: Session, user_ids: Iterable[str], postings: list[JobPosting]) -> None:
+    if not postings:
+        return
+    # Only each user's candidates are scored up front; the feed scores the rest on view.
+    scored = matching.rescore_users(
+        session, [uuid.UUID(str(user_id)) for user_id in user_ids], postings, candidates_only=True
+    )
+    session.commit()
+    logger.debug("Scored postings", postings=len(postings), enrichments=scored)
+
+
+def _followed_boards(filters: dict[str, Any] | None) -> list[providers.BoardKey]:
+    """The ``(provider, board token)`` pairs named in a search preference's filters."""
+
+    filters = filters or {}
+    return [
+        (adapter.source, filters[adapter.filter_key])
+        for adapter in providers.registered_providers()
+        if filters.get(adapter.filter_key)
+    ]
+
+
+def _board_subscriptions(
+    session: Session, user_ids: Iterable[str] | None = None
+) -> dict[providers.BoardKey, set[str]]:
+    """Map each board followed by ``user_ids`` (every user when omitted) to all of its subscribers.
+
+    ``user_ids`` only chooses the boards: every user following a chosen board is
+    a subscriber, so users on other schedules are scored against its new
+    postings too rather than finding the board unchanged on their own run.
+    """
+
+    stmt = select(SearchPref.user_id, SearchPref.filters).where(SearchPref.filters.isnot(None))
+    wanted = None if user_ids is None else {str(user_id) for user_id in user_ids}
+
+    subscriptions: dict[providers.BoardKey, set[str]] = {}
+    chosen: set[providers.BoardKey] = set()
+    for user_id, filters in session.execute(stmt):
+        for board in _followed_boards(filters):
+            subscriptions.setdefault(board, set()).add(str(user_id))
+            if wanted is None or str(user_id) in wanted:
+                chosen.add(board)
+    return {board: subscribers for board, subscribers in subscriptions.items() if board in chosen}
 
 
 def _load_search_preferences(session: Session, user_id: str) -> list[SearchPref]:
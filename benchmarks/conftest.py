@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from apps.api.services import synthetic
+from benchmarks import run
+
+# Sizes for the end-to-end runs; override with e.g. BENCH_POSTINGS=5000.
+BENCH_POSTINGS = int(os.environ.get("BENCH_POSTINGS", "1000"))
+BENCH_PROFILES = int(os.environ.get("BENCH_PROFILES", "20"))
+
+
+@pytest.fixture(scope="session")
+def session_factory(tmp_path_factory: pytest.TempPathFactory) -> sessionmaker[Session]:
+    path = tmp_path_factory.mktemp("bench") / "bench.db"
+    return run.create_session_factory(f"sqlite+pysqlite:///{path}")
+
+
+@pytest.fixture(scope="session")
+def seeded(session_factory: sessionmaker[Session]) -> synthetic.SeededData:
+    with session_factory() as session:
+        return synthetic.seed_database(session, BENCH_POSTINGS, BENCH_PROFILES)
+
+
+@pytest.fixture()
+def bench_session(session_factory: sessionmaker[Session]) -> Iterator[Session]:
+    with session_factory() as session:
+        yield session
@@ -0,0 +1,171 @@
+"""End-to-end matching benchmark: score N synthetic postings for M users.
+
+Usage::
+
+    python -m benchmarks.run --postings 5000 --profiles 50 --mode bulk
+
+Seeds a fresh SQLite database (``--database-url``) with deterministic data,
+then times one scoring path and reports postings/sec, user x posting pairs/sec
+and the process's peak RSS. Run one mode per invocation so the RSS figure
+belongs to that mode alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+
+from apps.api.config import settings
+from apps.api.db.base import Base
+from apps.api.models import JobPosting, PostingEnrichment
+from apps.api.services import matching, synthetic
+
+DEFAULT_DATABASE_URL = "sqlite+pysqlite:///./benchmarks.db"
+
+
+@dataclass
+class RunStats:
+    mode: str
+    postings: int
+    users: int
+    seconds: float
+    postings_per_second: float
+    pairs_per_second: float
+    peak_rss_mb: float
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MiB."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _load_postings(session: Session, posting_ids: list[uuid.UUID]) -> list[JobPosting]:
+    stmt = (
+        select(JobPosting)
+        .where(JobPosting.id.in_(posting_ids))
+        .options(selectinload(JobPosting.company))
+    )
+    return list(session.scalars(stmt))
+
+
+def _score_bulk(session: Session, user_ids: list[uuid.UUID], postings: list[JobPosting]) -> None:
+    # The search.score_postings worker path.
+    matching.rescore_users(session, user_ids, postings)
+    session.commit()
+
+
+def _score_ensure(session: Session, user_ids: list[uuid.UUID], postings: list[JobPosting]) -> None:
+    # One user at a time, as the feed does.
+    for user_id in user_ids:
+        matching.ensure_enrichments(session, user_id, postings)
+        session.commit()
+
+
+def _score_per_pair(
+    session: Session, user_ids: list[uuid.UUID], postings: list[JobPosting]
+) -> None:
+    # One profile read, enrichment read and commit per pair.
+    for user_id in user_ids:
+        for posting in postings:
+            matching.update_posting_enrichment(session, str(user_id), posting)
+
+
+MODES: dict[str, Callable[[Session, list[uuid.UUID], list[JobPosting]], None]] = {
+    "bulk": _score_bulk,
+    "ensure": _score_ensure,
+    "per-pair": _score_per_pair,
+}
+
+
+def reset_enrichments(session: Session) -> None:
+    session.execute(delete(PostingEnrichment))
+    session.commit()
+
+
+def score_users(
+    session: Session,
+    data: synthetic.SeededData,
+    mode: str = "bulk",
+    chunk_size: int | None = None,
+) -> RunStats:
+    """Score every seeded posting for every seeded user with ``mode``, in worker-sized chunks."""
+
+    score = MODES[mode]
+    chunk_size = chunk_size or settings.score_chunk_size
+    started = time.perf_counter()
+    for start in range(0, len(data.posting_ids), chunk_size):
+        postings = _load_postings(session, data.posting_ids[start : start + chunk_size])
+        score(session, data.user_ids, postings)
+        session.expunge_all()
+    seconds = time.perf_counter() - started
+    postings = len(data.posting_ids)
+    users = len(data.user_ids)
+    return RunStats(
+        mode=mode,
+        postings=postings,
+        users=users,
+        seconds=seconds,
+        postings_per_second=postings / seconds if seconds else 0.0,
+        pairs_per_second=postings * users / seconds if seconds else 0.0,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def create_session_factory(database_url: str) -> sessionmaker[Session]:
+    """Engine and schema for a throwaway benchmark database; an existing SQLite file is replaced."""
+
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        raise SystemExit("Benchmarks reset their database; only SQLite URLs are accepted")
+    if url.database and url.database != ":memory:":
+        Path(url.database).unlink(missing_ok=True)
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=2000)
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--mode", choices=sorted(MODES), default="bulk")
+    parser.add_argument("--chunk-size", type=int, default=settings.score_chunk_size)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--json", action="store_true", help="print the result as one JSON object")
+    args = parser.parse_args(argv)
+
+    session_factory = create_session_factory(args.database_url)
+    with session_factory() as session:
+        seeding_started = time.perf_counter()
+        data = synthetic.seed_database(session, args.postings, args.profiles, seed=args.seed)
+        seeding_seconds = time.perf_counter() - seeding_started
+        stats = score_users(session, data, args.mode, args.chunk_size)
+
+    if args.json:
+        print(json.dumps(asdict(stats)))
+        return
+    print(f"seeded {stats.postings} postings / {stats.users} users in {seeding_seconds:.1f}s")
+    print(f"mode           {stats.mode}")
+    print(f"elapsed        {stats.seconds:.2f}s")
+    print(f"postings/sec   {stats.postings_per_second:,.1f}")
+    print(f"pairs/sec      {stats.pairs_per_second:,.1f}")
+    print(f"peak RSS       {stats.peak_rss_mb:,.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
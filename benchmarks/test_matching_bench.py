@@ -0,0 +1,97 @@
+"""Microbenchmarks for each matching component and end-to-end scoring runs.
+
+Run with ``pytest benchmarks``; compare runs with ``--benchmark-autosave`` /
+``--benchmark-compare``.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import Session
+
+from apps.api.services import matching, profile_cache, synthetic
+from benchmarks import run
+
+BATCH = 200
+BLOCK_PROFILES = 20
+
+
+@pytest.fixture(scope="module")
+def companies():
+    return synthetic.make_companies(10)
+
+
+@pytest.fixture(scope="module")
+def postings(companies):
+    return synthetic.make_postings(BATCH, companies=companies)
+
+
+@pytest.fixture(scope="module")
+def profiles():
+    return synthetic.make_profiles(BLOCK_PROFILES)
+
+
+def test_tokenize(benchmark, postings):
+    text = postings[0].jd_clean
+    tokens = benchmark(matching._tokenize, text)
+    assert tokens
+
+
+def test_build_posting_vector(benchmark, postings):
+    vector = benchmark(matching._build_posting_vector, postings[0])
+    assert vector
+
+
+def test_build_profile_vector_uncached(benchmark, profiles):
+    def build():
+        profile_cache.profile_vectors.clear()
+        return matching._build_profile_vector(profiles[0])
+
+    assert benchmark(build)
+
+
+def test_compute_fit_score(benchmark, profiles, postings):
+    result = benchmark(matching.compute_fit_score, profiles[0], postings[0])
+    assert 0 <= result.score <= 100
+
+
+def test_input_fingerprint(benchmark, profiles, postings):
+    assert len(benchmark(matching.input_fingerprint, profiles[0], postings[0])) == 64
+
+
+def test_score_postings_batch(benchmark, profiles, postings):
+    results = benchmark(matching.score_postings, profiles[0], postings)
+    assert len(results) == BATCH
+
+
+def test_score_block(benchmark, profiles, postings):
+    results = benchmark(matching.score_block, profiles, postings)
+    assert len(results) == BLOCK_PROFILES
+
+
+@pytest.mark.parametrize("mode", ["bulk", "ensure"])
+def test_end_to_end_scoring(benchmark, mode: str, bench_session: Session, seeded):
+    """Score every seeded posting for every seeded user; reports throughput and peak RSS."""
+
+    stats = benchmark.pedantic(
+        run.score_users,
+        args=(bench_session, seeded, mode),
+        setup=lambda: run.reset_enrichments(bench_session),
+        rounds=3,
+    )
+    benchmark.extra_info.update(
+        postings=stats.postings,
+        users=stats.users,
+        postings_per_second=round(stats.postings_per_second, 1),
+        pairs_per_second=round(stats.pairs_per_second, 1),
+        peak_rss_mb=round(stats.peak_rss_mb, 1),
+    )
+
+
+def test_update_posting_enrichment(benchmark, bench_session: Session, seeded):
+    """The legacy one-pair-at-a-time path: profile read, enrichment read and commit."""
+
+    posting = run._load_postings(bench_session, seeded.posting_ids[:1])[0]
+    user_id = str(seeded.user_ids[0])
+    enrichment = benchmark(matching.update_posting_enrichment, bench_session, user_id, posting)
+    assert enrichment.fit_score >= 0
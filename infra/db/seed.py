@@ -0,0 +1,275 @@
+"""Seed the configured database with synthetic users, postings and pipeline data.
+
+Usage, from the repository root (``make seed`` runs the baseline in Docker)::
+
+    python -m infra.db.seed                                  # baseline: 2,000 postings, 100 users
+    python -m infra.db.seed --postings 100000 --users 10000  # load-test scale
+
+Writes to ``POSTGRES_URL``; the schema must exist (``alembic upgrade head``,
+or ``--create-tables`` for a scratch SQLite file). Users, profiles and postings
+come from ``apps.api.services.synthetic``; each user then gets enrichments scored
+with the real matcher, plus applications, notes, tasks and notifications.
+Output is deterministic for a given ``--seed``, and a seed that is already
+present is refused rather than duplicated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Iterable
+
+from loguru import logger
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, selectinload
+
+from apps.api.db.base import Base
+from apps.api.db.session import SessionLocal, engine
+from apps.api.models import (
+    Application,
+    ApplicationNote,
+    JobPosting,
+    Notification,
+    Task,
+    User,
+)
+from apps.api.models.enums import PriorityEnum, StageEnum, TaskTypeEnum
+from apps.api.services import matching, synthetic
+
+INSERT_BATCH_SIZE = 5000
+# Users scored together against one shared sample of postings.
+ENRICHMENT_USER_BLOCK = 100
+HISTORY_DAYS = 60
+
+STAGE_WEIGHTS = {
+    StageEnum.PROSPECT: 30,
+    StageEnum.APPLIED: 30,
+    StageEnum.SCREEN: 15,
+    StageEnum.INTERVIEW: 12,
+    StageEnum.OFFER: 3,
+    StageEnum.REJECTED: 8,
+    StageEnum.ACCEPTED: 2,
+}
+NOTIFICATION_KINDS = ["daily_digest", "task_due", "application_update"]
+
+
+def _insert(session: Session, model: type[Base], rows: list[dict[str, object]]) -> None:
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        session.execute(insert(model.__table__), rows[start : start + INSERT_BATCH_SIZE])
+    session.commit()
+
+
+def _moment(rng: random.Random, now: datetime, days: int = HISTORY_DAYS) -> datetime:
+    return now - timedelta(seconds=rng.randrange(days * 86400))
+
+
+def _seed_enrichments(
+    session: Session,
+    user_ids: list[uuid.UUID],
+    posting_ids: list[uuid.UUID],
+    per_user: int,
+    rng: random.Random,
+) -> dict[uuid.UUID, list[uuid.UUID]]:
+    """Score each block of users against a shared random sample of postings."""
+
+    scored: dict[uuid.UUID, list[uuid.UUID]] = {}
+    per_user = min(per_user, len(posting_ids))
+    for start in range(0, len(user_ids), ENRICHMENT_USER_BLOCK):
+        block = user_ids[start : start + ENRICHMENT_USER_BLOCK]
+        sample = rng.sample(posting_ids, per_user)
+        stmt = (
+            select(JobPosting)
+            .where(JobPosting.id.in_(sample))
+            .options(selectinload(JobPosting.company))
+        )
+        postings = list(session.scalars(stmt))
+        matching.rescore_users(session, block, postings)
+        session.commit()
+        session.expunge_all()
+        scored.update((user_id, sample) for user_id in block)
+    return scored
+
+
+def _application_rows(
+    scored: dict[uuid.UUID, list[uuid.UUID]], per_user: int, rng: random.Random, now: datetime
+) -> list[dict[str, object]]:
+    stages = list(STAGE_WEIGHTS)
+    weights = list(STAGE_WEIGHTS.values())
+    rows = []
+    for user_id, posting_ids in scored.items():
+        for posting_id in rng.sample(posting_ids, min(per_user, len(posting_ids))):
+            created_at = _moment(rng, now)
+            stage = rng.choices(stages, weights)[0]
+            rows.append(
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                    "user_id": user_id,
+                    "job_posting_id": posting_id,
+                    "stage": stage,
+                    "source_label": "seed",
+                    "applied_at": None
+                    if stage is StageEnum.PROSPECT
+                    else created_at + timedelta(days=1),
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+            )
+    return rows
+
+
+def _note_rows(
+    applications: list[dict[str, object]], rng: random.Random, now: datetime
+) -> list[dict[str, object]]:
+    rows = []
+    for application in applications:
+        for _ in range(rng.choice([0, 0, 1, 1, 2, 3])):
+            rows.append(
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                    "application_id": application["id"],
+                    "user_id": application["user_id"],
+                    "body": "Follow up with the recruiter about next steps.",
+                    "created_at": _moment(rng, now),
+                }
+            )
+    return rows
+
+
+def _task_rows(
+    user_ids: Iterable[uuid.UUID],
+    applications: list[dict[str, object]],
+    per_user: int,
+    rng: random.Random,
+    now: datetime,
+) -> list[dict[str, object]]:
+    by_user: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for application in applications:
+        by_user.setdefault(application["user_id"], []).append(application["id"])
+    rows = []
+    for user_id in user_ids:
+        owned = by_user.get(user_id, [])
+        for index in range(per_user):
+            nudge_type = rng.choice(list(TaskTypeEnum))
+            rows.append(
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                    "user_id": user_id,
+                    "application_id": rng.choice(owned) if owned and rng.random() < 0.6 else None,
+                    "title": f"{nudge_type.value.replace('_', ' ').capitalize()} #{index + 1}",
+                    "nudge_type": nudge_type,
+                    "priority": rng.choice(list(PriorityEnum)),
+                    "due_at": now + timedelta(hours=rng.randint(-14 * 24, 14 * 24)),
+                    "completed_at": _moment(rng, now, 14) if rng.random() < 0.3 else None,
+                    "created_at": _moment(rng, now),
+                    "updated_at": now,
+                }
+            )
+    return rows
+
+
+def _notification_rows(
+    user_ids: Iterable[uuid.UUID], per_user: int, rng: random.Random, now: datetime
+) -> list[dict[str, object]]:
+    rows = []
+    for user_id in user_ids:
+        for index in range(per_user):
+            kind = NOTIFICATION_KINDS[index % len(NOTIFICATION_KINDS)]
+            created_at = _moment(rng, now, 30)
+            payload: dict[str, object] = (
+                {"generated_at": created_at.isoformat(), "items": []}
+                if kind == "daily_digest"
+                else {"message": f"Synthetic {kind.replace('_', ' ')}"}
+            )
+            rows.append(
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                    "user_id": user_id,
+                    "kind": kind,
+                    "payload": payload,
+                    "read_at": created_at + timedelta(hours=1) if rng.random() < 0.5 else None,
+                    "created_at": created_at,
+                }
+            )
+    return rows
+
+
+def seed(
+    session: Session,
+    postings: int,
+    users: int,
+    enrichments_per_user: int,
+    applications_per_user: int,
+    tasks_per_user: int,
+    notifications_per_user: int,
+    seed: int = 0,
+) -> dict[str, int]:
+    """Write the whole dataset and return row counts per table."""
+
+    rng = random.Random(f"seed:{seed}")
+    now = datetime.now(UTC)
+    counts: dict[str, int] = {}
+
+    started = time.perf_counter()
+    data = synthetic.seed_database(session, postings, users, seed=seed)
+    counts.update(users=len(data.user_ids), job_postings=len(data.posting_ids))
+    logger.info("Seeded users and postings", seconds=round(time.perf_counter() - started, 1))
+
+    started = time.perf_counter()
+    scored = _seed_enrichments(session, data.user_ids, data.posting_ids, enrichments_per_user, rng)
+    counts["posting_enrichments"] = sum(len(sample) for sample in scored.values())
+    logger.info("Seeded enrichments", seconds=round(time.perf_counter() - started, 1))
+
+    applications = _application_rows(scored, applications_per_user, rng, now)
+    notes = _note_rows(applications, rng, now)
+    tasks = _task_rows(data.user_ids, applications, tasks_per_user, rng, now)
+    notifications = _notification_rows(data.user_ids, notifications_per_user, rng, now)
+    for model, rows in [
+        (Application, applications),
+        (ApplicationNote, notes),
+        (Task, tasks),
+        (Notification, notifications),
+    ]:
+        _insert(session, model, rows)
+        counts[model.__tablename__] = len(rows)
+    return counts
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Seed the database with synthetic data.")
+    parser.add_argument("--postings", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--enrichments-per-user", type=int, default=50)
+    parser.add_argument("--applications-per-user", type=int, default=5)
+    parser.add_argument("--tasks-per-user", type=int, default=8)
+    parser.add_argument("--notifications-per-user", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--create-tables", action="store_true", help="create missing tables first (scratch DBs)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.create_tables:
+        Base.metadata.create_all(engine)
+    with SessionLocal() as session:
+        marker = synthetic.make_profiles(1, args.seed)[0].user.email
+        if session.scalar(select(User.id).where(User.email == marker)) is not None:
+            raise SystemExit(f"Seed {args.seed} is already present; pass a different --seed")
+        counts = seed(
+            session,
+            postings=args.postings,
+            users=args.users,
+            enrichments_per_user=args.enrichments_per_user,
+            applications_per_user=args.applications_per_user,
+            tasks_per_user=args.tasks_per_user,
+            notifications_per_user=args.notifications_per_user,
+            seed=args.seed,
+        )
+    for table, count in counts.items():
+        print(f"{table:<22} {count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
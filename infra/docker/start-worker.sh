@@ -7,5 +7,5 @@ if [ -f poetry.lock ]; then
 fi
 
 cd /workspace/apps/workers
-poetry run celery -A apps.workers.app:celery_app worker -l INFO
+poetry run celery -A apps.workers.app:celery_app worker -l INFO -Q "${CELERY_QUEUES:-celery,ingest,scoring,digest}"
 
@@ -0,0 +1,214 @@
+"""Replay a realistic mix of API reads and report latency percentiles per endpoint.
+
+Usage, from the repository root against a seeded database (see ``infra/db/seed.py``)::
+
+    python -m infra.ops.loadtest --base-url http://localhost:8000 --duration 60 --concurrency 32
+    python -m infra.ops.loadtest --in-process --duration 30   # no server; calls the ASGI app directly
+
+User ids are sampled from the database configured by ``POSTGRES_URL``, which
+must be the one the API under test reads. Each virtual user repeatedly picks a
+random seeded user and a weighted scenario, and every request is timed from
+send to fully read body. The report lists requests, errors, throughput and
+p50/p95/p99/max latency per endpoint.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+import httpx
+from sqlalchemy import select
+
+from apps.api.db.session import SessionLocal
+from apps.api.models import User
+
+# Relative weight of each scenario in the replayed mix.
+SCENARIOS = {
+    "feed": 35,
+    "feed_by_fit": 10,
+    "feed_next_page": 10,
+    "applications": 20,
+    "tasks": 15,
+    "notifications": 10,
+}
+
+
+@dataclass
+class EndpointStats:
+    endpoint: str
+    requests: int
+    errors: int
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def get(
+        self, client: httpx.AsyncClient, endpoint: str, url: str, user_id: uuid.UUID, **params
+    ) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await client.get(url, params=params, headers={"X-User-Id": str(user_id)})
+        except httpx.HTTPError:
+            response = None
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        if response is None or response.status_code >= 400:
+            self.errors[endpoint] += 1
+            return None
+        return response
+
+    def report(self, seconds: float) -> list[EndpointStats]:
+        return [
+            EndpointStats(
+                endpoint=endpoint,
+                requests=len(samples),
+                errors=self.errors[endpoint],
+                requests_per_second=len(samples) / seconds,
+                p50_ms=percentile(samples, 50) * 1000,
+                p95_ms=percentile(samples, 95) * 1000,
+                p99_ms=percentile(samples, 99) * 1000,
+                max_ms=max(samples) * 1000,
+            )
+            for endpoint, samples in sorted(self.latencies.items())
+        ]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, recorder: Recorder, scenario: str, user_id: uuid.UUID
+) -> None:
+    if scenario == "feed":
+        await recorder.get(client, "GET /feed/jobs", "/feed/jobs", user_id, limit=20)
+    elif scenario == "feed_by_fit":
+        await recorder.get(
+            client, "GET /feed/jobs?sort=fit", "/feed/jobs", user_id, sort="fit", limit=20
+        )
+    elif scenario == "feed_next_page":
+        first = await recorder.get(client, "GET /feed/jobs", "/feed/jobs", user_id, limit=20)
+        cursor = first.json().get("next_cursor") if first is not None else None
+        if cursor:
+            await recorder.get(
+                client, "GET /feed/jobs?cursor", "/feed/jobs", user_id, cursor=cursor, limit=20
+            )
+    else:
+        await recorder.get(client, f"GET /{scenario}/", f"/{scenario}/", user_id)
+
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    user_ids: list[uuid.UUID],
+    deadline: float,
+    rng: random.Random,
+) -> None:
+    scenarios = list(SCENARIOS)
+    weights = list(SCENARIOS.values())
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(scenarios, weights)[0]
+        await run_scenario(client, recorder, scenario, rng.choice(user_ids))
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    user_ids: list[uuid.UUID],
+    duration: float,
+    concurrency: int,
+    seed: int = 0,
+) -> list[EndpointStats]:
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(
+        *(
+            virtual_user(client, recorder, user_ids, deadline, random.Random(f"{seed}:{index}"))
+            for index in range(concurrency)
+        )
+    )
+    return recorder.report(time.perf_counter() - started)
+
+
+def load_user_ids(limit: int) -> list[uuid.UUID]:
+    with SessionLocal() as session:
+        return list(session.scalars(select(User.id).limit(limit)))
+
+
+def print_report(stats: list[EndpointStats]) -> None:
+    header = f"{'endpoint':<26}{'reqs':>8}{'errors':>8}{'req/s':>9}"
+    header += f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    print(header)
+    for row in stats:
+        print(
+            f"{row.endpoint:<26}{row.requests:>8}{row.errors:>8}{row.requests_per_second:>9.1f}"
+            f"{row.p50_ms:>9.1f}{row.p95_ms:>9.1f}{row.p99_ms:>9.1f}{row.max_ms:>9.1f}"
+        )
+    total = sum(row.requests for row in stats)
+    throughput = sum(row.requests_per_second for row in stats)
+    print(f"{'total':<26}{total:>8}{sum(row.errors for row in stats):>8}{throughput:>9.1f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay a mix of API reads and report latency.")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--in-process", action="store_true", help="call the ASGI app directly instead of over HTTP"
+    )
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument("--concurrency", type=int, default=16, help="virtual users")
+    parser.add_argument("--users", type=int, default=1000, help="seeded users to sample from")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    user_ids = load_user_ids(args.users)
+    if not user_ids:
+        raise SystemExit("No users found; seed the database first (python -m infra.db.seed)")
+
+    if args.in_process:
+        from apps.api.main import app
+
+        # Unhandled exceptions become 500s and are counted, as they would be over HTTP.
+        transport: httpx.AsyncBaseTransport = httpx.ASGITransport(
+            app=app, raise_app_exceptions=False
+        )
+        base_url = "http://loadtest"
+    else:
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=args.concurrency))
+        base_url = args.base_url
+
+    async def _run() -> list[EndpointStats]:
+        async with httpx.AsyncClient(
+            transport=transport, base_url=base_url, timeout=30.0
+        ) as client:
+            return await run_load(client, user_ids, args.duration, args.concurrency, args.seed)
+
+    stats = asyncio.run(_run())
+    if args.json:
+        print(json.dumps([asdict(row) for row in stats]))
+    else:
+        print_report(stats)
+
+
+if __name__ == "__main__":
+    main()